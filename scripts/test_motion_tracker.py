@@ -36,14 +36,14 @@ def simulate_movement(
             track_info = tracker.get_track_info(object_id)
             vx, vy = track_info.velocity if track_info else (0, 0)
             print(f"    Frame {i:2d}: pos=({x:3d}, {y:3d}), "
-                  f"dir={direction.value:15s}, vel=({vx:6.1f}, {vy:6.1f})")
+                  f"dir={direction.name:15s}, vel=({vx:6.1f}, {vy:6.1f})")
         
         final_direction = direction
         time.sleep(0.01)  # Simulate frame delay
     
     track_info = tracker.get_track_info(object_id)
     
-    print(f"  ✓ Final direction: {final_direction.value}")
+    print(f"  ✓ Final direction: {final_direction.name}")
     print(f"  Total displacement: {track_info.total_displacement:.1f} pixels")
     print(f"  Frames tracked: {track_info.frames_tracked}")
     
@@ -73,7 +73,7 @@ def main():
     )
     
     assert direction == Direction.RIGHT_TO_LEFT, \
-        f"Expected RIGHT_TO_LEFT, got {direction.value}"
+        f"Expected RIGHT_TO_LEFT, got {direction.name}"
     print("      ✓ RIGHT-TO-LEFT detection: PASSED")
     
     # Test 2: Left to Right movement
@@ -86,7 +86,7 @@ def main():
     )
     
     assert direction == Direction.LEFT_TO_RIGHT, \
-        f"Expected LEFT_TO_RIGHT, got {direction.value}"
+        f"Expected LEFT_TO_RIGHT, got {direction.name}"
     print("      ✓ LEFT-TO-RIGHT detection: PASSED")
     
     # Test 3: Stationary object
@@ -99,7 +99,7 @@ def main():
     )
     
     assert direction == Direction.STATIONARY, \
-        f"Expected STATIONARY, got {direction.value}"
+        f"Expected STATIONARY, got {direction.name}"
     print("      ✓ STATIONARY detection: PASSED")
     
     # Test 4: Top to Bottom movement
@@ -112,7 +112,7 @@ def main():
     )
     
     assert direction == Direction.TOP_TO_BOTTOM, \
-        f"Expected TOP_TO_BOTTOM, got {direction.value}"
+        f"Expected TOP_TO_BOTTOM, got {direction.name}"
     print("      ✓ TOP-TO-BOTTOM detection: PASSED")
     
     # Test 5: Multi-object tracking
@@ -139,7 +139,7 @@ def main():
     print(f"  Active tracks: {len(active_tracks)}")
     
     for obj_id, track_info in active_tracks.items():
-        print(f"    {obj_id}: {track_info.current_direction.value}")
+        print(f"    {obj_id}: {track_info.current_direction.name}")
     
     # Verify directions
     assert tracker.get_track_info("car_1").current_direction == Direction.LEFT_TO_RIGHT
@@ -6,10 +6,14 @@ Object detection and motion tracking for automated PTZ camera control.
 
 from .object_detector import ObjectDetector, DetectionResult
 from .motion_tracker import MotionTracker, MultiObjectTracker, Direction, TrackInfo
+from .pipelined_detector import PipelinedDetector
+from .process_detector import ProcessDetector
 
 __all__ = [
     'ObjectDetector',
     'DetectionResult',
+    'PipelinedDetector',
+    'ProcessDetector',
     'MotionTracker',
     'MultiObjectTracker',
     'Direction',
@@ -16,31 +16,164 @@ Example:
         print("Subject moving right to left - trigger camera preset!")
 """
 
+import heapq
 import logging
+import math
 import time
-from collections import deque
-from enum import Enum
-from typing import Dict, List, Optional, Tuple, Deque
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass
 
 import numpy as np
 
+# SciPy is optional - detection matching falls back to greedy without it
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    linear_sum_assignment = None
+
+# Numba is optional - the numeric kernels below run as plain Python without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class Direction(Enum):
-    """Movement directions for tracked objects"""
-    LEFT_TO_RIGHT = "left_to_right"
-    RIGHT_TO_LEFT = "right_to_left"
-    TOP_TO_BOTTOM = "top_to_bottom"
-    BOTTOM_TO_TOP = "bottom_to_top"
-    STATIONARY = "stationary"
-    UNKNOWN = "unknown"
+class Direction(IntEnum):
+    """
+    Movement directions for tracked objects
+    
+    Integer-valued so comparisons are plain int compares and the numeric
+    kernels can return a direction directly. Values start at 1 so every
+    member is truthy. Use ``direction.name.lower()`` for a text label.
+    """
+    LEFT_TO_RIGHT = 1
+    RIGHT_TO_LEFT = 2
+    TOP_TO_BOTTOM = 3
+    BOTTOM_TO_TOP = 4
+    STATIONARY = 5
+    UNKNOWN = 6
+
+
+# Plain int direction codes for the numeric kernels (Numba can't see the enum)
+_CODE_LEFT_TO_RIGHT = int(Direction.LEFT_TO_RIGHT)
+_CODE_RIGHT_TO_LEFT = int(Direction.RIGHT_TO_LEFT)
+_CODE_TOP_TO_BOTTOM = int(Direction.TOP_TO_BOTTOM)
+_CODE_BOTTOM_TO_TOP = int(Direction.BOTTOM_TO_TOP)
+_CODE_STATIONARY = int(Direction.STATIONARY)
+_CODE_UNKNOWN = int(Direction.UNKNOWN)
+
+# Direction by 2-bit code: (horizontal << 1) | moving toward positive axis
+_DIR_TABLE = np.array(
+    [_CODE_BOTTOM_TO_TOP, _CODE_TOP_TO_BOTTOM, _CODE_RIGHT_TO_LEFT, _CODE_LEFT_TO_RIGHT],
+    dtype=np.int64
+)
+
+_NS_PER_SECOND = 1_000_000_000
 
 
-@dataclass
+def _to_ns(timestamp: Optional[float]) -> int:
+    """Convert monotonic seconds to integer ns, reading the clock if None"""
+    if timestamp is None:
+        return time.monotonic_ns()
+    return round(timestamp * _NS_PER_SECOND)
+
+
+@njit(cache=True, fastmath=True)
+def _direction_code(xs, ys, row, start, end, stationary_sq, movement_sq):
+    """
+    Classify movement between two history entries of a track
+    
+    Displacement is compared squared against squared thresholds, so no
+    sqrt is taken. The dominant axis and sign are folded into a 2-bit
+    index into _DIR_TABLE instead of a tree of branches.
+    
+    Args:
+        xs, ys: (K, H) position columns of a TrackTable
+        row: Track row
+        start, end: Physical indices of the oldest and newest positions
+        stationary_sq: Squared maximum displacement to consider stationary
+        movement_sq: Squared minimum displacement to detect direction
+    
+    Returns:
+        Integer Direction value
+    """
+    dx = xs[row, end] - xs[row, start]
+    dy = ys[row, end] - ys[row, start]
+    disp_sq = dx * dx + dy * dy
+    
+    if disp_sq < stationary_sq:
+        return _CODE_STATIONARY
+    
+    if disp_sq < movement_sq:
+        return _CODE_UNKNOWN
+    
+    horizontal = int(abs(dx) > abs(dy))
+    positive = int(dx > 0) * horizontal + int(dy > 0) * (1 - horizontal)
+    
+    return _DIR_TABLE[(horizontal << 1) | positive]
+
+
+@njit(cache=True, fastmath=True)
+def _velocity_xy(xs, ys, ts, row, start, end):
+    """
+    Velocity between two history entries of a track in pixels per second
+    
+    Args:
+        xs, ys, ts: (K, H) position and timestamp (ns) columns of a TrackTable
+        row: Track row
+        start, end: Physical indices of the first and last positions
+    
+    Returns:
+        (vx, vy), or (0.0, 0.0) if no time has elapsed
+    """
+    time_diff_ns = ts[row, end] - ts[row, start]
+    
+    if time_diff_ns <= 0:
+        return 0.0, 0.0
+    
+    time_diff = time_diff_ns * 1e-9
+    vx = (xs[row, end] - xs[row, start]) / time_diff
+    vy = (ys[row, end] - ys[row, start]) / time_diff
+    
+    return vx, vy
+
+
+def _warmup_kernels() -> None:
+    """Compile the numeric kernels up front so the first frame isn't penalized"""
+    xs = np.zeros((1, 2), dtype=np.int32)
+    ys = np.zeros((1, 2), dtype=np.int32)
+    ts = np.array([[0, _NS_PER_SECOND]], dtype=np.int64)
+    _direction_code(xs, ys, 0, 0, 1, 20 * 20, 50 * 50)
+    _velocity_xy(xs, ys, ts, 0, 0, 1)
+
+
+if NUMBA_AVAILABLE:
+    _warmup_kernels()
+
+
+def _grown(array: np.ndarray) -> np.ndarray:
+    """Copy of an array with twice as many rows"""
+    grown = np.zeros((array.shape[0] * 2,) + array.shape[1:], dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+
+@dataclass(slots=True)
 class TrackInfo:
     """
     Information about a tracked object
@@ -52,7 +185,9 @@ class TrackInfo:
         velocity: (vx, vy) velocity vector in pixels/second
         total_displacement: Total distance traveled since first detection
         frames_tracked: Number of frames this object has been tracked
-        last_update_time: Timestamp of last position update
+        last_update_time: Time of the last position update as integer
+                          nanoseconds on the time.monotonic_ns() clock (not
+                          epoch seconds; compare with time.monotonic_ns())
         is_active: Whether object is currently being tracked
     """
     object_id: str
@@ -61,10 +196,210 @@ class TrackInfo:
     velocity: Tuple[float, float]
     total_displacement: float
     frames_tracked: int
-    last_update_time: float
+    last_update_time: int
     is_active: bool = True
 
 
+class TrackTable:
+    """
+    Motion state for all tracked objects, stored as row-indexed columns
+    
+    Each tracked object owns one row, found through ``row_of``. Position
+    history is kept in (K, H) arrays that every row writes as its own ring
+    buffer, so appending never allocates and the oldest/newest entries are
+    read directly by index. Per-track scalars (ring head/count, path length,
+    velocity, direction) are parallel 1-D columns, so batch updates read and
+    write whole columns with fancy indexing instead of visiting objects.
+    
+    The length of each step between consecutive positions is kept alongside
+    the history so the path length over the window is maintained
+    incrementally (add the new step, subtract the evicted one).
+    
+    Rows of removed tracks are reused for new ones; the columns grow by
+    doubling when every row is taken.
+    
+    Attributes:
+        xs, ys: (K, H) position history (int32)
+        ts: (K, H) monotonic timestamps in nanoseconds (int64)
+        ds: (K, H) length of the step ending at each slot (float64)
+        heads: Physical index of the next slot to write in each row
+        counts: Number of valid history entries in each row
+        path_length: Sum of step lengths over each row's history
+        xy_current: (K, 2) latest position (int32)
+        velocity: (K, 2) latest velocity in pixels/second
+        speed_sq: Squared magnitude of velocity
+        direction_code: Latest Direction value (int8)
+        row_of: Mapping of object_id to row
+    """
+    
+    def __init__(self, history_length: int, capacity: int = 16):
+        """
+        Allocate an empty table
+        
+        Args:
+            history_length: Positions kept per track
+            capacity: Initial number of rows
+        """
+        self.xs = np.zeros((capacity, history_length), dtype=np.int32)
+        self.ys = np.zeros((capacity, history_length), dtype=np.int32)
+        self.ts = np.zeros((capacity, history_length), dtype=np.int64)
+        self.ds = np.zeros((capacity, history_length), dtype=np.float64)
+        self.heads = np.zeros(capacity, dtype=np.intp)
+        self.counts = np.zeros(capacity, dtype=np.intp)
+        self.path_length = np.zeros(capacity, dtype=np.float64)
+        self.xy_current = np.zeros((capacity, 2), dtype=np.int32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float64)
+        self.speed_sq = np.zeros(capacity, dtype=np.float64)
+        self.direction_code = np.full(capacity, _CODE_UNKNOWN, dtype=np.int8)
+        
+        self.row_of: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._next_row = 0
+    
+    _COLUMNS = (
+        'xs', 'ys', 'ts', 'ds', 'heads', 'counts', 'path_length',
+        'xy_current', 'velocity', 'speed_sq', 'direction_code'
+    )
+    
+    @property
+    def history_length(self) -> int:
+        """Positions kept per track"""
+        return self.xs.shape[1]
+    
+    def add(self, object_id: str) -> int:
+        """
+        Claim an empty row for a new track
+        
+        Args:
+            object_id: Track to add (must not already be present)
+        
+        Returns:
+            Row index for the track
+        """
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = self._next_row
+            self._next_row += 1
+            
+            if row == self.xs.shape[0]:
+                for name in self._COLUMNS:
+                    setattr(self, name, _grown(getattr(self, name)))
+        
+        self.heads[row] = 0
+        self.counts[row] = 0
+        self.path_length[row] = 0.0
+        self.velocity[row] = 0.0
+        self.speed_sq[row] = 0.0
+        self.direction_code[row] = _CODE_UNKNOWN
+        self.row_of[object_id] = row
+        
+        return row
+    
+    def remove(self, object_id: str) -> Optional[int]:
+        """Release a track's row for reuse, returning it (or None if absent)"""
+        row = self.row_of.pop(object_id, None)
+        
+        if row is not None:
+            self._free_rows.append(row)
+        
+        return row
+    
+    def append(self, row: int, x: int, y: int, timestamp_ns: int) -> None:
+        """Write a position to a row, overwriting its oldest one when full"""
+        head = int(self.heads[row])
+        count = int(self.counts[row])
+        capacity = self.xs.shape[1]
+        
+        step = 0.0
+        if count > 0:
+            prev = (head - 1) % capacity
+            step = math.hypot(x - int(self.xs[row, prev]), y - int(self.ys[row, prev]))
+            
+            # Evicting the oldest position drops the step that left it
+            if count == capacity and capacity > 1:
+                self.path_length[row] -= self.ds[row, (head + 1) % capacity]
+            
+            self.path_length[row] += step
+        
+        self.xs[row, head] = x
+        self.ys[row, head] = y
+        self.ts[row, head] = timestamp_ns
+        self.ds[row, head] = step
+        self.xy_current[row] = (x, y)
+        
+        self.heads[row] = (head + 1) % capacity
+        if count < capacity:
+            self.counts[row] = count + 1
+    
+    def index(self, row: int, i: int) -> int:
+        """
+        Map a logical history index to a physical column index
+        
+        Args:
+            row: Track row
+            i: Logical index (0 = oldest, -1 = newest)
+        
+        Returns:
+            Index into the row of xs/ys/ts
+        """
+        count = int(self.counts[row])
+        if i < 0:
+            i += count
+        return (int(self.heads[row]) - count + i) % self.xs.shape[1]
+    
+    def history(self, row: int) -> np.ndarray:
+        """Positions of a row as an (N, 2) array, oldest first"""
+        count = int(self.counts[row])
+        order = (int(self.heads[row]) - count + np.arange(count)) % self.xs.shape[1]
+        return np.column_stack((self.xs[row, order], self.ys[row, order]))
+    
+    def set_history_length(self, history_length: int) -> None:
+        """
+        Change how many positions are kept per track
+        
+        Live rows keep their most recent positions, and their path lengths
+        are recomputed over what remains.
+        
+        Args:
+            history_length: New number of positions per track
+        """
+        old = (self.xs, self.ys, self.ts, self.heads.copy(), self.counts.copy())
+        capacity = self.xs.shape[0]
+        
+        self.xs = np.zeros((capacity, history_length), dtype=np.int32)
+        self.ys = np.zeros((capacity, history_length), dtype=np.int32)
+        self.ts = np.zeros((capacity, history_length), dtype=np.int64)
+        self.ds = np.zeros((capacity, history_length), dtype=np.float64)
+        
+        xs, ys, ts, heads, counts = old
+        old_length = xs.shape[1]
+        
+        for row in self.row_of.values():
+            count = int(counts[row])
+            keep = min(count, history_length)
+            order = (int(heads[row]) - keep + np.arange(keep)) % old_length
+            
+            self.heads[row] = 0
+            self.counts[row] = 0
+            self.path_length[row] = 0.0
+            
+            for j in order:
+                self.append(row, int(xs[row, j]), int(ys[row, j]), int(ts[row, j]))
+    
+    def clear(self) -> None:
+        """Drop every track, keeping the allocated columns"""
+        self.row_of.clear()
+        self._free_rows.clear()
+        self._next_row = 0
+    
+    def __contains__(self, object_id: str) -> bool:
+        return object_id in self.row_of
+    
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+
 class MotionTracker:
     """
     Track object motion and determine movement direction
@@ -88,23 +423,102 @@ class MotionTracker:
             movement_threshold: Minimum pixel displacement to detect direction
             stationary_threshold: Maximum displacement to consider stationary
             inactive_timeout: Seconds before marking track as inactive
+        
+        Timestamps are taken from the monotonic clock and stored as integer
+        nanoseconds. Callers that pass their own timestamps must use the same
+        clock (time.monotonic() seconds).
         """
-        self.history_length = history_length
         self.movement_threshold = movement_threshold
         self.stationary_threshold = stationary_threshold
-        self.inactive_timeout = inactive_timeout
         
-        # Track position history for each object
-        self.position_history: Dict[str, Deque[Tuple[int, int, float]]] = {}
+        # Position history and numeric motion state, one row per object
+        self._table = TrackTable(history_length)
         
         # Track metadata for each object
         self.track_info: Dict[str, TrackInfo] = {}
         
+        # IDs updated within inactive_timeout, maintained incrementally so
+        # active queries don't rescan every track ever seen. Tracks that
+        # timed out move to _inactive_ids until cleared or updated again.
+        self._active_ids: Set[str] = set()
+        self._inactive_ids: Set[str] = set()
+        
+        # Min-heap of (expiry time ns, object_id) with at most one entry per
+        # track (those in _in_heap). Entries aren't touched on update; when
+        # one comes due it is re-pushed with the real deadline if the track
+        # was seen since, so expiry only looks at tracks that may be stale.
+        self._expiry_heap: List[Tuple[int, str]] = []
+        self._in_heap: Set[str] = set()
+        self.inactive_timeout = inactive_timeout
+        
+        # Current fastest track by squared speed, so it is known without
+        # scanning. It is recomputed lazily only when the leading track
+        # slows down or goes away.
+        self._vmax_id: Optional[str] = None
+        self._vmax_sq = 0.0
+        self._vmax_stale = False
+        
+        # Retired TrackInfo objects, reused for new tracks so steady
+        # traffic doesn't allocate per track (table rows are reused too)
+        self._info_pool: List[TrackInfo] = []
+        
         logger.info(
-            f"MotionTracker initialized: history={history_length}, "
-            f"threshold={movement_threshold}px"
+            "MotionTracker initialized: history=%d, threshold=%spx",
+            history_length,
+            movement_threshold
         )
     
+    @property
+    def history_length(self) -> int:
+        """Number of frames to track for each object"""
+        return self._table.history_length
+    
+    @history_length.setter
+    def history_length(self, value: int) -> None:
+        if value != self._table.history_length:
+            self._table.set_history_length(value)
+    
+    @property
+    def movement_threshold(self) -> float:
+        """Minimum pixel displacement to detect direction"""
+        return self._movement_threshold
+    
+    @movement_threshold.setter
+    def movement_threshold(self, value: float) -> None:
+        self._movement_threshold = value
+        self._movement_sq = value * value
+    
+    @property
+    def stationary_threshold(self) -> float:
+        """Maximum displacement to consider stationary"""
+        return self._stationary_threshold
+    
+    @stationary_threshold.setter
+    def stationary_threshold(self, value: float) -> None:
+        self._stationary_threshold = value
+        self._stationary_sq = value * value
+    
+    @property
+    def inactive_timeout(self) -> float:
+        """Seconds before marking track as inactive"""
+        return self._inactive_timeout
+    
+    @inactive_timeout.setter
+    def inactive_timeout(self, value: float) -> None:
+        self._inactive_timeout = value
+        # Compared against integer-ns ages; an infinite timeout never expires
+        timeout_ns = round(value * _NS_PER_SECOND) if math.isfinite(value) else math.inf
+        self._inactive_timeout_ns = timeout_ns
+        
+        # Queued deadlines were computed with the old timeout
+        track_info = self.track_info
+        self._expiry_heap = [
+            (track_info[obj_id].last_update_time + timeout_ns, obj_id)
+            for obj_id in self._active_ids
+        ]
+        heapq.heapify(self._expiry_heap)
+        self._in_heap = set(self._active_ids)
+    
     def update(
         self,
         object_id: str,
@@ -117,161 +531,339 @@ class MotionTracker:
         Args:
             object_id: Unique identifier for tracked object
             center: (x, y) center position in frame
-            timestamp: Unix timestamp (uses current time if None)
-            
+            timestamp: Capture time in seconds on the time.monotonic() clock,
+                       not time.time() (samples the clock if None)
+        
         Returns:
             Direction enum indicating movement direction
-            
+        
         Example:
             direction = tracker.update("person_1", (320, 240))
             if direction == Direction.RIGHT_TO_LEFT:
                 camera.goto_preset("zone_left")
         """
-        if timestamp is None:
-            timestamp = time.time()
+        return self.update_with_info(object_id, center, timestamp)[0]
+    
+    def update_with_info(
+        self,
+        object_id: str,
+        center: Tuple[int, int],
+        timestamp: Optional[float] = None
+    ) -> Tuple[Direction, TrackInfo]:
+        """
+        Same as update(), but also return the object's updated TrackInfo
         
-        # Initialize tracking for new object
-        if object_id not in self.position_history:
-            self.position_history[object_id] = deque(maxlen=self.history_length)
-            self.track_info[object_id] = TrackInfo(
-                object_id=object_id,
-                current_position=center,
-                current_direction=Direction.UNKNOWN,
-                velocity=(0.0, 0.0),
-                total_displacement=0.0,
-                frames_tracked=0,
-                last_update_time=timestamp,
-                is_active=True
-            )
+        Saves callers that need both a separate get_track_info() lookup.
         
-        # Add position to history (x, y, timestamp)
-        self.position_history[object_id].append((center[0], center[1], timestamp))
+        Args:
+            object_id: Unique identifier for tracked object
+            center: (x, y) center position in frame
+            timestamp: Capture time in seconds on the time.monotonic() clock,
+                       not time.time() (samples the clock if None)
         
-        # Update track info
-        track = self.track_info[object_id]
-        track.current_position = center
-        track.frames_tracked += 1
-        track.last_update_time = timestamp
-        track.is_active = True
+        Returns:
+            (direction, track_info) for the object
+        """
+        track, row = self._record_position(object_id, center, _to_ns(timestamp))
         
         # Calculate direction and velocity
-        direction = self._calculate_direction(object_id)
-        velocity = self._calculate_velocity(object_id)
-        displacement = self._calculate_total_displacement(object_id)
+        direction = self._calculate_direction(row)
+        velocity = self._calculate_velocity(row)
+        displacement = self._calculate_total_displacement(row)
         
         track.current_direction = direction
         track.velocity = velocity
         track.total_displacement = displacement
         
-        return direction
+        table = self._table
+        vx, vy = velocity
+        speed_sq = vx * vx + vy * vy
+        table.velocity[row] = velocity
+        table.speed_sq[row] = speed_sq
+        table.direction_code[row] = direction
+        self._note_velocity(object_id, speed_sq)
+        
+        return direction, track
     
-    def _calculate_direction(self, object_id: str) -> Direction:
+    def update_batch(
+        self,
+        object_ids: List[str],
+        centers: List[Tuple[int, int]],
+        timestamp: Optional[float] = None
+    ) -> List[Direction]:
         """
-        Calculate movement direction from position history
+        Update several objects observed in the same frame
+        
+        Equivalent to calling update() for each object, but direction and
+        velocity for all of them are computed with a single set of array
+        operations over the track table instead of one Python call chain
+        per object.
         
         Args:
-            object_id: Object to calculate direction for
-            
+            object_ids: Identifiers of the tracked objects (no duplicates)
+            centers: (x, y) center position for each object
+            timestamp: Monotonic timestamp in seconds shared by all objects
+                (samples the clock if None)
+        
         Returns:
-            Direction enum
+            Direction for each object, in the same order as object_ids
         """
-        positions = self.position_history[object_id]
+        if not object_ids:
+            return []
         
-        # Need minimum history to determine direction
-        if len(positions) < 5:
-            return Direction.UNKNOWN
+        return self._update_batch_ns(object_ids, centers, _to_ns(timestamp))
+    
+    def _update_batch_ns(
+        self,
+        object_ids: List[str],
+        centers: List[Tuple[int, int]],
+        timestamp_ns: int
+    ) -> List[Direction]:
+        """update_batch() with the frame timestamp already in nanoseconds"""
+        table = self._table
+        count = len(object_ids)
+        tracks = []
+        rows = np.empty(count, dtype=np.intp)
+        
+        for i, (object_id, center) in enumerate(zip(object_ids, centers)):
+            track, rows[i] = self._record_position(object_id, center, timestamp_ns)
+            tracks.append(track)
+        
+        history_length = table.history_length
+        heads = table.heads[rows]
+        lengths = table.counts[rows]
+        starts = (heads - lengths) % history_length
+        ends = (heads - 1) % history_length
+        velocity_starts = (heads - np.minimum(10, lengths)) % history_length
+        
+        xs = table.xs
+        ys = table.ys
+        end_x = xs[rows, ends].astype(np.float64)
+        end_y = ys[rows, ends].astype(np.float64)
+        
+        # Direction from the oldest to the newest position
+        dx = end_x - xs[rows, starts]
+        dy = end_y - ys[rows, starts]
+        disp_sq = dx * dx + dy * dy
+        
+        horizontal = np.abs(dx) > np.abs(dy)
+        positive = np.where(horizontal, dx > 0, dy > 0)
+        codes = _DIR_TABLE[(horizontal.astype(np.intp) << 1) | positive]
+        codes = np.where(disp_sq < self._movement_sq, _CODE_UNKNOWN, codes)
+        codes = np.where(disp_sq < self._stationary_sq, _CODE_STATIONARY, codes)
+        codes = np.where(lengths < 5, _CODE_UNKNOWN, codes)
+        
+        # Velocity over the last (up to) 10 positions
+        time_diff_ns = table.ts[rows, ends] - table.ts[rows, velocity_starts]
+        moving = time_diff_ns > 0
+        safe_diff = np.where(moving, time_diff_ns * 1e-9, 1.0)
+        vx = np.where(moving, (end_x - xs[rows, velocity_starts]) / safe_diff, 0.0)
+        vy = np.where(moving, (end_y - ys[rows, velocity_starts]) / safe_diff, 0.0)
+        speed_sq = vx * vx + vy * vy
+        
+        table.velocity[rows, 0] = vx
+        table.velocity[rows, 1] = vy
+        table.speed_sq[rows] = speed_sq
+        table.direction_code[rows] = codes
+        path_length = np.maximum(table.path_length[rows], 0.0)
+        
+        directions = []
+        
+        for i, track in enumerate(tracks):
+            direction = Direction(int(codes[i]))
+            track.current_direction = direction
+            track.velocity = (float(vx[i]), float(vy[i]))
+            track.total_displacement = float(path_length[i])
+            self._note_velocity(object_ids[i], float(speed_sq[i]))
+            directions.append(direction)
+        
+        return directions
+    
+    def _record_position(
+        self,
+        object_id: str,
+        center: Tuple[int, int],
+        timestamp_ns: int
+    ) -> Tuple[TrackInfo, int]:
+        """
+        Append a position to an object's history, creating the track if needed
+        
+        Args:
+            object_id: Unique identifier for tracked object
+            center: (x, y) center position in frame
+            timestamp_ns: Monotonic position timestamp in nanoseconds
         
-        # Get start and end positions
-        start_x, start_y, start_time = positions[0]
-        end_x, end_y, end_time = positions[-1]
+        Returns:
+            (TrackInfo, table row) for the object (direction/velocity not yet updated)
+        """
+        row = self._table.row_of.get(object_id)
         
-        # Calculate displacement
-        dx = end_x - start_x
-        dy = end_y - start_y
-        total_displacement = (dx ** 2 + dy ** 2) ** 0.5
+        # Initialize tracking for new object
+        if row is None:
+            row = self._start_track(object_id, center, timestamp_ns)
         
-        # Check if stationary
-        if total_displacement < self.stationary_threshold:
-            return Direction.STATIONARY
+        # Add position to history (x, y, timestamp)
+        self._table.append(row, center[0], center[1], timestamp_ns)
         
-        # Check if displacement meets threshold
-        if total_displacement < self.movement_threshold:
-            return Direction.UNKNOWN
+        # Update track info
+        track = self.track_info[object_id]
+        track.current_position = center
+        track.frames_tracked += 1
+        track.last_update_time = timestamp_ns
+        track.is_active = True
+        self._active_ids.add(object_id)
         
-        # Determine dominant direction
-        abs_dx = abs(dx)
-        abs_dy = abs(dy)
+        if object_id not in self._in_heap:
+            self._inactive_ids.discard(object_id)
+            self._in_heap.add(object_id)
+            heapq.heappush(
+                self._expiry_heap, (timestamp_ns + self._inactive_timeout_ns, object_id)
+            )
         
-        if abs_dx > abs_dy:
-            # Horizontal movement is dominant
-            if dx > 0:
-                return Direction.LEFT_TO_RIGHT
-            else:
-                return Direction.RIGHT_TO_LEFT
+        return track, row
+    
+    def _start_track(
+        self,
+        object_id: str,
+        center: Tuple[int, int],
+        timestamp_ns: int
+    ) -> int:
+        """Claim a table row and TrackInfo for a new object, reusing pooled ones"""
+        row = self._table.add(object_id)
+        
+        if self._info_pool:
+            track = self._info_pool.pop()
+            track.object_id = object_id
+            track.current_position = center
+            track.current_direction = Direction.UNKNOWN
+            track.velocity = (0.0, 0.0)
+            track.total_displacement = 0.0
+            track.frames_tracked = 0
+            track.last_update_time = timestamp_ns
+            track.is_active = True
         else:
-            # Vertical movement is dominant
-            if dy > 0:
-                return Direction.TOP_TO_BOTTOM
+            track = TrackInfo(
+                object_id=object_id,
+                current_position=center,
+                current_direction=Direction.UNKNOWN,
+                velocity=(0.0, 0.0),
+                total_displacement=0.0,
+                frames_tracked=0,
+                last_update_time=timestamp_ns,
+                is_active=True
+            )
+        
+        self.track_info[object_id] = track
+        
+        return row
+    
+    def _note_velocity(self, object_id: str, speed_sq: float) -> None:
+        """Keep the running maximum squared speed current"""
+        if object_id == self._vmax_id:
+            if speed_sq >= self._vmax_sq:
+                self._vmax_sq = speed_sq
             else:
-                return Direction.BOTTOM_TO_TOP
+                self._vmax_stale = True
+        elif self._vmax_id is None or speed_sq > self._vmax_sq:
+            # With no leader yet even a stationary track takes the spot
+            self._vmax_id = object_id
+            self._vmax_sq = speed_sq
     
-    def _calculate_velocity(self, object_id: str) -> Tuple[float, float]:
+    def _calculate_direction(self, row: int) -> Direction:
         """
-        Calculate velocity vector (vx, vy) in pixels per second
+        Calculate movement direction from position history
         
         Args:
-            object_id: Object to calculate velocity for
-            
+            row: Table row of the object
+        
         Returns:
-            (vx, vy) velocity tuple
+            Direction enum
         """
-        positions = self.position_history[object_id]
+        table = self._table
         
-        if len(positions) < 2:
-            return (0.0, 0.0)
+        # Need minimum history to determine direction
+        if table.counts[row] < 5:
+            return Direction.UNKNOWN
         
-        # Use recent positions for velocity calculation
-        recent_count = min(10, len(positions))
-        recent_positions = list(positions)[-recent_count:]
+        # Classify using the oldest and newest history entries
+        code = _direction_code(
+            table.xs,
+            table.ys,
+            row,
+            table.index(row, 0),
+            table.index(row, -1),
+            self._stationary_sq,
+            self._movement_sq
+        )
         
-        start_x, start_y, start_time = recent_positions[0]
-        end_x, end_y, end_time = recent_positions[-1]
+        return Direction(int(code))
+    
+    def _calculate_velocity(self, row: int) -> Tuple[float, float]:
+        """
+        Calculate velocity vector (vx, vy) in pixels per second
         
-        time_diff = end_time - start_time
+        Args:
+            row: Table row of the object
         
-        if time_diff <= 0:
+        Returns:
+            (vx, vy) velocity tuple
+        """
+        table = self._table
+        count = int(table.counts[row])
+        
+        if count < 2:
             return (0.0, 0.0)
         
-        vx = (end_x - start_x) / time_diff
-        vy = (end_y - start_y) / time_diff
+        # Use recent positions for velocity calculation
+        recent_count = min(10, count)
+        vx, vy = _velocity_xy(
+            table.xs,
+            table.ys,
+            table.ts,
+            row,
+            table.index(row, count - recent_count),
+            table.index(row, -1)
+        )
         
-        return (vx, vy)
+        return (float(vx), float(vy))
     
-    def _calculate_total_displacement(self, object_id: str) -> float:
+    def _calculate_total_displacement(self, row: int) -> float:
         """
         Calculate total distance traveled
         
+        The path length is accumulated by the track table as positions are
+        appended, so this is O(1) regardless of history length.
+        
         Args:
-            object_id: Object to calculate displacement for
-            
+            row: Table row of the object
+        
         Returns:
             Total displacement in pixels
         """
-        positions = self.position_history[object_id]
+        table = self._table
         
-        if len(positions) < 2:
+        if table.counts[row] < 2:
             return 0.0
         
-        total = 0.0
+        # Guard against tiny negative drift from repeated add/subtract
+        return max(0.0, float(table.path_length[row]))
+    
+    def get_position_history(self, object_id: str) -> Optional[np.ndarray]:
+        """
+        Get the recorded positions of an object
+        
+        Args:
+            object_id: Object to get history for
         
-        for i in range(1, len(positions)):
-            x1, y1, _ = positions[i - 1]
-            x2, y2, _ = positions[i]
-            
-            distance = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-            total += distance
+        Returns:
+            (N, 2) array of positions, oldest first, or None if not tracked
+        """
+        row = self._table.row_of.get(object_id)
         
-        return total
+        if row is None:
+            return None
+        
+        return self._table.history(row)
     
     def get_track_info(self, object_id: str) -> Optional[TrackInfo]:
         """
@@ -285,14 +877,58 @@ class MotionTracker:
         """
         return self.track_info.get(object_id)
     
-    def get_all_tracks(self) -> Dict[str, TrackInfo]:
+    def get_all_tracks(self) -> Mapping[str, TrackInfo]:
         """
         Get tracking information for all objects
         
         Returns:
-            Dictionary mapping object_id to TrackInfo
+            Read-only mapping of object_id to TrackInfo (a live view, not a copy)
         """
-        return self.track_info.copy()
+        return MappingProxyType(self.track_info)
+    
+    def _prune_inactive(self) -> None:
+        """Move tracks that have timed out from the active to the inactive set"""
+        now_ns = time.monotonic_ns()
+        heap = self._expiry_heap
+        timeout_ns = self._inactive_timeout_ns
+        track_info = self.track_info
+        
+        # A track is stale once now - last_update > timeout, i.e. deadline < now
+        while heap and heap[0][0] < now_ns:
+            _, obj_id = heapq.heappop(heap)
+            track = track_info.get(obj_id)
+            
+            if track is None or obj_id not in self._active_ids:
+                self._in_heap.discard(obj_id)
+                continue
+            
+            deadline = track.last_update_time + timeout_ns
+            
+            if deadline >= now_ns:
+                # Updated since this entry was pushed - check again later
+                heapq.heappush(heap, (deadline, obj_id))
+                continue
+            
+            self._in_heap.discard(obj_id)
+            self._active_ids.discard(obj_id)
+            self._inactive_ids.add(obj_id)
+            track.is_active = False
+            
+            if obj_id == self._vmax_id:
+                self._vmax_stale = True
+    
+    def iter_active(self) -> Iterator[TrackInfo]:
+        """
+        Iterate over active (recently updated) tracks without building a dict
+        
+        Yields:
+            TrackInfo for each active track
+        """
+        self._prune_inactive()
+        track_info = self.track_info
+        
+        for obj_id in self._active_ids:
+            yield track_info[obj_id]
     
     def get_active_tracks(self) -> Dict[str, TrackInfo]:
         """
@@ -301,18 +937,8 @@ class MotionTracker:
         Returns:
             Dictionary of active tracks
         """
-        current_time = time.time()
-        active = {}
-        
-        for obj_id, track in self.track_info.items():
-            time_since_update = current_time - track.last_update_time
-            
-            if time_since_update <= self.inactive_timeout:
-                active[obj_id] = track
-            else:
-                track.is_active = False
-        
-        return active
+        self._prune_inactive()
+        return {obj_id: self.track_info[obj_id] for obj_id in self._active_ids}
     
     def get_objects_by_direction(self, direction: Direction) -> List[TrackInfo]:
         """
@@ -325,7 +951,7 @@ class MotionTracker:
             List of TrackInfo objects moving in that direction
         """
         return [
-            track for track in self.get_active_tracks().values()
+            track for track in self.iter_active()
             if track.current_direction == direction
         ]
     
@@ -336,31 +962,53 @@ class MotionTracker:
         Returns:
             TrackInfo of fastest object, or None if no active tracks
         """
-        active_tracks = list(self.get_active_tracks().values())
+        self._prune_inactive()
+        
+        if self._vmax_stale:
+            # Ordering by squared speed is the same as by speed
+            speed_sq = self._table.speed_sq
+            row_of = self._table.row_of
+            self._vmax_id = max(
+                self._active_ids,
+                key=lambda obj_id: speed_sq[row_of[obj_id]],
+                default=None
+            )
+            self._vmax_sq = (
+                float(speed_sq[row_of[self._vmax_id]]) if self._vmax_id is not None else 0.0
+            )
+            self._vmax_stale = False
         
-        if not active_tracks:
+        if self._vmax_id is None:
             return None
         
-        def velocity_magnitude(track: TrackInfo) -> float:
-            vx, vy = track.velocity
-            return (vx ** 2 + vy ** 2) ** 0.5
-        
-        return max(active_tracks, key=velocity_magnitude)
+        return self.track_info.get(self._vmax_id)
     
     def clear_track(self, object_id: str) -> None:
         """
         Remove tracking data for an object
         
+        The table row and TrackInfo are reused for the next new object, so
+        references to the old TrackInfo should not be kept after the track
+        is cleared.
+        
         Args:
             object_id: Object to stop tracking
         """
-        if object_id in self.position_history:
-            del self.position_history[object_id]
+        self._table.remove(object_id)
+        track = self.track_info.pop(object_id, None)
+        
+        # Keep up to twice the live track count for reuse
+        if track is not None and len(self._info_pool) < 2 * len(self.track_info) + 2:
+            track.is_active = False
+            self._info_pool.append(track)
         
-        if object_id in self.track_info:
-            del self.track_info[object_id]
+        self._active_ids.discard(object_id)
+        self._inactive_ids.discard(object_id)
         
-        logger.debug(f"Cleared track for {object_id}")
+        if object_id == self._vmax_id:
+            self._vmax_stale = True
+        
+        logger.debug("Cleared track for %s", object_id)
     
     def clear_inactive_tracks(self) -> int:
         """
@@ -369,35 +1017,38 @@ class MotionTracker:
         Returns:
             Number of tracks cleared
         """
-        current_time = time.time()
-        inactive_ids = []
-        
-        for obj_id, track in self.track_info.items():
-            time_since_update = current_time - track.last_update_time
-            
-            if time_since_update > self.inactive_timeout:
-                inactive_ids.append(obj_id)
+        self._prune_inactive()
+        inactive_ids = list(self._inactive_ids)
         
         for obj_id in inactive_ids:
             self.clear_track(obj_id)
         
-        if inactive_ids:
-            logger.debug(f"Cleared {len(inactive_ids)} inactive tracks")
+        if inactive_ids and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cleared %d inactive tracks", len(inactive_ids))
         
         return len(inactive_ids)
     
     def get_track_count(self) -> int:
         """Get total number of tracked objects"""
-        return len(self.position_history)
+        return len(self.track_info)
     
     def get_active_track_count(self) -> int:
         """Get number of active tracked objects"""
-        return len(self.get_active_tracks())
+        self._prune_inactive()
+        return len(self._active_ids)
     
     def reset(self) -> None:
         """Clear all tracking data"""
-        self.position_history.clear()
+        self._table.clear()
         self.track_info.clear()
+        self._info_pool.clear()
+        self._active_ids.clear()
+        self._inactive_ids.clear()
+        self._expiry_heap.clear()
+        self._in_heap.clear()
+        self._vmax_id = None
+        self._vmax_sq = 0.0
+        self._vmax_stale = False
         logger.info("Motion tracker reset")
     
     def __repr__(self) -> str:
@@ -438,8 +1089,44 @@ class MultiObjectTracker:
         
         # Track ID management
         self.next_id = 1
-        self.track_ages: Dict[str, int] = {}
         self.last_positions: Dict[str, Tuple[int, int]] = {}
+        
+        # Dense (K, 2) array of last positions for matching, kept in step
+        # with last_positions. Rows are compacted on removal. Velocity and
+        # time of the last position share the same rows and are used to
+        # predict where each track is now.
+        self._track_xy = np.empty((16, 2), dtype=np.int32)
+        self._track_v = np.zeros((16, 2), dtype=np.float64)
+        self._track_t = np.zeros(16, dtype=np.int64)
+        self._row_of: Dict[str, int] = {}
+        self._ids_by_row: List[str] = []
+        
+        # Frame each track was last matched on, plus a min-heap of
+        # (expiry frame, track_id) so aging only inspects tracks that are
+        # due. Entries are not updated when a track is seen again; they are
+        # re-pushed with the real deadline when they reach the top.
+        self._frame_no = 0
+        self._last_seen: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[int, str]] = []
+    
+    @property
+    def track_ages(self) -> Dict[str, int]:
+        """Frames since each track was last matched"""
+        frame_no = self._frame_no
+        return {
+            track_id: frame_no - seen + 1
+            for track_id, seen in self._last_seen.items()
+        }
+    
+    @property
+    def max_distance(self) -> float:
+        """Maximum distance to associate detections (pixels)"""
+        return self._max_distance
+    
+    @max_distance.setter
+    def max_distance(self, value: float) -> None:
+        self._max_distance = value
+        self._max_distance_sq = value * value
     
     def update(
         self,
@@ -451,59 +1138,135 @@ class MultiObjectTracker:
         
         Args:
             detections: List of (x, y) center positions
-            timestamp: Frame timestamp
+            timestamp: Monotonic frame timestamp in seconds (samples the clock if None)
             
         Returns:
             Dictionary mapping track_id to (position, direction)
         """
-        if timestamp is None:
-            timestamp = time.time()
+        track_ids, positions, directions = self._track_frame(detections, timestamp)
+        
+        results = {
+            track_id: (position, direction)
+            for track_id, position, direction in zip(track_ids, positions, directions)
+        }
+        
+        # Age out old tracks
+        self._age_tracks()
+        
+        return results
+    
+    def update_arrays(
+        self,
+        detections: List[Tuple[int, int]],
+        timestamp: Optional[float] = None
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Update tracks with new detections, returning results as arrays
+        
+        Same as update(), but positions and directions come straight from
+        the motion tracker's table columns instead of per-track tuples.
+        
+        Args:
+            detections: List of (x, y) center positions
+            timestamp: Monotonic frame timestamp in seconds (samples the clock if None)
+            
+        Returns:
+            (track_ids, xy, dirs) where xy is a (K, 2) int32 array of
+            positions and dirs a (K,) int8 array of Direction values, both
+            in track_ids order
+            
+        Example:
+            ids, xy, dirs = tracker.update_arrays(centers)
+            leaving = [ids[i] for i in np.flatnonzero(dirs == Direction.RIGHT_TO_LEFT)]
+        """
+        track_ids, _, _ = self._track_frame(detections, timestamp)
+        
+        table = self.motion_tracker._table
+        rows = np.fromiter(
+            (table.row_of[track_id] for track_id in track_ids),
+            dtype=np.intp,
+            count=len(track_ids)
+        )
+        
+        # Fancy indexing copies, so the results survive row reuse on aging
+        xy = table.xy_current[rows]
+        dirs = table.direction_code[rows]
+        
+        # Age out old tracks
+        self._age_tracks()
+        
+        return track_ids, xy, dirs
+    
+    def _track_frame(
+        self,
+        detections: List[Tuple[int, int]],
+        timestamp: Optional[float]
+    ) -> Tuple[List[str], List[Tuple[int, int]], List[Direction]]:
+        """
+        Match detections and update every track seen this frame (no aging)
+        
+        Returns:
+            (track_ids, positions, directions) for the updated tracks
+        """
+        # One clock read per frame, shared by every track update
+        timestamp_ns = _to_ns(timestamp)
+        self._frame_no += 1
+        frame_no = self._frame_no
         
         # Match detections to existing tracks
-        assignments = self._match_detections(detections)
+        assignments = self._match_detections(detections, timestamp_ns)
         
-        results = {}
+        track_ids = []
+        positions = []
         
-        # Update matched tracks
+        # Matched tracks
         for track_id, detection_idx in assignments.items():
             if detection_idx is not None:
-                position = detections[detection_idx]
-                direction = self.motion_tracker.update(track_id, position, timestamp)
-                
-                self.track_ages[track_id] = 0
-                self.last_positions[track_id] = position
-                
-                results[track_id] = (position, direction)
+                track_ids.append(track_id)
+                positions.append(detections[detection_idx])
         
         # Create new tracks for unmatched detections
         matched_indices = set(assignments.values())
         
         for i, detection in enumerate(detections):
             if i not in matched_indices:
-                track_id = f"track_{self.next_id}"
+                track_ids.append(f"track_{self.next_id}")
+                positions.append(detection)
                 self.next_id += 1
-                
-                direction = self.motion_tracker.update(track_id, detection, timestamp)
-                
-                self.track_ages[track_id] = 0
-                self.last_positions[track_id] = detection
-                
-                results[track_id] = (detection, direction)
         
-        # Age out old tracks
-        self._age_tracks()
+        # Update all tracks for this frame in one batch
+        directions = self.motion_tracker._update_batch_ns(track_ids, positions, timestamp_ns)
         
-        return results
+        last_seen = self._last_seen
+        track_info = self.motion_tracker.track_info
+        
+        for track_id, position in zip(track_ids, positions):
+            if track_id not in last_seen:
+                heapq.heappush(self._expiry_heap, (frame_no + self.max_age, track_id))
+            last_seen[track_id] = frame_no
+            self._set_position(
+                track_id, position, track_info[track_id].velocity, timestamp_ns
+            )
+        
+        return track_ids, positions, directions
     
     def _match_detections(
         self,
-        detections: List[Tuple[int, int]]
+        detections: List[Tuple[int, int]],
+        timestamp_ns: int
     ) -> Dict[str, Optional[int]]:
         """
-        Match detections to existing tracks using nearest neighbor
+        Match detections to existing tracks
+        
+        Each track's position is first advanced by its velocity over the
+        time since it was last seen (constant-velocity prediction), so fast
+        movers are matched where they are now rather than where they were.
+        Uses optimal (Hungarian) assignment on squared distances when SciPy
+        is available, otherwise greedy nearest neighbor.
         
         Args:
             detections: List of detection positions
+            timestamp_ns: Monotonic time of this frame in nanoseconds
             
         Returns:
             Dictionary mapping track_id to detection index (or None)
@@ -511,56 +1274,122 @@ class MultiObjectTracker:
         assignments = {}
         
         # Build cost matrix
-        track_ids = list(self.last_positions.keys())
+        track_ids = self._ids_by_row
         
         if not track_ids or not detections:
             return assignments
         
-        costs = np.zeros((len(track_ids), len(detections)))
-        
-        for i, track_id in enumerate(track_ids):
-            last_pos = self.last_positions[track_id]
+        # Squared distances for every (track, detection) pair in one shot.
+        # Comparisons are monotonic, so the sqrt is never needed.
+        count = len(track_ids)
+        dt = (timestamp_ns - self._track_t[:count]) * 1e-9
+        pred_xy = self._track_xy[:count] + self._track_v[:count] * dt[:, None]
+        det_xy = np.asarray(detections, dtype=np.float64)
+        diff = pred_xy[:, None, :] - det_xy[None, :, :]
+        costs_sq = np.einsum('ijk,ijk->ij', diff, diff)
+        
+        if SCIPY_AVAILABLE:
+            for track_id in track_ids:
+                assignments[track_id] = None
+            
+            # Pairs beyond max_distance are priced out before solving, so the
+            # solver never trades a valid match for a cheaper total built on
+            # pairs that are dropped afterwards. Any sentinel pair costs more
+            # than a full set of valid ones.
+            gated = costs_sq >= self._max_distance_sq
+            if gated.any():
+                sentinel = self._max_distance_sq * (min(costs_sq.shape) + 1)
+                costs_sq = np.where(gated, sentinel, costs_sq)
+            
+            row_ind, col_ind = linear_sum_assignment(costs_sq)
             
-            for j, detection in enumerate(detections):
-                distance = ((detection[0] - last_pos[0]) ** 2 + 
-                           (detection[1] - last_pos[1]) ** 2) ** 0.5
-                costs[i, j] = distance
+            for i, j in zip(row_ind, col_ind):
+                if not gated[i, j]:
+                    assignments[track_ids[i]] = int(j)
+            
+            return assignments
         
-        # Simple greedy matching
-        used_detections = set()
+        # Fallback: simple greedy matching
+        used_detections = np.zeros(len(detections), dtype=bool)
         
         for i, track_id in enumerate(track_ids):
-            min_cost = float('inf')
-            best_detection = None
-            
-            for j in range(len(detections)):
-                if j not in used_detections and costs[i, j] < min_cost:
-                    min_cost = costs[i, j]
-                    best_detection = j
+            row = np.where(used_detections, np.inf, costs_sq[i])
+            best_detection = int(row.argmin())
             
-            if best_detection is not None and min_cost < self.max_distance:
+            if row[best_detection] < self._max_distance_sq:
                 assignments[track_id] = best_detection
-                used_detections.add(best_detection)
+                used_detections[best_detection] = True
             else:
                 assignments[track_id] = None
         
         return assignments
     
     def _age_tracks(self) -> None:
-        """Increment age of all tracks and remove old ones"""
-        to_remove = []
-        
-        for track_id in list(self.track_ages.keys()):
-            self.track_ages[track_id] += 1
+        """Remove tracks that haven't been matched for more than max_age frames"""
+        heap = self._expiry_heap
+        last_seen = self._last_seen
+        frame_no = self._frame_no
+        
+        while heap and heap[0][0] <= frame_no:
+            _, track_id = heapq.heappop(heap)
+            seen = last_seen.get(track_id)
             
-            if self.track_ages[track_id] > self.max_age:
-                to_remove.append(track_id)
-        
-        for track_id in to_remove:
-            del self.track_ages[track_id]
-            del self.last_positions[track_id]
+            if seen is None:
+                continue
+            
+            deadline = seen + self.max_age
+            
+            if deadline > frame_no:
+                # Matched since this entry was pushed - check again later
+                heapq.heappush(heap, (deadline, track_id))
+                continue
+            
+            del last_seen[track_id]
+            self._remove_position(track_id)
             self.motion_tracker.clear_track(track_id)
     
+    def _set_position(
+        self,
+        track_id: str,
+        position: Tuple[int, int],
+        velocity: Tuple[float, float],
+        timestamp_ns: int
+    ) -> None:
+        """Store a track's last position and velocity, adding a row for new tracks"""
+        row = self._row_of.get(track_id)
+        
+        if row is None:
+            row = len(self._ids_by_row)
+            
+            # Grow with amortized doubling
+            if row == self._track_xy.shape[0]:
+                self._track_xy = _grown(self._track_xy)
+                self._track_v = _grown(self._track_v)
+                self._track_t = _grown(self._track_t)
+            
+            self._row_of[track_id] = row
+            self._ids_by_row.append(track_id)
+        
+        self._track_xy[row] = position
+        self._track_v[row] = velocity
+        self._track_t[row] = timestamp_ns
+        self.last_positions[track_id] = position
+    
+    def _remove_position(self, track_id: str) -> None:
+        """Drop a track's position row, moving the last row into its place"""
+        row = self._row_of.pop(track_id)
+        last_id = self._ids_by_row.pop()
+        
+        if last_id != track_id:
+            last_row = len(self._ids_by_row)
+            self._track_xy[row] = self._track_xy[last_row]
+            self._track_v[row] = self._track_v[last_row]
+            self._track_t[row] = self._track_t[last_row]
+            self._ids_by_row[row] = last_id
+            self._row_of[last_id] = row
+        
+        del self.last_positions[track_id]
+    
     def get_motion_tracker(self) -> MotionTracker:
         """Get underlying motion tracker"""
         return self.motion_tracker
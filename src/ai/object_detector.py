@@ -17,7 +17,10 @@ Example:
 import cv2
 import numpy as np
 import logging
-from typing import List, Optional, Tuple
+import time
+from contextlib import nullcontext
+from itertools import repeat
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -29,16 +32,112 @@ except ImportError:
     YOLO_AVAILABLE = False
     YOLO = None
 
+# PyTorch ships with ultralytics; only needed for the GPU-side fast paths
+try:
+    import torch
+    import torch.nn.functional as F
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+    torch = None
+    F = None
+
+# decord decodes video faster than cv2.VideoCapture; used by from_video() when present
+try:
+    import decord
+    DECORD_AVAILABLE = True
+except ImportError:
+    DECORD_AVAILABLE = False
+    decord = None
+
+# Numba is optional - the selection kernel below runs as plain Python without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Letterbox padding value used by YOLO preprocessing (gray 114)
+LETTERBOX_FILL = 114 / 255.0
+
+
+def _to_numpy(values) -> np.ndarray:
+    """Copy a (possibly GPU) tensor to a NumPy array in one transfer"""
+    if hasattr(values, 'cpu'):
+        return values.cpu().numpy()
+    return np.asarray(values)
+
+
+def _bbox_array(detections) -> np.ndarray:
+    """Stack detection bounding boxes into an (N, 4) int32 array"""
+    return np.asarray([d.bbox for d in detections], dtype=np.int32).reshape(-1, 4)
+
+
+def _bbox_areas(xyxy: np.ndarray) -> np.ndarray:
+    """Bounding box areas of an (N, 4) array as int64"""
+    xyxy = xyxy.astype(np.int64)
+    return (xyxy[:, 2] - xyxy[:, 0]) * (xyxy[:, 3] - xyxy[:, 1])
+
+
+def _center_distances_sq(detections, frame_shape) -> np.ndarray:
+    """Squared distances from detection centers to the frame center"""
+    height, width = frame_shape[:2]
+    centers = np.asarray([d.center for d in detections], dtype=np.int64).reshape(-1, 2)
+    dx = centers[:, 0] - width // 2
+    dy = centers[:, 1] - height // 2
+    return dx * dx + dy * dy
+
+
+@njit(cache=True, fastmath=True)
+def _segment_argbest(scores, offsets, maximize):
+    """
+    Index of the best score within each segment of a flat score array
+    
+    Segment i spans scores[offsets[i]:offsets[i + 1]]; empty segments
+    yield -1.
+    """
+    n_segments = offsets.shape[0] - 1
+    best = np.full(n_segments, -1, dtype=np.int64)
+    
+    for i in range(n_segments):
+        start = offsets[i]
+        end = offsets[i + 1]
+        
+        if start == end:
+            continue
+        
+        best_index = start
+        best_score = scores[start]
+        
+        for j in range(start + 1, end):
+            score = scores[j]
+            if (score > best_score) if maximize else (score < best_score):
+                best_score = score
+                best_index = j
+        
+        best[i] = best_index - start
+    
+    return best
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionResult:
     """
     Represents a detected object in a video frame
     
+    Slotted, so instances carry no per-object __dict__ and only the fields
+    below can be set.
+    
     Attributes:
         class_name: Object class (e.g., 'person', 'car', 'truck')
         confidence: Detection confidence (0.0 to 1.0)
@@ -47,6 +146,8 @@ class DetectionResult:
         frame_number: Frame number where object was detected
         timestamp: Unix timestamp of detection
         track_id: Optional tracking ID for multi-frame tracking
+        class_id: Model class ID (-1 if unknown); cheaper to compare than
+                  class_name
     """
     class_name: str
     confidence: float
@@ -55,6 +156,7 @@ class DetectionResult:
     frame_number: int
     timestamp: float
     track_id: Optional[int] = None
+    class_id: int = -1
 
 
 class ObjectDetector:
@@ -77,12 +179,29 @@ class ObjectDetector:
         'truck'
     ]
     
+    # Label style used by draw_detections
+    LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+    LABEL_FONT_SCALE = 0.85
+    LABEL_THICKNESS = 2
+    LABEL_PADDING = 8
+    
+    # Upper bound on cached label sizes (labels include confidence and IDs)
+    LABEL_CACHE_SIZE = 4096
+    
     def __init__(
         self,
         model_path: str = 'yolov8n.pt',
         confidence_threshold: float = 0.5,
         target_classes: Optional[List[str]] = None,
-        device: str = 'cpu'
+        device: str = 'cpu',
+        batch_size: int = 4,
+        engine_format: Optional[str] = None,
+        imgsz: int = 640,
+        int8_calibration_data: Optional[str] = None,
+        gpu_preprocess: bool = False,
+        half: bool = True,
+        compile_model: bool = False,
+        warmup_iterations: int = 2
     ):
         """
         Initialize object detector
@@ -94,6 +213,20 @@ class ObjectDetector:
             confidence_threshold: Minimum confidence for detections (0.0 to 1.0)
             target_classes: List of class names to detect (None = use defaults)
             device: Device to run inference on ('cpu', 'cuda', '0', '1', etc.)
+            batch_size: Frames per forward pass in detect_batch()
+            engine_format: Set to 'engine' to run a TensorRT engine on GPU
+                          devices (exported next to the .pt file on first use)
+            imgsz: Input size the TensorRT engine is built for
+            int8_calibration_data: Dataset YAML for INT8 calibration
+                                   (builds an INT8 engine instead of FP16)
+            gpu_preprocess: Letterbox and normalize frames on the GPU instead
+                           of in YOLO's CPU preprocessor (CUDA devices only)
+            half: Run FP16 inference on CUDA devices (ignored elsewhere)
+            compile_model: Compile the network with torch.compile on CUDA
+                          devices (PyTorch 2.x; ignored for TensorRT engines)
+            warmup_iterations: Dummy inferences run at startup on non-CPU
+                              devices, so the first real frame does not pay
+                              for kernel selection and allocation (0 = off)
             
         Raises:
             ImportError: If ultralytics is not installed
@@ -107,7 +240,15 @@ class ObjectDetector:
         
         self.model_path = model_path
         self.confidence_threshold = confidence_threshold
+        self.class_names = {}
+        self._class_ids_by_name = {}
+        self._label_sizes = {}
         self.target_classes = target_classes or self.DEFAULT_TARGET_CLASSES
+        self.batch_size = max(1, batch_size)
+        self.imgsz = imgsz
+        self.gpu_preprocess = False
+        self.half = False
+        self._input_dtype = None
         
         # Handle DirectML device for AMD GPUs
         if device == 'dml' or device == 'directml':
@@ -126,10 +267,56 @@ class ObjectDetector:
         
         try:
             self.model = YOLO(model_path)
-            self.model.to(self.device)  # Use self.device (not the parameter)
+            
+            engine_path = None
+            if engine_format == 'engine' and self.device not in ('cpu', 'mps'):
+                engine_path = self._load_tensorrt_engine(int8_calibration_data)
+            
+            if engine_path is not None:
+                # Exported engines are already bound to the GPU
+                self.model = YOLO(engine_path, task='detect')
+            else:
+                self.model.to(self.device)  # Use self.device (not the parameter)
             
             # Get class names from model
             self.class_names = self.model.names
+            self._class_ids_by_name = {name: cid for cid, name in self.class_names.items()}
+            self._update_target_ids()
+            
+            if half and TORCH_AVAILABLE and self._is_cuda_device():
+                # FP16 halves weight reads and uses tensor-core math; YOLO
+                # casts the weights and inputs when predicting with half=True
+                self.half = True
+            
+            if TORCH_AVAILABLE:
+                self._input_dtype = torch.float16 if self.half else torch.float32
+            
+            if TORCH_AVAILABLE and self._is_cuda_device():
+                # Input size is fixed, so let cuDNN autotune its kernels once
+                # and allow TF32 tensor-core math on Ampere and newer
+                torch.backends.cudnn.benchmark = True
+                torch.backends.cuda.matmul.allow_tf32 = True
+                torch.backends.cudnn.allow_tf32 = True
+            
+            if compile_model:
+                if engine_path is None and self._can_compile():
+                    # Fuse kernels for the fixed input shape; compilation
+                    # happens during warmup rather than on the first frame
+                    self.model.model = torch.compile(
+                        self.model.model, mode='reduce-overhead', fullgraph=False
+                    )
+                    warmup_iterations = max(warmup_iterations, 3)
+                else:
+                    logger.warning("torch.compile needs PyTorch 2.x and a CUDA device, skipping")
+            
+            if gpu_preprocess:
+                if TORCH_AVAILABLE and torch.cuda.is_available() and self._is_cuda_device():
+                    self.gpu_preprocess = True
+                else:
+                    logger.warning("GPU preprocessing needs a CUDA device, using CPU preprocessing")
+            
+            if warmup_iterations > 0 and self.device != 'cpu':
+                self.warmup(iterations=warmup_iterations)
             
             logger.info(f"✓ Model loaded successfully on {self.device}")
             logger.info(f"  Target classes: {', '.join(self.target_classes)}")
@@ -139,11 +326,84 @@ class ObjectDetector:
             logger.error(f"Failed to load YOLO model: {e}")
             raise
     
+    @property
+    def target_classes(self) -> List[str]:
+        """Class names to detect"""
+        return self._target_classes
+    
+    @target_classes.setter
+    def target_classes(self, value: List[str]) -> None:
+        self._target_classes = value
+        self._update_target_ids()
+    
+    def _update_target_ids(self) -> None:
+        """Cache the target classes as sets and as model class IDs for filtering"""
+        self._target_classes_set = frozenset(self._target_classes)
+        self._target_class_id_set = frozenset(
+            cid for cid, name in self.class_names.items()
+            if name in self._target_classes_set
+        )
+        self._target_class_ids = np.fromiter(
+            sorted(self._target_class_id_set), dtype=np.int32
+        )
+    
+    def _load_tensorrt_engine(
+        self,
+        int8_calibration_data: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Find or build a TensorRT engine for the loaded model
+        
+        Engines are tied to the batch size, input size and precision they
+        were built with, so the file name records all three and a new
+        engine is exported only when no matching one exists yet.
+        
+        Args:
+            int8_calibration_data: Dataset YAML for INT8 calibration (FP16 if None)
+            
+        Returns:
+            Path to the engine file, or None if export failed
+        """
+        precision = 'int8' if int8_calibration_data else 'fp16'
+        model_file = Path(self.model_path)
+        engine_path = model_file.with_name(
+            f"{model_file.stem}_b{self.batch_size}_{self.imgsz}_{precision}.engine"
+        )
+        
+        if engine_path.exists():
+            logger.info(f"Using TensorRT engine {engine_path}")
+            return str(engine_path)
+        
+        logger.info(f"Exporting TensorRT {precision.upper()} engine (one-time, may take minutes)...")
+        
+        try:
+            exported = self.model.export(
+                format='engine',
+                half=not int8_calibration_data,
+                int8=bool(int8_calibration_data),
+                data=int8_calibration_data,
+                batch=self.batch_size,  # Engine only accepts batches up to this size
+                imgsz=self.imgsz,
+                device=self.device,
+                dynamic=True,
+                workspace=4
+            )
+            Path(exported).replace(engine_path)
+            
+        except Exception as e:
+            logger.warning(f"TensorRT export failed, using PyTorch model: {e}")
+            return None
+        
+        logger.info(f"✓ TensorRT engine saved to {engine_path}")
+        return str(engine_path)
+    
     def detect(
         self,
         frame: np.ndarray,
         frame_number: int = 0,
-        timestamp: Optional[float] = None
+        timestamp: Optional[float] = None,
+        class_ids: Optional[np.ndarray] = None,
+        min_confidence: Optional[float] = None
     ) -> List[DetectionResult]:
         """
         Detect objects in a single frame
@@ -151,7 +411,12 @@ class ObjectDetector:
         Args:
             frame: OpenCV BGR image
             frame_number: Frame sequence number
-            timestamp: Frame timestamp (Unix time)
+            timestamp: Frame timestamp (Unix time). Pass the time the frame
+                       was read from the capture; defaults to now
+            class_ids: Keep only these model class IDs (see class_ids_for());
+                      applied on top of target_classes
+            min_confidence: Confidence cutoff for this call, if stricter
+                           than confidence_threshold
             
         Returns:
             List of DetectionResult objects
@@ -162,55 +427,399 @@ class ObjectDetector:
                 x1, y1, x2, y2 = det.bbox
                 cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
         """
-        import time
+        # Single frames go through the batch path so both behave the same
+        detections = self.detect_batch(
+            [frame],
+            [frame_number],
+            None if timestamp is None else [timestamp],
+            class_ids=class_ids,
+            min_confidence=min_confidence
+        )[0]
         
-        if timestamp is None:
-            timestamp = time.time()
+        logger.debug(f"Frame {frame_number}: Detected {len(detections)} objects")
         
-        detections = []
+        return detections
+    
+    def detect_batch(
+        self,
+        frames: List[np.ndarray],
+        frame_numbers: Optional[List[int]] = None,
+        timestamps: Optional[List[float]] = None,
+        batch_size: Optional[int] = None,
+        class_ids: Optional[np.ndarray] = None,
+        min_confidence: Optional[float] = None
+    ) -> List[List[DetectionResult]]:
+        """
+        Detect objects in several frames using batched forward passes
         
-        try:
-            # Run inference
-            results = self.model(frame, verbose=False)[0]
-            
-            # Process each detection
-            for box in results.boxes:
-                class_id = int(box.cls[0])
-                class_name = self.class_names[class_id]
-                confidence = float(box.conf[0])
+        Frames are sent to the model batch_size at a time, so per-call
+        overhead (kernel launches, weight reads, NMS setup) is paid once
+        per batch instead of once per frame.
+        
+        Args:
+            frames: OpenCV BGR images
+            frame_numbers: Frame sequence number for each frame (default 0..N-1)
+            timestamps: Timestamp for each frame (default: current time)
+            batch_size: Frames per forward pass (default: self.batch_size)
+            class_ids: Keep only these model class IDs (see detect())
+            min_confidence: Confidence cutoff for this call (see detect())
+            
+        Returns:
+            One list of DetectionResult objects per frame, in input order
+            
+        Example:
+            frames = [stream.read() for _ in range(4)]
+            for dets in detector.detect_batch(frames):
+                print(len(dets))
+        """
+        if not frames:
+            return []
+        
+        if frame_numbers is None:
+            frame_numbers = list(range(len(frames)))
+        
+        if timestamps is None:
+            timestamps = [time.time()] * len(frames)
+        
+        batch_size = batch_size or self.batch_size
+        all_detections: List[List[DetectionResult]] = []
+        
+        # Resolve per-call filters once for the whole batch
+        wanted_ids = self._target_class_ids
+        if class_ids is not None:
+            wanted_ids = np.intersect1d(wanted_ids, np.asarray(class_ids, dtype=np.int32))
+        
+        threshold = self.confidence_threshold
+        if min_confidence is not None:
+            threshold = max(threshold, min_confidence)
+        
+        if len(wanted_ids) == 0:
+            # Nothing could pass the class filter; skip inference entirely
+            return [[] for _ in frames]
+        
+        # Let YOLO's NMS drop low-confidence and unwanted-class boxes on
+        # device, so only candidate rows are copied back and converted
+        predict_kwargs = dict(
+            verbose=False,
+            half=self.half,
+            conf=threshold,
+            classes=wanted_ids.tolist()
+        )
+        
+        for start in range(0, len(frames), batch_size):
+            chunk = frames[start:start + batch_size]
+            
+            try:
+                letterbox = None
+                
+                if self.gpu_preprocess and all(f.shape == chunk[0].shape for f in chunk):
+                    # Hand YOLO a ready CHW tensor so it skips CPU preprocessing
+                    inputs, letterbox = self._gpu_letterbox(chunk)
+                else:
+                    inputs = chunk
+                
+                # Run inference on the whole chunk at once
+                with self._inference_mode():
+                    results = self.model(inputs, **predict_kwargs)
                 
-                # Filter by confidence and target classes
-                if (confidence >= self.confidence_threshold and
-                    class_name in self.target_classes):
-                    
-                    # Get bounding box coordinates
-                    x1, y1, x2, y2 = map(int, box.xyxy[0])
-                    
-                    # Calculate center point
-                    center_x = (x1 + x2) // 2
-                    center_y = (y1 + y2) // 2
-                    
-                    # Get track ID if available (from tracking mode)
-                    track_id = None
-                    if hasattr(box, 'id') and box.id is not None:
-                        track_id = int(box.id[0])
-                    
-                    detection = DetectionResult(
-                        class_name=class_name,
-                        confidence=confidence,
-                        bbox=(x1, y1, x2, y2),
-                        center=(center_x, center_y),
-                        frame_number=frame_number,
-                        timestamp=timestamp,
-                        track_id=track_id
+                for i, result in enumerate(results):
+                    all_detections.append(self._boxes_to_detections(
+                        result.boxes,
+                        frame_numbers[start + i],
+                        timestamps[start + i],
+                        letterbox,
+                        class_ids=wanted_ids,
+                        min_confidence=threshold
+                    ))
+                
+            except Exception as e:
+                if len(chunk) == 1:
+                    logger.error(f"Detection failed on frame {frame_numbers[start]}: {e}")
+                else:
+                    logger.error(
+                        f"Detection failed on frames {frame_numbers[start]}-"
+                        f"{frame_numbers[start + len(chunk) - 1]}: {e}"
                     )
-                    
-                    detections.append(detection)
+                
+                # Keep one (empty) entry per input frame
+                del all_detections[start:]
+                all_detections.extend([] for _ in chunk)
+        
+        return all_detections
+    
+    def detect_stream(
+        self,
+        source: Union[str, cv2.VideoCapture, Iterable[np.ndarray]],
+        batch_size: int = 1
+    ) -> Iterator[Tuple[int, float, List[DetectionResult]]]:
+        """
+        Detect objects frame by frame over a video stream
+        
+        A file path or stream URL is handed to YOLO's streaming predictor,
+        which decodes and infers without materializing all results. A
+        VideoCapture or iterable of frames is read here and each frame is
+        stamped when it is read, then sent to the model batch_size frames
+        at a time (1 keeps latency lowest for live video).
+        
+        Args:
+            source: Video path/URL, cv2.VideoCapture, or iterable of BGR frames
+            batch_size: Frames per forward pass for capture/iterable sources
             
-            logger.debug(f"Frame {frame_number}: Detected {len(detections)} objects")
+        Yields:
+            (frame_number, timestamp, detections) for each frame, in order
             
-        except Exception as e:
-            logger.error(f"Detection failed on frame {frame_number}: {e}")
+        Example:
+            for frame_number, ts, dets in detector.detect_stream('rtsp://...'):
+                print(frame_number, len(dets))
+        """
+        if isinstance(source, (str, Path)):
+            results = self.model(str(source), stream=True, verbose=False, half=self.half)
+            
+            for frame_number, result in enumerate(results):
+                timestamp = time.time()
+                yield frame_number, timestamp, self._boxes_to_detections(
+                    result.boxes, frame_number, timestamp
+                )
+            return
+        
+        if isinstance(source, cv2.VideoCapture):
+            source = self._read_capture(source)
+        
+        frames: List[np.ndarray] = []
+        frame_numbers: List[int] = []
+        timestamps: List[float] = []
+        
+        for frame_number, frame in enumerate(source):
+            frames.append(frame)
+            frame_numbers.append(frame_number)
+            timestamps.append(time.time())
+            
+            if len(frames) >= batch_size:
+                yield from zip(
+                    frame_numbers, timestamps,
+                    self.detect_batch(frames, frame_numbers, timestamps, batch_size)
+                )
+                frames, frame_numbers, timestamps = [], [], []
+        
+        if frames:
+            yield from zip(
+                frame_numbers, timestamps,
+                self.detect_batch(frames, frame_numbers, timestamps, batch_size)
+            )
+    
+    @classmethod
+    def from_video(
+        cls,
+        video_path: str,
+        model_path: str = 'yolov8n.pt',
+        batch_size: int = 1,
+        **kwargs
+    ) -> Iterator[Tuple[int, float, List[DetectionResult]]]:
+        """
+        Create a detector and run it over a video file
+        
+        Frames are decoded with decord when it is installed (noticeably
+        faster than OpenCV for H.264), otherwise with cv2.VideoCapture.
+        
+        Args:
+            video_path: Path to the video file
+            model_path: Path to YOLO model file
+            batch_size: Frames per forward pass
+            **kwargs: Other ObjectDetector constructor arguments
+            
+        Yields:
+            (frame_number, timestamp, detections) for each frame, in order
+            
+        Example:
+            for frame_number, ts, dets in ObjectDetector.from_video('clip.mp4'):
+                print(frame_number, len(dets))
+        """
+        detector = cls(model_path=model_path, **kwargs)
+        yield from detector.detect_stream(cls._video_frames(video_path), batch_size=batch_size)
+    
+    @classmethod
+    def _video_frames(cls, video_path: str) -> Iterator[np.ndarray]:
+        """Yield BGR frames from a video file, preferring decord"""
+        if DECORD_AVAILABLE:
+            reader = decord.VideoReader(str(video_path), ctx=decord.cpu(0))
+            
+            for index in range(len(reader)):
+                # decord returns RGB; YOLO and OpenCV expect BGR
+                yield cv2.cvtColor(reader[index].asnumpy(), cv2.COLOR_RGB2BGR)
+            return
+        
+        capture = cv2.VideoCapture(str(video_path))
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        try:
+            yield from cls._read_capture(capture)
+        finally:
+            capture.release()
+    
+    @staticmethod
+    def _read_capture(capture: cv2.VideoCapture) -> Iterator[np.ndarray]:
+        """Yield frames from a capture until it runs out"""
+        while True:
+            ret, frame = capture.read()
+            if not ret:
+                return
+            yield frame
+    
+    def warmup(self, iterations: int = 2) -> None:
+        """
+        Run dummy inferences so one-time setup happens before real frames
+        
+        Args:
+            iterations: Number of dummy forward passes
+        """
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        
+        with self._inference_mode():
+            for _ in range(iterations):
+                self.model(dummy, verbose=False, half=self.half)
+        
+        if TORCH_AVAILABLE and torch.cuda.is_available() and self._is_cuda_device():
+            torch.cuda.synchronize()
+        
+        logger.info("Warmup complete")
+    
+    def _can_compile(self) -> bool:
+        """Check whether torch.compile can be used on this device"""
+        return (
+            TORCH_AVAILABLE and hasattr(torch, 'compile') and
+            torch.cuda.is_available() and self._is_cuda_device()
+        )
+    
+    @staticmethod
+    def _inference_mode():
+        """Context that disables autograd tracking around model calls"""
+        return torch.inference_mode() if TORCH_AVAILABLE else nullcontext()
+    
+    def _is_cuda_device(self) -> bool:
+        """Check whether self.device names a CUDA device"""
+        device = str(self.device)
+        return device.startswith('cuda') or device.isdigit()
+    
+    def _gpu_letterbox(
+        self,
+        frames: List[np.ndarray]
+    ) -> Tuple['torch.Tensor', Tuple[float, int, int, int, int]]:
+        """
+        Letterbox same-sized BGR frames to imgsz x imgsz on the GPU
+        
+        Only the raw uint8 pixels cross the bus; BGR->RGB, HWC->CHW,
+        scaling to 0-1, resizing and padding all run on the device.
+        
+        Args:
+            frames: OpenCV BGR images, all the same shape
+            
+        Returns:
+            (N, 3, imgsz, imgsz) float tensor and the (scale, pad_x, pad_y,
+            width, height) needed to map boxes back to frame coordinates
+        """
+        height, width = frames[0].shape[:2]
+        size = self.imgsz
+        scale = min(size / height, size / width)
+        new_w = round(width * scale)
+        new_h = round(height * scale)
+        pad_x = (size - new_w) // 2
+        pad_y = (size - new_h) // 2
+        
+        pixels = torch.from_numpy(np.stack(frames)).to(self.device, non_blocking=True)
+        batch = pixels.permute(0, 3, 1, 2).flip(1).float().div_(255.0)
+        batch = F.interpolate(batch, size=(new_h, new_w), mode='bilinear', align_corners=False)
+        
+        # Build the input in the model's precision so YOLO skips a cast
+        padded = torch.full(
+            (len(frames), 3, size, size), LETTERBOX_FILL,
+            dtype=self._input_dtype, device=batch.device
+        )
+        padded[:, :, pad_y:pad_y + new_h, pad_x:pad_x + new_w] = batch
+        
+        return padded, (scale, pad_x, pad_y, width, height)
+    
+    def _boxes_to_detections(
+        self,
+        boxes,
+        frame_number: int,
+        timestamp: float,
+        letterbox: Optional[Tuple[float, int, int, int, int]] = None,
+        tracking_mode: bool = False,
+        class_ids: Optional[np.ndarray] = None,
+        min_confidence: Optional[float] = None
+    ) -> List[DetectionResult]:
+        """
+        Convert one frame's YOLO boxes to filtered DetectionResult objects
+        
+        Args:
+            boxes: ``Results.boxes`` from a YOLO call
+            frame_number: Frame sequence number
+            timestamp: Frame timestamp
+            letterbox: (scale, pad_x, pad_y, width, height) if the boxes are
+                      in GPU-letterboxed coordinates rather than frame pixels
+            tracking_mode: Boxes come from model.track and may carry track IDs
+            class_ids: Class IDs to keep (default: the target classes)
+            min_confidence: Confidence cutoff (default: confidence_threshold)
+            
+        Returns:
+            Detections passing the confidence and target class filters
+        """
+        detections = []
+        
+        if boxes is None or len(boxes) == 0:
+            return detections
+        
+        # Rows are (x1, y1, x2, y2, [track_id,] conf, cls); one host copy
+        # covers every field
+        data = _to_numpy(boxes.data)
+        box_class_ids = data[:, -1].astype(np.int32)
+        confidences = data[:, -2].astype(np.float64)
+        
+        # Filter by confidence and target classes
+        if class_ids is None:
+            class_ids = self._target_class_ids
+        if min_confidence is None:
+            min_confidence = self.confidence_threshold
+        
+        keep = (confidences >= min_confidence) & np.isin(box_class_ids, class_ids)
+        
+        if not keep.any():
+            return detections
+        
+        box_class_ids = box_class_ids[keep]
+        confidences = confidences[keep]
+        xyxy = data[keep, :4].astype(np.float64)
+        
+        if letterbox is not None:
+            scale, pad_x, pad_y, width, height = letterbox
+            xyxy = (xyxy - (pad_x, pad_y, pad_x, pad_y)) / scale
+            xyxy = np.clip(xyxy, 0, (width, height, width, height))
+        
+        # Get bounding box coordinates and center points
+        xyxy = xyxy.astype(np.int32)
+        centers = (xyxy[:, :2] + xyxy[:, 2:]) // 2
+        
+        # Get track IDs if available (from tracking mode)
+        track_ids = repeat(None)
+        if tracking_mode and data.shape[1] == 7:
+            track_ids = data[keep, 4].astype(np.int64).tolist()
+        
+        class_names = self.class_names
+        
+        for bbox, center, class_id, confidence, track_id in zip(
+            xyxy.tolist(), centers.tolist(), box_class_ids.tolist(),
+            confidences.tolist(), track_ids
+        ):
+            detections.append(DetectionResult(
+                class_name=class_names[class_id],
+                confidence=confidence,
+                bbox=tuple(bbox),
+                center=tuple(center),
+                frame_number=frame_number,
+                timestamp=timestamp,
+                track_id=track_id,
+                class_id=class_id
+            ))
         
         return detections
     
@@ -234,8 +843,6 @@ class ObjectDetector:
         Returns:
             List of DetectionResult objects with track_id populated
         """
-        import time
-        
         if timestamp is None:
             timestamp = time.time()
         
@@ -243,39 +850,12 @@ class ObjectDetector:
         
         try:
             # Run tracking (built-in to YOLOv8)
-            results = self.model.track(frame, persist=True, verbose=False)[0]
+            with self._inference_mode():
+                results = self.model.track(frame, persist=True, verbose=False, half=self.half)[0]
             
-            if results.boxes is None or len(results.boxes) == 0:
-                return detections
-            
-            for box in results.boxes:
-                class_id = int(box.cls[0])
-                class_name = self.class_names[class_id]
-                confidence = float(box.conf[0])
-                
-                if (confidence >= self.confidence_threshold and
-                    class_name in self.target_classes):
-                    
-                    x1, y1, x2, y2 = map(int, box.xyxy[0])
-                    center_x = (x1 + x2) // 2
-                    center_y = (y1 + y2) // 2
-                    
-                    # Get track ID
-                    track_id = None
-                    if hasattr(box, 'id') and box.id is not None:
-                        track_id = int(box.id[0])
-                    
-                    detection = DetectionResult(
-                        class_name=class_name,
-                        confidence=confidence,
-                        bbox=(x1, y1, x2, y2),
-                        center=(center_x, center_y),
-                        frame_number=frame_number,
-                        timestamp=timestamp,
-                        track_id=track_id
-                    )
-                    
-                    detections.append(detection)
+            detections = self._boxes_to_detections(
+                results.boxes, frame_number, timestamp, tracking_mode=True
+            )
             
             logger.debug(f"Frame {frame_number}: Tracked {len(detections)} objects")
             
@@ -291,7 +871,9 @@ class ObjectDetector:
         show_confidence: bool = True,
         show_track_id: bool = True,
         color: Tuple[int, int, int] = (0, 255, 0),
-        thickness: int = 2
+        thickness: int = 2,
+        *,
+        inplace: bool = False
     ) -> np.ndarray:
         """
         Draw detection bounding boxes and labels on frame
@@ -303,18 +885,26 @@ class ObjectDetector:
             show_track_id: Show tracking ID
             color: BGR color tuple for boxes
             thickness: Line thickness
+            inplace: Draw directly on frame instead of on a copy
             
         Returns:
             Frame with drawn detections
         """
-        annotated_frame = frame.copy()
+        annotated_frame = frame if inplace else frame.copy()
+        
+        if not detections:
+            return annotated_frame
+        
+        # Draw all bounding boxes in one call, with thicker lines for visibility
+        corners = np.asarray([d.bbox for d in detections], dtype=np.int32)
+        outlines = corners[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+        cv2.polylines(annotated_frame, list(outlines), True, color, thickness + 1)
+        
+        padding = self.LABEL_PADDING
         
         for detection in detections:
             x1, y1, x2, y2 = detection.bbox
             
-            # Draw bounding box with thicker line for visibility
-            cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), color, thickness + 1)
-            
             # Build label text
             label_parts = [detection.class_name]
             
@@ -325,16 +915,9 @@ class ObjectDetector:
                 label_parts.append(f"ID:{detection.track_id}")
             
             label = " ".join(label_parts)
-            
-            # Get text size with larger font
-            font_scale = 0.85  # Increased from 0.6
-            thickness_text = 2  # Thicker text
-            (label_width, label_height), baseline = cv2.getTextSize(
-                label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness_text
-            )
+            label_width, label_height = self._label_size(label)
             
             # Add padding around label
-            padding = 8
             label_bg_x1 = x1
             label_bg_y1 = y1 - label_height - padding * 2
             label_bg_x2 = x1 + label_width + padding * 2
@@ -363,10 +946,10 @@ class ObjectDetector:
                 annotated_frame,
                 label,
                 (x1 + padding, y1 - padding),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                font_scale,
+                self.LABEL_FONT,
+                self.LABEL_FONT_SCALE,
                 (0, 0, 0),  # Black text
-                thickness_text
+                self.LABEL_THICKNESS
             )
             
             # Draw center point
@@ -374,6 +957,26 @@ class ObjectDetector:
         
         return annotated_frame
     
+    def _label_size(self, label: str) -> Tuple[int, int]:
+        """
+        Get the rendered (width, height) of a label, measuring each text once
+        
+        Labels repeat from frame to frame, so font metrics are cached instead
+        of asking OpenCV for every detection.
+        """
+        size = self._label_sizes.get(label)
+        
+        if size is None:
+            if len(self._label_sizes) >= self.LABEL_CACHE_SIZE:
+                self._label_sizes.clear()
+            
+            size, _ = cv2.getTextSize(
+                label, self.LABEL_FONT, self.LABEL_FONT_SCALE, self.LABEL_THICKNESS
+            )
+            self._label_sizes[label] = size
+        
+        return size
+    
     def filter_by_class(
         self,
         detections: List[DetectionResult],
@@ -389,7 +992,46 @@ class ObjectDetector:
         Returns:
             Filtered list of detections
         """
-        return [d for d in detections if d.class_name in class_names]
+        names = frozenset(class_names)
+        return [d for d in detections if d.class_name in names]
+    
+    def class_ids_for(self, class_names: Iterable[str]) -> np.ndarray:
+        """
+        Model class IDs for the given class names
+        
+        Resolve once and pass the result to detect(class_ids=...) so the
+        class filter runs on the raw box arrays.
+        
+        Args:
+            class_names: Class names (unknown names are ignored)
+            
+        Returns:
+            Sorted int32 array of class IDs
+        """
+        return np.array(sorted(
+            self._class_ids_by_name[name] for name in set(class_names)
+            if name in self._class_ids_by_name
+        ), dtype=np.int32)
+    
+    def class_id_mask(
+        self,
+        class_ids: np.ndarray,
+        class_names: Iterable[str]
+    ) -> np.ndarray:
+        """
+        Boolean mask of the class IDs that belong to the given class names
+        
+        Array counterpart of filter_by_class for raw YOLO outputs, where
+        class IDs sit in an array parallel to the boxes.
+        
+        Args:
+            class_ids: Model class IDs, one per box
+            class_names: Class names to keep (unknown names are ignored)
+            
+        Returns:
+            Boolean array, True where the box should be kept
+        """
+        return np.isin(np.asarray(class_ids, dtype=np.int32), self.class_ids_for(class_names))
     
     def get_largest_detection(
         self,
@@ -409,11 +1051,8 @@ class ObjectDetector:
         if not detections:
             return None
         
-        def bbox_area(detection: DetectionResult) -> int:
-            x1, y1, x2, y2 = detection.bbox
-            return (x2 - x1) * (y2 - y1)
-        
-        return max(detections, key=bbox_area)
+        areas = _bbox_areas(_bbox_array(detections))
+        return detections[int(areas.argmax())]
     
     def get_closest_to_center(
         self,
@@ -433,16 +1072,63 @@ class ObjectDetector:
         if not detections:
             return None
         
-        height, width = frame_shape[:2]
-        frame_center = (width // 2, height // 2)
+        distances_sq = _center_distances_sq(detections, frame_shape)
+        return detections[int(distances_sq.argmin())]
+    
+    def get_largest_detections(
+        self,
+        detections_per_frame: List[List[DetectionResult]]
+    ) -> List[Optional[DetectionResult]]:
+        """
+        Get the largest detection of every frame in a batch
+        
+        Args:
+            detections_per_frame: Detections for each frame (e.g. from detect_batch)
+            
+        Returns:
+            Largest detection per frame, or None for frames without detections
+        """
+        flat = [d for detections in detections_per_frame for d in detections]
+        return self._select_per_frame(
+            detections_per_frame, _bbox_areas(_bbox_array(flat)), maximize=True
+        )
+    
+    def get_closest_to_center_batch(
+        self,
+        detections_per_frame: List[List[DetectionResult]],
+        frame_shape: Tuple[int, int]
+    ) -> List[Optional[DetectionResult]]:
+        """
+        Get the detection closest to the frame center for every frame in a batch
+        
+        Args:
+            detections_per_frame: Detections for each frame (e.g. from detect_batch)
+            frame_shape: (height, width) shared by all frames
+            
+        Returns:
+            Closest detection per frame, or None for frames without detections
+        """
+        flat = [d for detections in detections_per_frame for d in detections]
+        return self._select_per_frame(
+            detections_per_frame, _center_distances_sq(flat, frame_shape), maximize=False
+        )
+    
+    def _select_per_frame(
+        self,
+        detections_per_frame: List[List[DetectionResult]],
+        scores: np.ndarray,
+        maximize: bool
+    ) -> List[Optional[DetectionResult]]:
+        """Pick one detection per frame from scores over the flattened batch"""
+        offsets = np.zeros(len(detections_per_frame) + 1, dtype=np.int64)
+        np.cumsum([len(detections) for detections in detections_per_frame], out=offsets[1:])
         
-        def distance_to_center(detection: DetectionResult) -> float:
-            cx, cy = detection.center
-            dx = cx - frame_center[0]
-            dy = cy - frame_center[1]
-            return (dx ** 2 + dy ** 2) ** 0.5
+        best = _segment_argbest(scores, offsets, maximize)
         
-        return min(detections, key=distance_to_center)
+        return [
+            detections[index] if index >= 0 else None
+            for detections, index in zip(detections_per_frame, best.tolist())
+        ]
     
     def __repr__(self) -> str:
         """String representation"""
@@ -0,0 +1,249 @@
+"""
+Pipelined Object Detector
+
+Runs frame capture, YOLO inference, and annotation in three threads joined
+by bounded queues, so that while frame N is being inferred, frame N+1 is
+being decoded and frame N-1 is being drawn. Throughput approaches the
+slowest stage instead of the sum of all three.
+
+Example:
+    from src.ai.object_detector import ObjectDetector
+    from src.ai.pipelined_detector import PipelinedDetector
+    
+    detector = ObjectDetector(model_path='yolov8n.pt')
+    pipeline = PipelinedDetector(detector, prefetch=4)
+    
+    capture = cv2.VideoCapture('video.mp4')
+    writer = cv2.VideoWriter('out.mp4', fourcc, 30, (width, height))
+    
+    pipeline.run(capture, sink=lambda idx, frame, dets: writer.write(frame))
+"""
+
+import cv2
+import logging
+import threading
+import time
+from queue import Queue, Empty, Full
+from typing import Callable, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .object_detector import ObjectDetector, DetectionResult
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Marks the end of the stream on a queue
+_SENTINEL = None
+
+FrameSink = Callable[[int, np.ndarray, List[DetectionResult]], None]
+
+
+class PipelinedDetector:
+    """
+    Overlap capture, detection, and drawing across three threads
+    
+    A single worker thread calls the detector, so the model is never used
+    from two threads at once. Bounded queues apply back-pressure: a fast
+    reader blocks instead of buffering the whole video in memory.
+    """
+    
+    def __init__(
+        self,
+        detector: ObjectDetector,
+        prefetch: int = 4,
+        draw: bool = True
+    ):
+        """
+        Initialize pipelined detector
+        
+        Args:
+            detector: ObjectDetector used by the inference stage
+            prefetch: Maximum frames waiting between stages
+            draw: Annotate frames with detections before passing them on
+        """
+        self.detector = detector
+        self.prefetch = max(1, prefetch)
+        self.draw = draw
+        
+        self.read_queue: Queue = Queue(maxsize=self.prefetch)
+        self.write_queue: Queue = Queue(maxsize=self.prefetch)
+        
+        # Thread control
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        
+        # Statistics
+        self.frames_read = 0
+        self.frames_processed = 0
+        
+        logger.info(f"PipelinedDetector initialized (prefetch={self.prefetch})")
+    
+    def start(
+        self,
+        source: Union[cv2.VideoCapture, Iterable[np.ndarray]],
+        sink: Optional[FrameSink] = None
+    ) -> 'PipelinedDetector':
+        """
+        Start the reader, inference, and writer threads
+        
+        Args:
+            source: cv2.VideoCapture or any iterable of BGR frames
+            sink: Called as sink(frame_number, frame, detections) for each
+                  frame, in order, from the writer thread
+        
+        Returns:
+            Self for chaining
+        """
+        if self.is_running():
+            raise RuntimeError("Pipeline is already running")
+        
+        self._stop_event.clear()
+        self.read_queue = Queue(maxsize=self.prefetch)
+        self.write_queue = Queue(maxsize=self.prefetch)
+        self.frames_read = 0
+        self.frames_processed = 0
+        
+        self._threads = [
+            threading.Thread(target=self._read_loop, args=(source,), name="pipeline-read", daemon=True),
+            threading.Thread(target=self._detect_loop, name="pipeline-detect", daemon=True),
+            threading.Thread(target=self._write_loop, args=(sink,), name="pipeline-write", daemon=True)
+        ]
+        
+        for thread in self._threads:
+            thread.start()
+        
+        return self
+    
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for all stages to finish"""
+        for thread in self._threads:
+            thread.join(timeout)
+    
+    def run(
+        self,
+        source: Union[cv2.VideoCapture, Iterable[np.ndarray]],
+        sink: Optional[FrameSink] = None
+    ) -> int:
+        """
+        Process a whole source and block until done
+        
+        Args:
+            source: cv2.VideoCapture or any iterable of BGR frames
+            sink: Per-frame callback (see start())
+        
+        Returns:
+            Number of frames processed
+        """
+        self.start(source, sink)
+        self.join()
+        return self.frames_processed
+    
+    def stop(self) -> None:
+        """Stop all stages early"""
+        self._stop_event.set()
+        self.join(timeout=2.0)
+    
+    def is_running(self) -> bool:
+        """Check whether any stage is still running"""
+        return any(thread.is_alive() for thread in self._threads)
+    
+    def _put(self, queue: Queue, item) -> bool:
+        """
+        Put an item, waiting for space until the pipeline is stopped
+        
+        Returns:
+            False if the pipeline was stopped before the item was queued
+        """
+        while not self._stop_event.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+    
+    def _get(self, queue: Queue):
+        """Get an item, returning the sentinel if the pipeline is stopped"""
+        while not self._stop_event.is_set():
+            try:
+                return queue.get(timeout=0.1)
+            except Empty:
+                continue
+        return _SENTINEL
+    
+    def _frames(self, source: Union[cv2.VideoCapture, Iterable[np.ndarray]]):
+        """Yield frames from a capture device or an iterable"""
+        if isinstance(source, cv2.VideoCapture):
+            while True:
+                ret, frame = source.read()
+                if not ret:
+                    return
+                yield frame
+        else:
+            yield from source
+    
+    def _read_loop(self, source: Union[cv2.VideoCapture, Iterable[np.ndarray]]) -> None:
+        """Stage 1: decode frames and timestamp them as they arrive"""
+        try:
+            for frame_number, frame in enumerate(self._frames(source)):
+                # Stamp at read time, which is when the frame was captured
+                if not self._put(self.read_queue, (frame_number, time.time(), frame)):
+                    return
+                self.frames_read += 1
+        except Exception as e:
+            logger.error(f"Pipeline reader failed: {e}")
+        finally:
+            self._put(self.read_queue, _SENTINEL)
+    
+    def _detect_loop(self) -> None:
+        """Stage 2: run inference (single thread owns the model)"""
+        try:
+            while True:
+                item = self._get(self.read_queue)
+                
+                if item is _SENTINEL:
+                    return
+                
+                frame_number, timestamp, frame = item
+                detections = self.detector.detect(frame, frame_number, timestamp)
+                
+                if not self._put(self.write_queue, (frame_number, frame, detections)):
+                    return
+        except Exception as e:
+            logger.error(f"Pipeline inference failed: {e}")
+            self._stop_event.set()
+        finally:
+            self._put(self.write_queue, _SENTINEL)
+    
+    def _write_loop(self, sink: Optional[FrameSink]) -> None:
+        """Stage 3: annotate frames and hand them to the sink"""
+        try:
+            while True:
+                item = self._get(self.write_queue)
+                
+                if item is _SENTINEL:
+                    return
+                
+                frame_number, frame, detections = item
+                
+                # The writer owns the frame by now, so draw without copying
+                if self.draw:
+                    frame = self.detector.draw_detections(frame, detections, inplace=True)
+                
+                if sink is not None:
+                    sink(frame_number, frame, detections)
+                
+                self.frames_processed += 1
+        except Exception as e:
+            logger.error(f"Pipeline writer failed: {e}")
+            self._stop_event.set()
+    
+    def __repr__(self) -> str:
+        """String representation"""
+        return (
+            f"PipelinedDetector(prefetch={self.prefetch}, "
+            f"processed={self.frames_processed})"
+        )
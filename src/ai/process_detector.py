@@ -0,0 +1,313 @@
+"""
+Process-Isolated Object Detector
+
+Runs an ObjectDetector in a child process so that inference and its Python
+post-processing never compete with the capture and tracking threads for
+the GIL. Frames cross the process boundary through a shared-memory block
+(no pickling of pixel data); only small metadata and the resulting
+DetectionResult lists travel over multiprocessing queues.
+
+Example:
+    from src.ai.process_detector import ProcessDetector
+    
+    detector = ProcessDetector(model_path='yolov8n.pt', device='cpu')
+    
+    ids = detector.class_ids_for(['person'])
+    detections = detector.detect(frame, class_ids=ids)
+    
+    detector.close()
+"""
+
+import logging
+import multiprocessing as mp
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .object_detector import ObjectDetector, DetectionResult
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _detector_process(
+    detector_factory: Callable[..., ObjectDetector],
+    detector_kwargs: dict,
+    shm_name: str,
+    slot_bytes: int,
+    requests,
+    results
+) -> None:
+    """
+    Child process entry point: build the detector and serve requests
+    
+    Each request is (frame_specs, frame_numbers, timestamps, class_ids,
+    min_confidence), where frame_specs lists the (slot, shape) of every
+    frame already written to shared memory. None shuts the process down.
+    Replies are ('ok', payload) or ('error', message).
+    """
+    shm = SharedMemory(name=shm_name)
+    
+    try:
+        try:
+            detector = detector_factory(**detector_kwargs)
+        except Exception as e:
+            results.put(('error', f"Failed to create detector: {e!r}"))
+            return
+        
+        results.put(('ok', dict(detector.class_names)))
+        
+        while True:
+            request = requests.get()
+            
+            if request is None:
+                return
+            
+            frame_specs, frame_numbers, timestamps, class_ids, min_confidence = request
+            
+            try:
+                # Views into shared memory; the parent doesn't touch these
+                # slots again until it has our reply
+                frames = [
+                    np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+                    for slot, shape in frame_specs
+                ]
+                
+                batch = detector.detect_batch(
+                    frames,
+                    frame_numbers=frame_numbers,
+                    timestamps=timestamps,
+                    class_ids=class_ids,
+                    min_confidence=min_confidence
+                )
+                del frames
+                
+                results.put(('ok', batch))
+            except Exception as e:
+                results.put(('error', repr(e)))
+    finally:
+        shm.close()
+
+
+class ProcessDetector:
+    """
+    ObjectDetector running in a separate process
+    
+    Exposes the detector methods the tracking engine uses (detect,
+    detect_batch, class_ids_for), so it can be passed wherever an
+    ObjectDetector is expected for inference. Calls block the calling
+    thread until the child replies, but the wait releases the GIL.
+    Calls are serialized, so one instance may be shared between threads.
+    """
+    
+    def __init__(
+        self,
+        max_frame_shape: Tuple[int, int, int] = (1080, 1920, 3),
+        slots: int = 4,
+        start_method: str = 'spawn',
+        startup_timeout: float = 120.0,
+        detector_factory: Callable[..., ObjectDetector] = ObjectDetector,
+        **detector_kwargs
+    ):
+        """
+        Start the detector process
+        
+        Args:
+            max_frame_shape: Largest (height, width, channels) frame accepted
+            slots: Frames sent to the child per round trip (larger batches
+                   are split)
+            start_method: multiprocessing start method; 'spawn' is safe with
+                          CUDA and threads in the parent
+            startup_timeout: Seconds to wait for the model to load
+            detector_factory: Picklable callable that builds the detector in
+                              the child (default: ObjectDetector)
+            **detector_kwargs: Passed to detector_factory
+        
+        Raises:
+            RuntimeError: If the child fails to create the detector in time
+        """
+        self.max_frame_shape = tuple(max_frame_shape)
+        self.slots = max(1, slots)
+        self._slot_bytes = int(np.prod(self.max_frame_shape))
+        self._lock = threading.Lock()
+        self._closed = False
+        
+        ctx = mp.get_context(start_method)
+        self._shm = SharedMemory(create=True, size=self._slot_bytes * self.slots)
+        self._requests = ctx.Queue()
+        self._results = ctx.Queue()
+        
+        self._process = ctx.Process(
+            target=_detector_process,
+            args=(
+                detector_factory, detector_kwargs, self._shm.name,
+                self._slot_bytes, self._requests, self._results
+            ),
+            name="detector-process",
+            daemon=True
+        )
+        self._process.start()
+        
+        try:
+            self.class_names: Dict[int, str] = self._reply(startup_timeout)
+        except Exception:
+            self.close()
+            raise
+        
+        self._class_ids_by_name = {name: class_id for class_id, name in self.class_names.items()}
+        
+        logger.info(
+            f"ProcessDetector started (pid={self._process.pid}, "
+            f"slots={self.slots}, max frame={self.max_frame_shape})"
+        )
+    
+    def detect(
+        self,
+        frame: np.ndarray,
+        frame_number: int = 0,
+        timestamp: Optional[float] = None,
+        class_ids: Optional[np.ndarray] = None,
+        min_confidence: Optional[float] = None
+    ) -> List[DetectionResult]:
+        """
+        Detect objects in a single frame (see ObjectDetector.detect)
+        """
+        timestamps = None if timestamp is None else [timestamp]
+        return self.detect_batch(
+            [frame], [frame_number], timestamps,
+            class_ids=class_ids, min_confidence=min_confidence
+        )[0]
+    
+    def detect_batch(
+        self,
+        frames: List[np.ndarray],
+        frame_numbers: Optional[List[int]] = None,
+        timestamps: Optional[List[float]] = None,
+        class_ids: Optional[np.ndarray] = None,
+        min_confidence: Optional[float] = None
+    ) -> List[List[DetectionResult]]:
+        """
+        Detect objects in several frames (see ObjectDetector.detect_batch)
+        
+        Frames are copied into shared memory, up to `slots` per round trip.
+        
+        Raises:
+            ValueError: If a frame is not uint8 or exceeds max_frame_shape
+            RuntimeError: If the detector process has stopped or reports an error
+        """
+        if not frames:
+            return []
+        
+        if frame_numbers is None:
+            frame_numbers = list(range(len(frames)))
+        
+        results: List[List[DetectionResult]] = []
+        
+        with self._lock:
+            for start in range(0, len(frames), self.slots):
+                end = start + self.slots
+                chunk_timestamps = None if timestamps is None else list(timestamps[start:end])
+                
+                frame_specs = [
+                    (slot, self._write_slot(slot, frame))
+                    for slot, frame in enumerate(frames[start:end])
+                ]
+                
+                self._requests.put((
+                    frame_specs, list(frame_numbers[start:end]), chunk_timestamps,
+                    class_ids, min_confidence
+                ))
+                results.extend(self._reply())
+        
+        return results
+    
+    def class_ids_for(self, class_names: Iterable[str]) -> np.ndarray:
+        """
+        Model class IDs for the given class names (see ObjectDetector.class_ids_for)
+        """
+        return np.array(sorted(
+            self._class_ids_by_name[name] for name in set(class_names)
+            if name in self._class_ids_by_name
+        ), dtype=np.int32)
+    
+    def _write_slot(self, slot: int, frame: np.ndarray) -> Tuple[int, ...]:
+        """Copy a frame into a shared-memory slot, returning its shape"""
+        if frame.dtype != np.uint8:
+            raise ValueError(f"Expected uint8 frame, got {frame.dtype}")
+        
+        if frame.nbytes > self._slot_bytes or frame.ndim != len(self.max_frame_shape):
+            raise ValueError(
+                f"Frame shape {frame.shape} exceeds max_frame_shape {self.max_frame_shape}"
+            )
+        
+        view = np.ndarray(
+            frame.shape, dtype=np.uint8, buffer=self._shm.buf,
+            offset=slot * self._slot_bytes
+        )
+        view[...] = frame
+        return frame.shape
+    
+    def _reply(self, timeout: Optional[float] = None):
+        """
+        Wait for the child's next reply
+        
+        Polls so that a crashed child is reported instead of hanging forever.
+        """
+        waited = 0.0
+        
+        while True:
+            try:
+                status, payload = self._results.get(timeout=0.5)
+                break
+            except Empty:
+                waited += 0.5
+                if not self._process.is_alive():
+                    raise RuntimeError("Detector process exited unexpectedly")
+                if timeout is not None and waited >= timeout:
+                    raise RuntimeError(f"Detector process did not reply within {timeout}s")
+        
+        if status == 'error':
+            raise RuntimeError(f"Detector process error: {payload}")
+        
+        return payload
+    
+    def is_alive(self) -> bool:
+        """Check whether the detector process is running"""
+        return not self._closed and self._process.is_alive()
+    
+    def close(self) -> None:
+        """Stop the detector process and release shared memory"""
+        if self._closed:
+            return
+        
+        self._closed = True
+        
+        if self._process.is_alive():
+            self._requests.put(None)
+            self._process.join(timeout=5.0)
+            
+            if self._process.is_alive():
+                logger.warning("Detector process did not exit, terminating")
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+        
+        self._shm.close()
+        self._shm.unlink()
+        
+        logger.info("ProcessDetector stopped")
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+    
+    def __repr__(self) -> str:
+        """String representation"""
+        return f"ProcessDetector(pid={self._process.pid}, alive={self.is_alive()})"
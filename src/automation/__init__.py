@@ -2,15 +2,13 @@
 Automation Module
 
 Automated tracking logic and coordination of all system components.
+
+Names are loaded on first access (PEP 562), so importing the package does
+not pull in the tracking engine and its OpenCV/YOLO dependencies until
+one of them is actually used.
 """
 
-from .tracking_engine import (
-    TrackingEngine,
-    TrackingConfig,
-    TrackingZone,
-    TrackingMode,
-    TrackingEvent
-)
+from importlib import import_module
 
 __all__ = [
     'TrackingEngine',
@@ -19,3 +17,22 @@ __all__ = [
     'TrackingMode',
     'TrackingEvent'
 ]
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {name: '.tracking_engine' for name in __all__}
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -22,8 +22,12 @@ import cv2
 import logging
 import time
 import threading
-from typing import Optional, Dict, List, Callable
-from dataclasses import dataclass, field
+from math import copysign
+import numpy as np
+from collections import deque
+from queue import Queue, Empty, Full
+from typing import Optional, Deque, Dict, List, Tuple, Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from src.ai.object_detector import ObjectDetector, DetectionResult
@@ -31,11 +35,133 @@ from src.ai.motion_tracker import MotionTracker, Direction, TrackInfo
 from src.camera.ptz_controller import PTZController
 from src.video.stream_handler import VideoStreamHandler
 
+# Numba is optional - the association kernel below runs as plain Python without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _log_noop(*args, **kwargs) -> None:
+    """Stands in for a logger method whose level is disabled"""
+
+
+def _put_latest(queue: Queue, item) -> None:
+    """Put item without blocking, discarding the oldest entry if the queue is full"""
+    while True:
+        try:
+            queue.put_nowait(item)
+            return
+        except Full:
+            try:
+                queue.get_nowait()
+            except Empty:
+                pass
+
+
+@njit(cache=True, fastmath=True)
+def _greedy_associate(det_xy, det_cls, track_xy, track_cls, max_dist_sq):
+    """
+    Match detections to tracks closest pair first
+    
+    Candidate pairs (same class, squared distance below max_dist_sq) are
+    visited in order of distance, ties in (detection, track) order, and a
+    pair is taken when neither side is matched yet. That is the same
+    result as repeatedly taking the argmin of the distance matrix.
+    
+    Args:
+        det_xy: (M, 2) float32 detection centers
+        det_cls: (M,) int32 detection class IDs
+        track_xy: (N, 2) float32 track centroids
+        track_cls: (N,) int32 track class IDs
+        max_dist_sq: Squared association distance (exclusive)
+    
+    Returns:
+        (M,) track row matched to each detection, -1 for new objects
+    """
+    num_dets = det_xy.shape[0]
+    num_tracks = track_xy.shape[0]
+    matched_rows = np.full(num_dets, -1, dtype=np.intp)
+    
+    pair_dist = np.empty(num_dets * num_tracks, dtype=np.float64)
+    pair_index = np.empty(num_dets * num_tracks, dtype=np.intp)
+    num_pairs = 0
+    
+    for i in range(num_dets):
+        for j in range(num_tracks):
+            if det_cls[i] != track_cls[j]:
+                continue
+            
+            dx = np.float64(det_xy[i, 0]) - track_xy[j, 0]
+            dy = np.float64(det_xy[i, 1]) - track_xy[j, 1]
+            dist_sq = dx * dx + dy * dy
+            
+            if dist_sq < max_dist_sq:
+                pair_dist[num_pairs] = dist_sq
+                pair_index[num_pairs] = i * num_tracks + j
+                num_pairs += 1
+    
+    # Stable sort keeps (detection, track) order among equal distances
+    order = np.argsort(pair_dist[:num_pairs], kind='mergesort')
+    track_taken = np.zeros(num_tracks, dtype=np.bool_)
+    remaining = min(num_dets, num_tracks)
+    
+    for k in order:
+        i, j = divmod(pair_index[k], num_tracks)
+        
+        if matched_rows[i] >= 0 or track_taken[j]:
+            continue
+        
+        matched_rows[i] = j
+        track_taken[j] = True
+        remaining -= 1
+        
+        if remaining == 0:
+            break
+    
+    return matched_rows
+
+
+def _warmup_kernels() -> None:
+    """Compile the association kernel up front so the first frame isn't penalized"""
+    xy = np.zeros((1, 2), dtype=np.float32)
+    cls = np.zeros(1, dtype=np.int32)
+    _greedy_associate(xy, cls, xy, cls, 1.0)
+
+
+if NUMBA_AVAILABLE:
+    _warmup_kernels()
+
+
+def _rescale_detections(
+    detections: List[DetectionResult],
+    scale_x: float,
+    scale_y: float
+) -> List[DetectionResult]:
+    """Map detections from a resized frame back to full-frame pixel coordinates"""
+    scaled = []
+    for detection in detections:
+        x1, y1, x2, y2 = detection.bbox
+        cx, cy = detection.center
+        scaled.append(replace(
+            detection,
+            bbox=(round(x1 * scale_x), round(y1 * scale_y), round(x2 * scale_x), round(y2 * scale_y)),
+            center=(round(cx * scale_x), round(cy * scale_y))
+        ))
+    return scaled
+
+
 class TrackingMode(Enum):
     """Tracking modes"""
     CENTER = "center"       # Center-based tracking (current default)
@@ -81,6 +207,24 @@ class TrackingConfig:
         home_preset: Preset to return to when inactive (e.g., 'Preset004')
         inactivity_timeout: Seconds before returning to home position
         quadrant_tracking: Configuration for quadrant-based tracking
+        inference_interval: Process every Nth frame from the stream; the
+                            frames in between are grabbed and dropped
+        detector_batch_size: Submitted frames sent to the detector per
+                             forward pass; PTZ acts on the last of each batch
+        detector_max_latency: Seconds a partial batch may wait for more
+                              frames before it is sent anyway
+        motion_gate_pixels: Skip detection on frames where fewer than this
+                            many pixels of a 160x90 thumbnail changed since
+                            the previous frame (0 disables the gate)
+        motion_gate_method: 'diff' compares each thumbnail with the previous
+                            one; 'mog2' counts foreground pixels from a MOG2
+                            background model, which also catches slow movers
+        detection_max_width: Wider frames are downscaled to this width before
+                             the motion gate and the detector
+        completed_event_history: Completed events kept in memory; the oldest
+                                 are dropped once this many have finished
+        event_sweep_interval: Processed frames between sweeps that close
+                              events not updated for max_tracking_age seconds
     """
     zones: List[TrackingZone] = field(default_factory=list)
     target_classes: List[str] = field(default_factory=lambda: ['person'])
@@ -93,12 +237,23 @@ class TrackingConfig:
     home_preset: str = "Preset004"
     inactivity_timeout: float = 5.0
     quadrant_tracking: Dict = field(default_factory=dict)
+    inference_interval: int = 3
+    detector_batch_size: int = 4
+    detector_max_latency: float = 0.1
+    motion_gate_pixels: int = 50
+    motion_gate_method: str = "diff"
+    detection_max_width: int = 1280
+    completed_event_history: int = 10000
+    event_sweep_interval: int = 30
 
-@dataclass
+@dataclass(slots=True)
 class TrackingEvent:
     """
     Represents a tracking event (subject detected and tracked)
     
+    Slotted: one is created per tracked object and up to
+    completed_event_history of them stay in memory.
+    
     Attributes:
         event_id: Unique event identifier
         object_id: Tracked object ID
@@ -106,9 +261,10 @@ class TrackingEvent:
         direction: Movement direction
         start_time: Event start timestamp
         end_time: Event end timestamp (None if ongoing)
-        zone_transitions: List of zones object moved through
-        ptz_actions: List of PTZ preset changes triggered
+        zone_transitions: Zones object moved through (consecutive repeats collapsed)
+        ptz_actions: PTZ preset changes triggered (consecutive repeats collapsed)
         frame_count: Number of frames tracked
+        last_update_time: Timestamp of the latest frame recorded
     """
     event_id: str
     object_id: str
@@ -119,6 +275,7 @@ class TrackingEvent:
     zone_transitions: List[str] = field(default_factory=list)
     ptz_actions: List[str] = field(default_factory=list)
     frame_count: int = 0
+    last_update_time: float = 0.0
 
 
 class TrackingEngine:
@@ -133,6 +290,38 @@ class TrackingEngine:
     5. Execute PTZ movement to follow subject
     """
     
+    # Center-tracking dead zone (pixels from frame center with no pan/tilt)
+    # Reduced from 40px so subjects near the edges trigger movement immediately
+    _DEAD_ZONE_X = 20
+    _DEAD_ZONE_Y = 20
+    
+    # Minimum seconds between tracking-loop error reports; errors in between
+    # are counted and summarized in the next report
+    ERROR_LOG_COOLDOWN = 5.0
+    
+    # Tracking-loop retry delay after consecutive errors: doubles from the
+    # base per error, capped at the max
+    ERROR_BACKOFF_BASE = 0.1
+    ERROR_BACKOFF_MAX = 1.0
+    
+    # Minimum seconds between centering moves; short, so the camera keeps
+    # up with walking subjects
+    CENTER_TRACKING_COOLDOWN = 0.05
+    
+    # Centering moves within PTZ_VELOCITY_EPSILON (on every axis) of the
+    # last one sent, less than PTZ_RESEND_INTERVAL seconds ago, are skipped;
+    # the interval is shorter than a move's 0.15s duration
+    PTZ_VELOCITY_EPSILON = 0.05
+    PTZ_RESEND_INTERVAL = 0.1
+    
+    # Largest detector window; bigger batches stop paying off and raise
+    # GPU memory pressure
+    MAX_DETECTOR_BATCH = 16
+    
+    # Motion gate: thumbnail size (width, height) and per-pixel change threshold
+    _MOTION_GATE_SIZE = (160, 90)
+    _MOTION_GATE_DIFF = 20
+    
     def __init__(
         self,
         detector: ObjectDetector,
@@ -157,6 +346,11 @@ class TrackingEngine:
         self.stream = stream_handler
         self.config = config
         
+        # Detection filter, resolved once: the detector drops other classes
+        # and low-confidence boxes before building DetectionResult objects
+        self._target_classes = frozenset(config.target_classes)
+        self._target_class_ids = detector.class_ids_for(self._target_classes)
+        
         # State
         self.running = False
         self.paused = False
@@ -164,6 +358,9 @@ class TrackingEngine:
         self.thread: Optional[threading.Thread] = None
         
         # Tracking state
+        # Cooldown and inactivity timestamps come from the monotonic clock
+        # (bound once here), so wall-clock adjustments can't break them
+        self._monotonic = time.monotonic
         self.current_preset: Optional[str] = None
         self.last_ptz_time: float = 0.0
         self.last_movement_time: float = 0.0  # Track inactivity for home return
@@ -176,19 +373,40 @@ class TrackingEngine:
         # This allows manual controls to work while protecting preset movements from auto-tracking
         self.preset_lock_active: bool = False  # Flag for preset-specific locking
         self.preset_lock_cooldown: float = 2.0  # Seconds to lock out auto-tracking after preset selection
-        self.preset_lock_time: float = 0.0  # Timestamp when preset was selected
+        self.preset_lock_time: float = 0.0  # time.monotonic() when preset was selected
         
         self.active_events: Dict[str, TrackingEvent] = {}
-
-        self.completed_events: List[TrackingEvent] = []
+        
+        # Guards adding/removing events against snapshot readers on other
+        # threads (web API). Per-frame updates of an existing event don't
+        # take it: the action thread is the only writer.
+        self._state_lock = threading.Lock()
+        
+        # Bumped (under the lock) whenever an event is added or closed; the
+        # getters rebuild their cached tuple only when it has moved on
+        self._events_version = 0
+        self._sweep_counter = 0  # Processed frames since the last stale-event sweep
+        self._active_snapshot: Tuple[int, Tuple[TrackingEvent, ...]] = (0, ())
+        self._completed_snapshot: Tuple[int, Tuple[TrackingEvent, ...]] = (0, ())
+        
+        # Bounded so a long-running deployment doesn't accumulate events forever
+        self.completed_events: Deque[TrackingEvent] = deque(maxlen=config.completed_event_history)
         self.event_counter = 0
         
         # Centroid-based object tracking (to assign stable IDs)
+        # Rows [0, _centroid_count) of each array describe one tracked object;
+        # capacity grows by doubling so new tracks don't reallocate every frame
         self.next_object_id = 0
-        self.object_centroids: Dict[int, tuple[int, int]] = {}  # object_id -> (x, y)
         self.max_centroid_distance = 50  # pixels - max distance to associate same object
         self.centroid_max_age = 30  # frames before removing inactive track
-        self.centroid_ages: Dict[int, int] = {}  # Track age in frames
+        self._centroid_count = 0
+        self._centroid_ids = np.empty(16, dtype=np.int64)
+        self._centroid_xy = np.empty((16, 2), dtype=np.float32)
+        self._centroid_ages = np.empty(16, dtype=np.int32)  # Frames since last match
+        self._centroid_cls = np.empty(16, dtype=np.int32)  # Model class ID (see _class_code)
+        # Negative stand-in IDs for detections built without a class_id
+        self._class_codes: Dict[str, int] = {}
+        self._id_strs: Dict[int, str] = {}  # Live track ID → str form for the motion tracker
         
         # Statistics
         self.frame_count = 0
@@ -197,6 +415,28 @@ class TrackingEngine:
         self.ptz_movement_count = 0
         self.zoom_frame_counter = 0  # Skip zoom every other frame
         self.last_bbox_area = None  # Track previous frame's bbox area for distance trend
+        self._skip_counter = 0  # Frames grabbed since tracking started
+        # Motion-gate buffers, written in place every frame: the resized
+        # thumbnail, two gray slots (current/previous, flipped by _gray_idx),
+        # and the diff/threshold scratch
+        gate_width, gate_height = self._MOTION_GATE_SIZE
+        self._resize_buf = np.empty((gate_height, gate_width, 3), dtype=np.uint8)
+        self._gray_ring = [np.empty((gate_height, gate_width), dtype=np.uint8) for _ in range(2)]
+        self._gray_idx = 0
+        self._gray_primed = False  # Whether the previous slot holds a frame
+        self._diff_buf = np.empty((gate_height, gate_width), dtype=np.uint8)
+        self._bg_subtractor = None  # MOG2 model, created on first use
+        self.motion_skip_count = 0  # Frames the motion gate kept from the detector
+        self._last_error_time = float('-inf')  # Last reported tracking-loop error
+        self._error_count = 0  # Tracking-loop errors since the last report
+        self._error_streak = 0  # Consecutive tracking-loop errors (sets the backoff)
+        
+        # ((width, height), half_width, half_height, 1/half_width, 1/half_height)
+        # for the last frame size seen by _handle_tracking_action
+        self._geom_cache: Optional[tuple] = None
+        
+        # Zone bounds as parallel arrays for vectorized lookup (see _compile_zones)
+        self._compile_zones()
         
         # ⭐ QUADRANT TRACKING: Multi-zone tracking with preset switching
         self.quadrant_mode_enabled = False  # Toggle between center and quadrant tracking
@@ -204,20 +444,37 @@ class TrackingEngine:
         self.quadrant_config = config.quadrant_tracking  # Load from tracking_rules.yaml
         self.quadrant_zoom_counter = 0  # Track zoom application per quadrant entry
         
-        # ⭐ ASYNC DETECTION: Run detection in background to prevent blocking
-        # Detection runs on separate thread and caches results
+        # ⭐ PIPELINE: capture → detect → act, one thread per stage
+        # Stages hand off through small drop-oldest queues, so capture never
+        # waits on YOLO and PTZ commands never hold up the next inference
         self.detection_thread: Optional[threading.Thread] = None
+        self.action_thread: Optional[threading.Thread] = None
         self.detection_stop = False
-        self.pending_detection_frame: Optional[cv2.Mat] = None
-        self.pending_frame_lock = threading.Lock()
-        self.last_detection_results = []
-        self.detection_results_lock = threading.Lock()
+        
+        # ⭐ PTZ WORKER: centering moves go through a one-slot "latest wins"
+        # mailbox, so a slow camera never blocks the action stage; a move
+        # posted while another is in flight replaces the one still waiting
+        self.ptz_thread: Optional[threading.Thread] = None
+        self._ptz_cv = threading.Condition()
+        self._ptz_pending: Optional[dict] = None  # continuous_move kwargs
+        self.ptz_coalesced_count = 0  # Pending moves replaced before they were sent
+        self._last_sent_move = (0.0, 0.0, 0.0)  # (pan, tilt, zoom) of the last centering move
+        self._last_sent_time = float('-inf')  # time.monotonic() it was sent
+        self.ptz_suppressed_count = 0  # Moves skipped as repeats of the last one
+        # raw_queue: (frame, detection_frame, timestamp, capture_time, frame_number)
+        self.raw_queue: Queue = Queue(maxsize=max(2, config.detector_batch_size))
+        self.detected_queue: Queue = Queue(maxsize=2)  # (frames, detections per frame, capture times)
         
         # Cache recent detections for web overlay (no latency)
         self.last_detections = []
         self.overlay_detection_frame_skip = 0  # Counter for detection sampling
         self.overlay_detection_interval = 5  # Run detection every N frames (for web overlay only)
         
+        # Hot-path logging: bound once here so disabled levels cost a no-op call
+        # (re-create the engine to pick up a logging level change)
+        self._info = logger.info if logger.isEnabledFor(logging.INFO) else _log_noop
+        self._debug = logger.debug if logger.isEnabledFor(logging.DEBUG) else _log_noop
+        
         # Callbacks
         self.on_detection: Optional[Callable] = None
         self.on_tracking: Optional[Callable] = None
@@ -241,7 +498,7 @@ class TrackingEngine:
         self.running = True
         self.paused = False
         self.detection_stop = False
-        self.last_movement_time = time.time()  # Initialize inactivity timer
+        self.last_movement_time = self._monotonic()  # Initialize inactivity timer
         
         # Start main tracking thread
         self.thread = threading.Thread(target=self._tracking_loop, daemon=True)
@@ -252,13 +509,21 @@ class TrackingEngine:
         self.detection_thread = threading.Thread(target=self._detection_worker, daemon=True)
         self.detection_thread.start()
         
+        # ⭐ Start action thread (motion tracking + PTZ commands)
+        self.action_thread = threading.Thread(target=self._action_worker, daemon=True)
+        self.action_thread.start()
+        
+        # ⭐ Start PTZ worker (sends the latest centering move)
+        self.ptz_thread = threading.Thread(target=self._ptz_worker, daemon=True)
+        self.ptz_thread.start()
+        
         # ⭐ Start idle monitor thread (independent of tracking)
         # Monitors inactivity and returns to home preset even when tracking is OFF
         self.idle_monitor_running = True
         self.idle_monitor_thread = threading.Thread(target=self._idle_monitor_loop, daemon=True)
         self.idle_monitor_thread.start()
         
-        logger.info("✓ Tracking engine started (with async detection + idle monitor)")
+        logger.info("✓ Tracking engine started (capture/detect/act pipeline + idle monitor)")
     
     def stop(self) -> None:
         """Stop automated tracking"""
@@ -277,15 +542,27 @@ class TrackingEngine:
         if self.detection_thread and self.detection_thread.is_alive():
             self.detection_thread.join(timeout=5.0)
         
+        if self.action_thread and self.action_thread.is_alive():
+            self.action_thread.join(timeout=5.0)
+        
+        with self._ptz_cv:
+            self._ptz_cv.notify_all()
+        
+        if self.ptz_thread and self.ptz_thread.is_alive():
+            self.ptz_thread.join(timeout=5.0)
+        
         if self.idle_monitor_thread and self.idle_monitor_thread.is_alive():
             self.idle_monitor_thread.join(timeout=5.0)
         
         # Close any active events
-        for event in self.active_events.values():
-            event.end_time = time.time()
-            self.completed_events.append(event)
-        
-        self.active_events.clear()
+        with self._state_lock:
+            end_time = time.time()
+            for event in self.active_events.values():
+                event.end_time = end_time
+                self.completed_events.append(event)
+            
+            self.active_events.clear()
+            self._events_version += 1
         
         logger.info("✓ Tracking engine stopped")
     
@@ -315,105 +592,266 @@ class TrackingEngine:
         while self.idle_monitor_running:
             try:
                 # Monitor inactivity (works when tracking OFF, ON, or PAUSED)
-                current_time = time.time()
+                current_time = self._monotonic()
                 self._check_inactivity_and_return_home(current_time)
                 
                 time.sleep(check_interval)
                 
             except Exception as e:
-                logger.error(f"Error in idle monitor loop: {e}")
+                logger.error("Error in idle monitor loop: %s", e)
                 time.sleep(check_interval)
         
         logger.info("Idle monitor thread stopped")
     
     def _tracking_loop(self) -> None:
-        """Main tracking loop (runs in background thread)"""
+        """Capture stage: grab frames and submit every Nth one for detection"""
         logger.info("Entering tracking loop...")
         
+        # Only the per-frame work sits inside try; grab() and the counters
+        # can't fail, so paused ticks and skipped frames stay outside it
         while self.running:
+            if self.paused:
+                time.sleep(0.1)
+                continue
+            
+            # Grab every frame but only hand every Nth one to the
+            # pipeline; detection can't keep up with the stream anyway.
+            # Frames that will be processed are grabbed with latest=True
+            # so anything that queued up meanwhile is skipped, not chased
+            process = self._skip_counter % max(1, self.config.inference_interval) == 0
+            
+            if not self.stream.grab(timeout=1.0, latest=process):
+                logger.warning("No frame available from stream")
+                continue
+            
+            self.frame_count += 1
+            self._skip_counter += 1
+            
+            if not process:
+                continue
+            
             try:
-                if self.paused:
-                    time.sleep(0.1)
-                    continue
-                
-                # Read frame from stream
-                frame = self.stream.read(timeout=1.0)
-                
-                if frame is None:
-                    logger.warning("No frame available from stream")
-                    continue
-                
-                self.frame_count += 1
-                
-                # Process frame
-                self._process_frame(frame)
-                
+                # Hand off to the detection stage and go straight back to grabbing
+                self._submit_frame(self.stream.retrieve())
+                self._error_streak = 0
             except Exception as e:
-                logger.error(f"Error in tracking loop: {e}")
-                import traceback
-                traceback.print_exc()
-                time.sleep(0.1)
+                self._report_loop_error(e)
+                self._error_backoff()
         
         logger.info("Exiting tracking loop")
     
-    def _detection_worker(self) -> None:
+    def _report_loop_error(self, error: Exception) -> None:
         """
-        ⭐ ASYNC DETECTION THREAD
+        Log a tracking-loop error, at most once per ERROR_LOG_COOLDOWN
         
-        Runs continuously in background, performing expensive YOLOv8 detection
-        on frames submitted by main tracking loop. This prevents detection from
-        blocking frame processing and video streaming.
+        A persistent fault (lost stream, bad frames) would otherwise log a
+        full report on every frame. Call from the except block so the
+        report includes the stack trace.
         
-        Main loop: Acquire pending frame → Run detection → Cache results → Ready
+        Args:
+            error: Exception caught by the loop
+        """
+        self._error_count += 1
+        now = self._monotonic()
+        
+        if now - self._last_error_time < self.ERROR_LOG_COOLDOWN:
+            return
+        
+        suppressed = self._error_count - 1
+        self._last_error_time = now
+        self._error_count = 0
+        
+        logger.exception("Error in tracking loop: %r (suppressed %d)", error, suppressed)
+    
+    def _error_backoff(self) -> None:
+        """Sleep before retrying, longer for each consecutive loop error"""
+        delay = min(self.ERROR_BACKOFF_MAX, self.ERROR_BACKOFF_BASE * 2 ** self._error_streak)
+        self._error_streak += 1
+        time.sleep(delay)
+    
+    def _detection_worker(self) -> None:
+        """
+        ⭐ DETECTION STAGE
+        
+        Collects submitted frames from raw_queue into a window of
+        config.detector_batch_size (at most MAX_DETECTOR_BATCH) and runs them
+        through the detector in one batched call, which keeps a GPU busy
+        instead of paying launch overhead per frame. A window that hasn't
+        filled within config.detector_max_latency seconds of its first frame
+        is sent as is, so quiet scenes aren't held back. Each window's
+        results go to the action stage as one unit. Capture keeps running
+        while this thread is busy, and stale frames are dropped from the
+        queue rather than piling up.
+        
+        Main loop: Fill window → Run batched detection → Hand results to action stage
         """
         logger.info("Detection worker started")
         detection_count = 0
+        window = []  # (frame, detection_frame, timestamp, capture_time, frame_number)
+        window_start = 0.0  # time.monotonic() when the window's first frame arrived
         
         while not self.detection_stop:
             try:
-                # Check if there's a frame waiting for detection
-                with self.pending_frame_lock:
-                    if self.pending_detection_frame is None:
-                        # No frame waiting, wait a bit before checking again
-                        time.sleep(0.001)
-                        continue
+                batch_size = min(max(1, self.config.detector_batch_size), self.MAX_DETECTOR_BATCH)
+                max_latency = self.config.detector_max_latency
+                
+                # Wait no longer than the open window's remaining latency
+                timeout = 0.1
+                if window:
+                    timeout = min(timeout, max(0.0, window_start + max_latency - self._monotonic()))
+                
+                try:
+                    item = self.raw_queue.get(timeout=timeout) if timeout > 0 else self.raw_queue.get_nowait()
+                except Empty:
+                    item = None
+                
+                if item is not None:
+                    if not window:
+                        window_start = self._monotonic()
+                    window.append(item)
                     
-                    # Get the frame
-                    detection_frame = self.pending_detection_frame.copy()
-                    self.pending_detection_frame = None  # Mark frame as consumed
+                    # Take whatever else is already queued without waiting again
+                    while len(window) < batch_size:
+                        try:
+                            window.append(self.raw_queue.get_nowait())
+                        except Empty:
+                            break
                 
-                # ⭐ RUN EXPENSIVE DETECTION (this takes 50-100ms)
-                # But it runs on SEPARATE THREAD, so main loop doesn't block
-                detections = self.detector.detect(detection_frame)
+                if not window:
+                    continue
                 
-                # Filter by target classes and confidence
-                detections = [
-                    d for d in detections
-                    if d.class_name in self.config.target_classes
-                    and d.confidence >= self.config.min_confidence
+                if len(window) < batch_size and self._monotonic() - window_start < max_latency:
+                    continue
+                
+                frames, detection_frames, timestamps, capture_times, frame_numbers = zip(*window)
+                window = []
+                
+                # ⭐ RUN EXPENSIVE DETECTION (one forward pass for the window)
+                # Class and confidence filtering happens inside the detector
+                results = self.detector.detect_batch(
+                    list(detection_frames),
+                    frame_numbers=list(frame_numbers),
+                    timestamps=list(timestamps),
+                    class_ids=self._target_class_ids,
+                    min_confidence=self.config.min_confidence
+                )
+                
+                # Boxes from downsampled frames are scaled back to the full
+                # frame, which is what tracking and PTZ centering work in
+                results = [
+                    detections if not detections or detection_frame is frame
+                    else _rescale_detections(
+                        detections,
+                        frame.shape[1] / detection_frame.shape[1],
+                        frame.shape[0] / detection_frame.shape[0]
+                    )
+                    for frame, detection_frame, detections in zip(frames, detection_frames, results)
                 ]
                 
-                # Cache results for main loop to use
-                with self.detection_results_lock:
-                    self.last_detection_results = detections
-                    detection_count += len(detections)
-                    
-                    # Debug log every 10 detections
-                    if detection_count % 10 == 0:
-                        logger.debug(f"[DETECTION_WORKER] Processed {detection_count} total detections, cached {len(detections)} for frame")
+                _put_latest(self.detected_queue, (frames, results, capture_times))
+                detection_count += sum(len(detections) for detections in results)
+                
+                self._debug(
+                    "[DETECTION_WORKER] Processed %d total detections, %d in this batch of %d",
+                    detection_count, sum(len(detections) for detections in results), len(frames)
+                )
                     
             except Exception as e:
-                logger.error(f"Error in detection worker: {e}")
+                logger.error("Error in detection worker: %s", e)
+                window = []
                 time.sleep(0.1)
         
         logger.info("Detection worker stopped")
     
+    def _action_worker(self) -> None:
+        """
+        ⭐ ACTION STAGE
+        
+        Consumes detection results in order and runs ID assignment, motion
+        tracking and PTZ control, so slow camera commands never delay the
+        next inference. Every frame of a batch updates the tracks, but only
+        the newest one may move the camera. A window's frames arrive here
+        back to back, so each carries its capture time for the motion
+        tracker rather than being stamped on arrival.
+        """
+        logger.info("Action worker started")
+        
+        while not self.detection_stop:
+            try:
+                try:
+                    frames, results, capture_times = self.detected_queue.get(timeout=0.1)
+                except Empty:
+                    continue
+                
+                last = len(frames) - 1
+                for index, (frame, detections, capture_time) in enumerate(zip(frames, results, capture_times)):
+                    self._process_detections(
+                        frame, detections, control_ptz=index == last, capture_time=capture_time
+                    )
+                
+            except Exception as e:
+                logger.error("Error in action worker: %s", e)
+                time.sleep(0.1)
+        
+        logger.info("Action worker stopped")
+    
+    def _send_ptz_move(self, **move) -> None:
+        """
+        Send a continuous_move, via the PTZ worker when it is running
+        
+        With the worker running this only posts the move and returns; a
+        move still waiting from before is dropped in favor of this one.
+        Otherwise (engine not started) the move is sent inline.
+        
+        Args:
+            **move: Keyword arguments for PTZController.continuous_move
+        """
+        if self.ptz_thread is None or not self.ptz_thread.is_alive():
+            self.ptz.continuous_move(**move)
+            return
+        
+        with self._ptz_cv:
+            if self._ptz_pending is not None:
+                self.ptz_coalesced_count += 1
+            self._ptz_pending = move
+            self._ptz_cv.notify()
+    
+    def _ptz_worker(self) -> None:
+        """
+        ⭐ PTZ STAGE
+        
+        Sends the most recently posted centering move; moves posted while
+        the camera is busy collapse into the newest one.
+        """
+        logger.info("PTZ worker started")
+        
+        while True:
+            with self._ptz_cv:
+                while self._ptz_pending is None and self.running:
+                    self._ptz_cv.wait()
+                
+                move = self._ptz_pending
+                self._ptz_pending = None
+            
+            if move is None:
+                break
+            
+            try:
+                self.ptz.continuous_move(**move)
+            except Exception as e:
+                logger.error("Failed to execute center tracking pan: %s", e)
+        
+        logger.info("PTZ worker stopped")
+    
     def _assign_object_ids(self, detections: List[DetectionResult]) -> List[tuple[int, DetectionResult]]:
         """
         Assign stable object IDs to detections using centroid tracking
         
         Uses distance-based association to match detections with existing object centroids.
         This ensures consistent IDs across frames for the same physical object.
+        Pairs are matched closest-first over the full distance matrix, a
+        detection only matches a track of the same class, and tracks
+        unmatched for more than centroid_max_age calls are dropped.
         
         Args:
             detections: List of detected objects
@@ -421,103 +859,226 @@ class TrackingEngine:
         Returns:
             List of (object_id, detection) tuples
         """
-        import math
+        count = self._centroid_count
+        ages = self._centroid_ages[:count]
+        
+        # Age all existing tracks and compact away the ones unseen for too long
+        ages += 1
+        keep = ages <= self.centroid_max_age
+        if not keep.all():
+            for stale_id in self._centroid_ids[:len(keep)][~keep].tolist():
+                self._id_strs.pop(stale_id, None)
+            
+            count = int(keep.sum())
+            self._centroid_ids[:count] = self._centroid_ids[:len(keep)][keep]
+            self._centroid_xy[:count] = self._centroid_xy[:len(keep)][keep]
+            self._centroid_ages[:count] = ages[keep]
+            self._centroid_cls[:count] = self._centroid_cls[:len(keep)][keep]
+            self._centroid_count = count
         
         if not detections:
-            # Age out old tracks
-            to_remove = [oid for oid in self.centroid_ages if self.centroid_ages[oid] > self.centroid_max_age]
-            for oid in to_remove:
-                if oid in self.object_centroids:
-                    del self.object_centroids[oid]
-                del self.centroid_ages[oid]
             return []
         
-        # Age all existing tracks
-        for oid in self.centroid_ages:
-            self.centroid_ages[oid] += 1
+        det_xy = np.asarray([d.center for d in detections], dtype=np.float32)
+        class_code = self._class_code
+        det_cls = np.fromiter(
+            (d.class_id if d.class_id >= 0 else class_code(d.class_name) for d in detections),
+            dtype=np.int32, count=len(detections)
+        )
         
-        assignments = []  # List of (object_id, detection)
-        used_ids = set()  # Track which existing IDs were matched
+        # Track row matched to each detection (-1 = new object)
+        matched_rows = _greedy_associate(
+            det_xy, det_cls, self._centroid_xy[:count], self._centroid_cls[:count],
+            float(self._max_centroid_dist_sq)
+        )
         
-        # Try to match each detection to existing centroids
-        for detection in detections:
-            det_x, det_y = detection.center
-            best_id = None
-            best_dist = self.max_centroid_distance
+        # Update matched tracks
+        matched = matched_rows >= 0
+        rows = matched_rows[matched]
+        self._centroid_xy[rows] = det_xy[matched]
+        self._centroid_ages[rows] = 0
+        
+        object_ids = np.empty(len(detections), dtype=np.int64)
+        object_ids[matched] = self._centroid_ids[rows]
+        
+        # Create new tracks for unmatched detections
+        new = ~matched
+        num_new = int(new.sum())
+        if num_new:
+            new_ids = np.arange(self.next_object_id, self.next_object_id + num_new, dtype=np.int64)
+            self.next_object_id += num_new
+            self._id_strs.update((new_id, str(new_id)) for new_id in new_ids.tolist())
+            object_ids[new] = new_ids
             
-            # Find closest centroid
-            for oid, (cx, cy) in self.object_centroids.items():
-                if oid in used_ids:  # Already matched to another detection
-                    continue
-                    
-                dist = math.sqrt((det_x - cx)**2 + (det_y - cy)**2)
-                
-                if dist < best_dist:
-                    best_dist = dist
-                    best_id = oid
-            
-            if best_id is not None:
-                # Found a matching track
-                self.object_centroids[best_id] = (det_x, det_y)
-                self.centroid_ages[best_id] = 0  # Reset age
-                used_ids.add(best_id)
-                assignments.append((best_id, detection))
-            else:
-                # Create new track
-                new_id = self.next_object_id
-                self.next_object_id += 1
-                self.object_centroids[new_id] = (det_x, det_y)
-                self.centroid_ages[new_id] = 0
-                used_ids.add(new_id)
-                assignments.append((new_id, detection))
+            end = count + num_new
+            if end > len(self._centroid_ids):
+                self._grow_centroids(end)
+            
+            self._centroid_ids[count:end] = new_ids
+            self._centroid_xy[count:end] = det_xy[new]
+            self._centroid_ages[count:end] = 0
+            self._centroid_cls[count:end] = det_cls[new]
+            self._centroid_count = end
         
-        return assignments
+        return list(zip(object_ids.tolist(), detections))
     
-    def _process_frame(self, frame) -> None:
+    def _class_code(self, class_name: str) -> int:
+        """Stand-in class ID (negative, so never a model ID) for a result without class_id"""
+        return self._class_codes.setdefault(class_name, -2 - len(self._class_codes))
+    
+    def _grow_centroids(self, min_capacity: int) -> None:
+        """Reallocate the centroid arrays with at least min_capacity rows"""
+        capacity = max(min_capacity, 2 * len(self._centroid_ids))
+        count = self._centroid_count
+        
+        for name in ('_centroid_ids', '_centroid_xy', '_centroid_ages', '_centroid_cls'):
+            old = getattr(self, name)
+            grown = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:count] = old[:count]
+            setattr(self, name, grown)
+    
+    @property
+    def max_centroid_distance(self) -> float:
+        """Max distance (pixels) to associate a detection with an existing object"""
+        return self._max_centroid_distance
+    
+    @max_centroid_distance.setter
+    def max_centroid_distance(self, value: float) -> None:
+        self._max_centroid_distance = value
+        self._max_centroid_dist_sq = value * value
+    
+    @property
+    def object_centroids(self) -> Dict[int, tuple[int, int]]:
+        """Current tracked centroids as {object_id: (x, y)}"""
+        return {
+            object_id: (int(x), int(y))
+            for object_id, (x, y) in zip(
+                self._centroid_ids[:self._centroid_count].tolist(),
+                self._centroid_xy[:self._centroid_count].tolist()
+            )
+        }
+    
+    def _submit_frame(self, frame) -> None:
         """
-        Process single frame through detection, tracking, and PTZ control pipeline
+        Downsample a captured frame, gate it on motion and queue it for the
+        detection stage
+        
+        Never blocks: if the detector is behind, the oldest waiting frame is
+        dropped so detection always runs on the newest one.
         
         Args:
             frame: OpenCV BGR image
         """
-        current_time = time.time()
+        # Frame skipping happens in _tracking_loop (config.inference_interval)
+        frame_height, frame_width = frame.shape[:2]
+        max_width = self.config.detection_max_width
+        
+        # ⭐ OPTIMIZATION: Downsample frame for detection to save CPU
+        # Done once up front: the motion gate below reads this smaller copy,
+        # so the full-size frame is only traversed by this one resize
+        if frame_width > max_width:
+            scale_factor = max_width / frame_width
+            detection_frame = cv2.resize(frame, (max_width, int(frame_height * scale_factor)), interpolation=cv2.INTER_LINEAR)
+        else:
+            detection_frame = frame
         
-        # ⭐ OPTIMIZATION: Frame skipping for detection
-        # Run detection every 3rd frame to reduce CPU usage by 40-50%
-        # Added latency: ~200ms (imperceptible at 15 FPS display rate)
-        # Trade-off: CPU optimization outweighs minimal lag increase
-        detection_skip_interval = 3  # Process every 3rd frame (was 1 = every frame)
+        # Static frames never reach the detector
+        if not self._has_motion(detection_frame):
+            self.motion_skip_count += 1
+            return
         
-        frame_height, frame_width = frame.shape[:2]
+        # Wall time is what detections and events report; the monotonic
+        # capture time is what motion tracking measures velocity against
+        _put_latest(
+            self.raw_queue,
+            (frame, detection_frame, time.time(), time.monotonic(), self.frame_count)
+        )
+    
+    def _has_motion(self, frame) -> bool:
+        """
+        Cheap frame-difference gate in front of the detector
         
-        # Only submit detection frames every Nth frame
-        if self.frame_count % detection_skip_interval == 0:
-            # ⭐ OPTIMIZATION: Downsample frame for detection to save CPU
-            if frame_width > 1280:
-                scale_factor = 1280 / frame_width
-                detection_frame = cv2.resize(frame, (int(frame_width * scale_factor), int(frame_height * scale_factor)), interpolation=cv2.INTER_LINEAR)
-            else:
-                detection_frame = frame
+        Compares a small grayscale thumbnail with the previous one (or, with
+        motion_gate_method 'mog2', with a background model), which costs a
+        few milliseconds against tens to hundreds for detection. While any
+        track is live every frame passes, so a subject that stops moving
+        keeps being detected until its track ages out.
+        
+        Args:
+            frame: OpenCV BGR image
             
-            # ⭐ Submit frame to async detection worker (NON-BLOCKING)
-            # Detection runs on separate thread, main loop continues immediately
-            with self.pending_frame_lock:
-                self.pending_detection_frame = detection_frame.copy()
+        Returns:
+            True if enough pixels changed (always True for the first frame
+            or when the gate is disabled)
+        """
+        min_pixels = self.config.motion_gate_pixels
+        if min_pixels <= 0:
+            return True
+        
+        # All writes go to preallocated buffers (dst=), so the gate does no
+        # per-frame allocation
+        cv2.resize(frame, self._MOTION_GATE_SIZE, dst=self._resize_buf, interpolation=cv2.INTER_AREA)
+        
+        # The reference (previous thumbnail or background model) is updated
+        # even when the frame passes for another reason
+        if self.config.motion_gate_method == "mog2":
+            if self._bg_subtractor is None:
+                self._bg_subtractor = cv2.createBackgroundSubtractorMOG2(
+                    history=200, varThreshold=16, detectShadows=False
+                )
+            changed = self._bg_subtractor.apply(self._resize_buf, self._diff_buf)
+        else:
+            index = self._gray_idx
+            gray = self._gray_ring[index]
+            cv2.cvtColor(self._resize_buf, cv2.COLOR_BGR2GRAY, dst=gray)
+            self._gray_idx = 1 - index
+            
+            if not self._gray_primed:
+                self._gray_primed = True
+                return True
+            
+            changed = self._diff_buf
+            cv2.absdiff(gray, self._gray_ring[1 - index], dst=changed)
+            cv2.threshold(changed, self._MOTION_GATE_DIFF, 255, cv2.THRESH_BINARY, dst=changed)
         
-        # Use latest cached detection results (from detection worker)
-        with self.detection_results_lock:
-            detections = self.last_detection_results.copy() if self.last_detection_results else []
+        if self._centroid_count:
+            return True
+        
+        return cv2.countNonZero(changed) >= min_pixels
+    
+    def _process_detections(
+        self,
+        frame,
+        detections: List[DetectionResult],
+        control_ptz: bool = True,
+        capture_time: Optional[float] = None
+    ) -> None:
+        """
+        Run tracking and PTZ control for one frame's detections
+        
+        Args:
+            frame: OpenCV BGR image the detections came from
+            detections: Filtered detections for the frame
+            control_ptz: Allow this frame to trigger camera movement; False
+                         for older frames of a batch, which only update tracks
+            capture_time: time.monotonic() reading taken when the frame was
+                          captured; motion tracking samples the clock if None
+        """
+        current_time = self._monotonic()
         
         # ⭐ Cache detections for web overlay - CRITICAL FIX
         # IMPORTANT: Clear detections immediately when none are detected to prevent lag
         # Previously kept old detections which caused bounding boxes to remain after subject left
         if detections:
             self.last_detections = detections
-            logger.debug(f"[CACHE] Cached {len(detections)} detections for overlay API")
+            self._debug("[CACHE] Cached %d detections for overlay API", len(detections))
         else:
             # CRITICAL: Clear stale detections immediately to prevent visual lag
             if self.last_detections:
-                logger.debug(f"[CACHE] Clearing {len(self.last_detections)} stale detections (no new detections)")
+                self._debug(
+                    "[CACHE] Clearing %d stale detections (no new detections)",
+                    len(self.last_detections)
+                )
             self.last_detections = []
         
         self.detection_count += len(detections)
@@ -529,41 +1090,65 @@ class TrackingEngine:
         # This allows idle timeout to work even when camera detects noise/reflections
         self._check_inactivity_and_return_home(current_time)
         
-        if not detections:
-            # No detections - return from tracking loop
-            return
+        # Retire events whose subject has left, even on empty frames
+        self._sweep_counter += 1
+        if self._sweep_counter >= self.config.event_sweep_interval:
+            self._sweep_counter = 0
+            self._sweep_stale_events(time.time())
         
         # Step 2: Assign stable object IDs using centroid tracking
+        # Empty frames go through too so tracks age out once the subject has
+        # left, which is what closes the motion gate again
         tracked_detections = self._assign_object_ids(detections)
         
         if not tracked_detections:
             return
         
-        # Step 3: Update motion tracking
+        # Step 3: Update motion tracking, then trigger/move/record, in one pass
+        # Bound methods hoisted out of the per-detection loop
+        update_track = self.motion_tracker.update_with_info
+        on_tracking = self.on_tracking
+        active_events = self.active_events
+        id_strs = self._id_strs
+        should_trigger = self._should_trigger_tracking if control_ptz else None
+        
+        # Still inside the PTZ cooldown: no detection in this frame can trigger
+        if current_time - self.last_ptz_time < self.CENTER_TRACKING_COOLDOWN:
+            should_trigger = None
+        
+        handle_action = self._handle_tracking_action
+        
+        self.tracking_count += len(tracked_detections)
+        
         for object_id, detection in tracked_detections:
-            # Update motion tracker with stable object ID (convert to string)
-            object_id_str = str(object_id)
-            direction = self.motion_tracker.update(
+            # Update motion tracker with stable object ID (string form cached per track)
+            object_id_str = id_strs[object_id]
+            # Motion tracker velocity is measured between capture times
+            direction, track_info = update_track(
                 object_id=object_id_str,
                 center=detection.center,
-                timestamp=current_time
+                timestamp=capture_time
             )
             
-            # Get track info
-            track_info = self.motion_tracker.get_track_info(object_id_str)
+            if on_tracking:
+                on_tracking(track_info)
             
-            if track_info is None:
-                continue
-            
-            self.tracking_count += 1
-            
-            if self.on_tracking:
-                self.on_tracking(track_info)
+            # Keep the subject's event alive while its track is, not only
+            # when a PTZ move goes out; the sweep closes it once unseen
+            event = active_events.get(object_id_str)
+            if event is not None:
+                event.last_update_time = detection.timestamp
             
             # Step 3: Check if tracking should trigger action
-            if self._should_trigger_tracking(detection, direction, track_info):
-                self._handle_tracking_action(detection, direction, track_info, frame)
+            if should_trigger and should_trigger(detection, direction, track_info, current_time):
+                handle_action(detection, direction, track_info, frame, current_time)
                 self.last_movement_time = current_time  # Update last movement time
+                
+                # A move was sent at current_time, so the cooldown now rules
+                # out the rest of this frame
+                if self.last_ptz_time == current_time:
+                    should_trigger = None
+    
     def _check_inactivity_and_return_home(self, current_time: float) -> None:
         """
         Check if camera has been inactive and return to home position
@@ -574,16 +1159,16 @@ class TrackingEngine:
         3. If no override, use the default home_preset from config
         
         Args:
-            current_time: Current timestamp
+            current_time: Current time.monotonic() reading
         """
         # Determine which preset to use at idle time
         # PRIORITY: Override (if set) > Config default
         if self.idle_preset_override:
             preset_to_use = self.idle_preset_override
-            print(f"⭐ [IDLE] Using dropdown override: {preset_to_use}")
+            self._debug("⭐ [IDLE] Using dropdown override: %s", preset_to_use)
         else:
             preset_to_use = self.home_preset  # Default: config value
-            print(f"⭐ [IDLE] Using config home preset: {preset_to_use}")
+            self._debug("⭐ [IDLE] Using config home preset: %s", preset_to_use)
         
         if not preset_to_use:
             return
@@ -602,25 +1187,28 @@ class TrackingEngine:
             if should_move:
                 try:
                     # ⭐ DIAGNOSTIC LOG: Home return being triggered
-                    print(f"⭐ [HOME RETURN] Inactivity timeout ({time_since_last_move:.1f}s >= {self.inactivity_timeout}s)")
-                    print(f"⭐ [HOME RETURN] Current: {self.current_preset}, Moving to: {preset_to_use}")
-                    logger.warning(f"⭐ [HOME RETURN] Inactivity timeout - Moving to preset {preset_to_use}")
+                    self._debug(
+                        "⭐ [HOME RETURN] Inactivity timeout (%.1fs >= %ss), current: %s, moving to: %s",
+                        time_since_last_move, self.inactivity_timeout, self.current_preset, preset_to_use
+                    )
+                    logger.warning("⭐ [HOME RETURN] Inactivity timeout - Moving to preset %s", preset_to_use)
                     
-                    logger.info(
-                        f"No movement for {time_since_last_move:.1f}s - "
-                        f"Returning to preset {preset_to_use}"
+                    self._info(
+                        "No movement for %.1fs - Returning to preset %s",
+                        time_since_last_move, preset_to_use
                     )
                     self.ptz.goto_preset(preset_to_use, speed=0.7)
                     self.current_preset = preset_to_use
                     self.last_ptz_time = current_time
                 except Exception as e:
-                    logger.error(f"Failed to return to idle preset: {e}")
+                    logger.error("Failed to return to idle preset: %s", e)
     
     def _should_trigger_tracking(
         self,
         detection: DetectionResult,
         direction: Direction,
-        track_info: TrackInfo
+        track_info: TrackInfo,
+        now: Optional[float] = None
     ) -> bool:
         """
         Determine if tracking action should be triggered
@@ -635,18 +1223,28 @@ class TrackingEngine:
             detection: Detection result
             direction: Movement direction
             track_info: Tracking information
+            now: Frame's time.monotonic() reading (sampled if None)
             
         Returns:
             True if action should be triggered
         """
+        if now is None:
+            now = self._monotonic()
+        
+        # Check cooldown to avoid excessive pan commands; first, as the
+        # cheapest check and the one that rejects most calls
+        if now - self.last_ptz_time < self.CENTER_TRACKING_COOLDOWN:
+            return False
+        
         # ⭐ CRITICAL: Don't auto-track if user just selected a preset
         # This allows preset movement to complete without being overridden
         # NOTE: Does NOT block manual continuous pan/tilt/zoom - only preset selections
         if self.preset_lock_active:
-            time_since_preset = time.time() - self.preset_lock_time
+            time_since_preset = now - self.preset_lock_time
             if time_since_preset < self.preset_lock_cooldown:
-                logger.debug(
-                    f"Preset lock active - Skipping auto-tracking ({time_since_preset:.1f}s / {self.preset_lock_cooldown}s)"
+                self._debug(
+                    "Preset lock active - Skipping auto-tracking (%.1fs / %ss)",
+                    time_since_preset, self.preset_lock_cooldown
                 )
                 return False
             else:
@@ -662,13 +1260,6 @@ class TrackingEngine:
         if track_info.frames_tracked < 2:
             return False
         
-        # Check cooldown to avoid excessive pan commands
-        # For center tracking, we want very fast updates (0.05s for responsive centering with walking people)
-        center_tracking_cooldown = 0.05  # Ultra-responsive for keeping up with movement
-        time_since_last_move = time.time() - self.last_ptz_time
-        if time_since_last_move < center_tracking_cooldown:
-            return False
-        
         return True
     
     def _handle_tracking_action(
@@ -676,7 +1267,8 @@ class TrackingEngine:
         detection: DetectionResult,
         direction: Direction,
         track_info: TrackInfo,
-        frame
+        frame,
+        now: Optional[float] = None
     ) -> None:
         """
         Execute tracking action - Fast center-of-frame continuous tracking
@@ -688,9 +1280,17 @@ class TrackingEngine:
             direction: Movement direction
             track_info: Tracking information
             frame: Current video frame
+            now: Frame's time.monotonic() reading (sampled if None)
         """
         height, width = frame.shape[:2]
         
+        # Frame geometry only changes with the stream resolution
+        geom = self._geom_cache
+        if geom is None or geom[0] != (width, height):
+            geom = ((width, height), width * 0.5, height * 0.5, 2.0 / width, 2.0 / height)
+            self._geom_cache = geom
+        _, frame_center_x, frame_center_y, inv_half_width, inv_half_height = geom
+        
         # ⭐ QUADRANT TRACKING MODE: Dispatch to quadrant handler if enabled
         if self.quadrant_mode_enabled:
             quadrant = self._get_quadrant_for_position(
@@ -703,9 +1303,6 @@ class TrackingEngine:
             return
         
         # ⭐ CENTER TRACKING MODE: Continue with standard center-of-frame tracking
-        frame_center_x = width / 2.0
-        frame_center_y = height / 2.0
-        
         # ⭐ PREDICTIVE TRACKING: Account for detection lag (conservative)
         # Detection results are 1-2 frames old (async detection takes time).
         # Predict where subject has moved to using velocity from motion tracker.
@@ -735,10 +1332,11 @@ class TrackingEngine:
             subject_x = max(0, min(width, predicted_x))
             subject_y = max(0, min(height, predicted_y))
             
-            logger.debug(
-                f"Predictive tracking (conf={detection.confidence:.2f}): detected at ({detection.center[0]:.0f}, {detection.center[1]:.0f}) → "
-                f"predicted at ({subject_x:.0f}, {subject_y:.0f}) "
-                f"(velocity: {velocity_x:+.1f}, {velocity_y:+.1f} px/s, factor: {confidence_factor:.2f})"
+            self._debug(
+                "Predictive tracking (conf=%.2f): detected at (%.0f, %.0f) → "
+                "predicted at (%.0f, %.0f) (velocity: %+.1f, %+.1f px/s, factor: %.2f)",
+                detection.confidence, detection.center[0], detection.center[1],
+                subject_x, subject_y, velocity_x, velocity_y, confidence_factor
             )
         
         # ========== PAN (Horizontal X-axis) ==========
@@ -746,13 +1344,9 @@ class TrackingEngine:
         offset_pixels_x = subject_x - frame_center_x
         
         # Calculate normalized offset (-1.0 to 1.0, where 0 = centered)
-        max_offset_x = width / 2.0
-        normalized_offset_x = offset_pixels_x / max_offset_x
+        normalized_offset_x = offset_pixels_x * inv_half_width
         
-        # Smaller dead zone for more responsive pan tracking (20px instead of 40px)
-        # This ensures subjects near left/right edges trigger pan immediately
-        DEAD_ZONE_PIXELS_X = 20  # Reduced from 40px for faster response near edges
-        if abs(offset_pixels_x) < DEAD_ZONE_PIXELS_X:
+        if abs(offset_pixels_x) < self._DEAD_ZONE_X:
             pan_velocity = 0.0
             pan_state = "CENTERED_X"
         else:
@@ -762,19 +1356,16 @@ class TrackingEngine:
             max_pan_velocity = 1.0
             
             # Calculate distance from center as fraction of half-frame width (0.0 to 1.0+)
-            distance_from_center = abs(offset_pixels_x) / max_offset_x
+            distance_from_center = abs(normalized_offset_x)
             
             # Apply quadratic scaling: faster the farther from center
             # At center (distance=0): velocity ≈ 0
             # At edge (distance=1): velocity = 1.0
             # Beyond edge (distance>1): velocity = 1.0 (clamped)
-            quadratic_velocity = min(1.0, distance_from_center ** 2)
+            quadratic_velocity = min(1.0, distance_from_center * distance_from_center)
             
-            # Apply sign (direction) to velocity
-            pan_velocity = max_pan_velocity * quadratic_velocity * (1 if offset_pixels_x > 0 else -1)
-            
-            # Clamp to valid range
-            pan_velocity = max(-1.0, min(1.0, pan_velocity))
+            # Apply sign (direction) to velocity; already within [-1, 1]
+            pan_velocity = copysign(max_pan_velocity * quadratic_velocity, offset_pixels_x)
             pan_state = "TRACKING_X"
         
         # ========== TILT (Vertical Y-axis) ==========
@@ -783,13 +1374,9 @@ class TrackingEngine:
         offset_pixels_y = frame_center_y - subject_y
         
         # Calculate normalized offset (-1.0 to 1.0, where 0 = centered)
-        max_offset_y = height / 2.0
-        normalized_offset_y = offset_pixels_y / max_offset_y
+        normalized_offset_y = offset_pixels_y * inv_half_height
         
-        # Smaller dead zone for more responsive tilt tracking (20px instead of 40px)
-        # This ensures subjects near top/bottom edges trigger tilt immediately
-        DEAD_ZONE_PIXELS_Y = 20  # Reduced from 40px for faster response near edges
-        if abs(offset_pixels_y) < DEAD_ZONE_PIXELS_Y:
+        if abs(offset_pixels_y) < self._DEAD_ZONE_Y:
             tilt_velocity = 0.0
             tilt_state = "CENTERED_Y"
         else:
@@ -799,43 +1386,26 @@ class TrackingEngine:
             max_tilt_velocity = 1.0
             
             # Calculate distance from center as fraction of half-frame height (0.0 to 1.0+)
-            distance_from_center = abs(offset_pixels_y) / max_offset_y
+            distance_from_center = abs(normalized_offset_y)
             
             # Apply quadratic scaling: faster the farther from center
             # At center (distance=0): velocity ≈ 0
             # At edge (distance=1): velocity = 1.0
             # Beyond edge (distance>1): velocity = 1.0 (clamped)
-            quadratic_velocity = min(1.0, distance_from_center ** 2)
-            
-            # FIXED: Negate tilt to correct camera firmware behavior
-            # Apply sign (direction) to velocity - negative for up, positive for down
-            tilt_velocity = -(max_tilt_velocity * quadratic_velocity * (1 if offset_pixels_y > 0 else -1))
+            quadratic_velocity = min(1.0, distance_from_center * distance_from_center)
             
             # ⭐ TILT DAMPING: Limit aggressive tilt (camera may not physically respond)
             # Some cameras have mechanical limits or firmware lag on tilt
             # Increase tilt velocity to 0.75 for better upward tracking response
             MAX_TILT_VELOCITY = 0.75  # Increased to 75% for better vertical tracking
-            tilt_velocity = max(-MAX_TILT_VELOCITY, min(MAX_TILT_VELOCITY, tilt_velocity))
             
-            # Clamp to valid range
-            tilt_velocity = max(-1.0, min(1.0, tilt_velocity))
+            # FIXED: Negate tilt to correct camera firmware behavior
+            # Apply sign (direction) to velocity - negative for up, positive for down
+            tilt_velocity = copysign(
+                min(MAX_TILT_VELOCITY, max_tilt_velocity * quadratic_velocity), -offset_pixels_y
+            )
             tilt_state = "TRACKING_Y"
         
-        # Log tracking state
-        logger.info(
-            f"{detection.class_name} fast center tracking: "
-            f"X offset={offset_pixels_x:+.0f}px → pan={pan_velocity:+.2f} ({pan_state}) | "
-            f"Y offset={offset_pixels_y:+.0f}px → tilt={tilt_velocity:+.2f} ({tilt_state})"
-        )
-        
-        # ⭐ DIAGNOSTIC LOG: Show what we're about to send
-        print(f"⭐ [TRACKING ENGINE] About to send continuous_move command:")
-        print(f"   Subject: {detection.class_name} at ({subject_x:.0f}, {subject_y:.0f})")
-        print(f"   Frame center: ({frame_center_x:.0f}, {frame_center_y:.0f})")
-        print(f"   Offset: X={offset_pixels_x:+.0f}px, Y={offset_pixels_y:+.0f}px")
-        print(f"   Velocity: pan={pan_velocity:+.2f}, tilt={tilt_velocity:+.2f}")
-        logger.warning(f"⭐ [TRACKING ENGINE] Velocity command: pan={pan_velocity:+.2f}, tilt={tilt_velocity:+.2f}")
-        
         # ========== AUTO-ZOOM BASED ON DISTANCE ==========
         # Estimate distance from bounding box size
         # Smaller box = farther away = more zoom needed
@@ -867,8 +1437,67 @@ class TrackingEngine:
         else:
             zoom_velocity = 0.0
         
-        print(f"   Distance estimate: bbox_area={bbox_area:.0f}px² → zoom={zoom_velocity:+.2f}")
-        logger.info(f"Auto-zoom: bbox_area={bbox_area:.0f} → zoom_velocity={zoom_velocity:+.2f}")
+        self._info("Auto-zoom: bbox_area=%.0f → zoom_velocity=%+.2f", bbox_area, zoom_velocity)
+        
+        # ⭐ Subject centered and not approaching: a zero-velocity move would
+        # just be a wasted round trip to the camera, so only the move is
+        # skipped and the subject still counts toward its tracking event
+        if pan_velocity == 0.0 and tilt_velocity == 0.0 and zoom_velocity == 0.0:
+            self._debug(
+                "%s centered (offset %+.0f, %+.0f px), skipping PTZ",
+                detection.class_name, offset_pixels_x, offset_pixels_y
+            )
+            self._record_tracking_event(
+                object_id=track_info.object_id,
+                class_name=detection.class_name,
+                direction=direction,
+                zone="tracking",
+                preset=self.current_preset,
+                timestamp=detection.timestamp
+            )
+            return
+        
+        # Log tracking state
+        self._info(
+            "%s fast center tracking: X offset=%+.0fpx → pan=%+.2f (%s) | "
+            "Y offset=%+.0fpx → tilt=%+.2f (%s)",
+            detection.class_name, offset_pixels_x, pan_velocity, pan_state,
+            offset_pixels_y, tilt_velocity, tilt_state
+        )
+        
+        # ⭐ DIAGNOSTIC LOG: Show what we're about to send (runs on every PTZ
+        # command, so it is deferred and only formatted at DEBUG)
+        self._debug(
+            "⭐ [TRACKING ENGINE] continuous_move: %s at (%.0f, %.0f), frame center (%.0f, %.0f), "
+            "offset X=%+.0fpx Y=%+.0fpx, pan=%+.2f tilt=%+.2f",
+            detection.class_name, subject_x, subject_y, frame_center_x, frame_center_y,
+            offset_pixels_x, offset_pixels_y, pan_velocity, tilt_velocity
+        )
+        
+        if now is None:
+            now = self._monotonic()
+        
+        # ⭐ Skip a move that repeats the one just sent: the camera is still
+        # executing it, so the round trip would change nothing
+        last_pan, last_tilt, last_zoom = self._last_sent_move
+        eps = self.PTZ_VELOCITY_EPSILON
+        if (
+            now - self._last_sent_time < self.PTZ_RESEND_INTERVAL
+            and abs(pan_velocity - last_pan) < eps
+            and abs(tilt_velocity - last_tilt) < eps
+            and abs(zoom_velocity - last_zoom) < eps
+        ):
+            self.ptz_suppressed_count += 1
+            # The subject is still tracked, so its event goes on
+            self._record_tracking_event(
+                object_id=track_info.object_id,
+                class_name=detection.class_name,
+                direction=direction,
+                zone="tracking",
+                preset=self.current_preset,
+                timestamp=detection.timestamp
+            )
+            return
         
         try:
             # Execute continuous pan/tilt/zoom movement (blocking with SHORT duration)
@@ -877,7 +1506,7 @@ class TrackingEngine:
             # to tilt commands. Dahua cameras can have mechanical lag on upward tilt.
             move_duration = 0.15  # Slightly longer for tilt responsiveness
             
-            self.ptz.continuous_move(
+            self._send_ptz_move(
                 pan_velocity=pan_velocity,
                 tilt_velocity=tilt_velocity,
                 zoom_velocity=zoom_velocity,  # Auto-zoom based on distance
@@ -885,7 +1514,9 @@ class TrackingEngine:
                 blocking=True  # CRITICAL: Automatically stops after duration
             )
             
-            self.last_ptz_time = time.time()
+            self._last_sent_move = (pan_velocity, tilt_velocity, zoom_velocity)
+            self._last_sent_time = now
+            self.last_ptz_time = now
             self.ptz_movement_count += 1
             
             # Describe current state for display
@@ -906,7 +1537,7 @@ class TrackingEngine:
             
             self.current_preset = "|".join(state_parts)
             
-
+            
             if self.on_ptz_move:
                 self.on_ptz_move(self.current_preset)
             
@@ -916,12 +1547,81 @@ class TrackingEngine:
                 class_name=detection.class_name,
                 direction=direction,
                 zone="tracking",
-                preset=self.current_preset
+                preset=self.current_preset,
+                timestamp=detection.timestamp  # Capture time; saves a clock read
             )
             
         except Exception as e:
-            logger.error(f"Failed to execute center tracking pan: {e}")
-
+            logger.error("Failed to execute center tracking pan: %s", e)
+    
+    
+    def _compile_zones(self) -> None:
+        """
+        Stack zone bounds and priorities into NumPy arrays and build the
+        zone → direction → preset table used by _determine_target_preset
+        
+        Called from __init__ and set_zones(); call again after changing
+        config.zones directly.
+        """
+        zones = list(self.config.zones)
+        self._zone_refs = zones
+        self._zone_x_min = np.array([z.x_range[0] for z in zones], dtype=np.float64)
+        self._zone_x_max = np.array([z.x_range[1] for z in zones], dtype=np.float64)
+        self._zone_y_min = np.array([z.y_range[0] for z in zones], dtype=np.float64)
+        self._zone_y_max = np.array([z.y_range[1] for z in zones], dtype=np.float64)
+        self._zone_prio = np.array([z.priority for z in zones], dtype=np.int64)
+        self._zone_px = None  # ((width, height), bounds) from _zone_pixel_bounds
+        
+        # Moving right-to-left anticipates with the leftmost zone that starts
+        # left of the current one; left-to-right with the rightmost zone that
+        # ends right of it. Vertical movement works the same way with the
+        # topmost/bottommost zone. min/max keep the first zone on ties.
+        self._preset_for: Dict[str, Dict[Direction, str]] = {}
+        for zone in zones:
+            targets = {}
+            
+            left_zones = [z for z in zones if z.x_range[0] < zone.x_range[0]]
+            if left_zones:
+                targets[Direction.RIGHT_TO_LEFT] = min(left_zones, key=lambda z: z.x_range[0]).preset_token
+            
+            right_zones = [z for z in zones if z.x_range[1] > zone.x_range[1]]
+            if right_zones:
+                targets[Direction.LEFT_TO_RIGHT] = max(right_zones, key=lambda z: z.x_range[1]).preset_token
+            
+            upper_zones = [z for z in zones if z.y_range[0] < zone.y_range[0]]
+            if upper_zones:
+                targets[Direction.BOTTOM_TO_TOP] = min(upper_zones, key=lambda z: z.y_range[0]).preset_token
+            
+            lower_zones = [z for z in zones if z.y_range[1] > zone.y_range[1]]
+            if lower_zones:
+                targets[Direction.TOP_TO_BOTTOM] = max(lower_zones, key=lambda z: z.y_range[1]).preset_token
+            
+            self._preset_for[zone.name] = targets
+    
+    def _zone_pixel_bounds(self, width: int, height: int) -> np.ndarray:
+        """
+        Zone bounds in whole pixels for a frame size, as a (4, N) int32 array
+        of x_min, x_max, y_min, y_max rows
+        
+        A pixel is inside a bound exactly when its normalized coordinate is,
+        so zone lookups compare integers instead of dividing every position.
+        Cached until the frame size or the zones change.
+        """
+        cached = self._zone_px
+        if cached is not None and cached[0] == (width, height):
+            return cached[1]
+        
+        # The epsilon keeps e.g. 0.3 * 640 = 192.00000000000003 at pixel 192
+        eps = 1e-9
+        bounds = np.stack([
+            np.ceil(self._zone_x_min * width - eps),
+            np.floor(self._zone_x_max * width + eps),
+            np.ceil(self._zone_y_min * height - eps),
+            np.floor(self._zone_y_max * height + eps)
+        ]).astype(np.int32)
+        
+        self._zone_px = ((width, height), bounds)
+        return bounds
     
     def _get_zone_for_position(
         self,
@@ -938,31 +1638,54 @@ class TrackingEngine:
         Returns:
             TrackingZone or None
         """
-        if not self.config.zones:
+        if not self._zone_refs:
             return None
         
-        height, width = frame_shape[:2]
-        x, y = position
-        
-        # Normalize position to 0.0-1.0
-        norm_x = x / width
-        norm_y = y / height
+        return self._get_zones_for_positions([position], frame_shape)[0]
+    
+    def _get_zones_for_positions(
+        self,
+        positions,
+        frame_shape: tuple
+    ) -> List[Optional[TrackingZone]]:
+        """
+        Determine the zone of several positions at once
         
-        # Find matching zone (highest priority if multiple match)
-        matching_zones = []
+        Every position is tested against every zone in one vectorized
+        integer comparison; where zones overlap the highest priority wins,
+        and the first configured zone wins a priority tie.
         
-        for zone in self.config.zones:
-            x_min, x_max = zone.x_range
-            y_min, y_max = zone.y_range
+        Args:
+            positions: (x, y) pixel positions in frame, as a sequence or
+                       (M, 2) array (fractional positions are truncated)
+            frame_shape: Frame dimensions (height, width, channels)
             
-            if x_min <= norm_x <= x_max and y_min <= norm_y <= y_max:
-                matching_zones.append(zone)
+        Returns:
+            TrackingZone or None for each position
+        """
+        xy = np.asarray(positions).reshape(-1, 2).astype(np.int32, copy=False)
         
-        if not matching_zones:
-            return None
+        if not self._zone_refs or not len(xy):
+            return [None] * len(xy)
         
-        # Return highest priority zone
-        return max(matching_zones, key=lambda z: z.priority)
+        height, width = frame_shape[:2]
+        x_min, x_max, y_min, y_max = self._zone_pixel_bounds(width, height)
+        
+        # (M, 1) position columns against (N,) zone bounds
+        x = xy[:, 0:1]
+        y = xy[:, 1:2]
+        
+        inside = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+        
+        # Priority of each matching zone; non-matches can never win
+        masked = np.where(inside, self._zone_prio, np.iinfo(np.int64).min)
+        best = masked.argmax(axis=1)
+        found = inside[np.arange(len(xy)), best]
+        
+        return [
+            self._zone_refs[index] if hit else None
+            for index, hit in zip(best.tolist(), found.tolist())
+        ]
     
     def _determine_target_preset(
         self,
@@ -979,36 +1702,8 @@ class TrackingEngine:
         Returns:
             Preset token or None
         """
-        # For RIGHT_TO_LEFT movement, anticipate by moving camera left
-        if direction == Direction.RIGHT_TO_LEFT:
-            # Find leftmost zone
-            left_zones = [z for z in self.config.zones if z.x_range[0] < current_zone.x_range[0]]
-            
-            if left_zones:
-                # Get the leftmost zone
-                target_zone = min(left_zones, key=lambda z: z.x_range[0])
-                return target_zone.preset_token
-        
-        # For LEFT_TO_RIGHT movement, anticipate by moving camera right
-        elif direction == Direction.LEFT_TO_RIGHT:
-            # Find rightmost zone
-            right_zones = [z for z in self.config.zones if z.x_range[1] > current_zone.x_range[1]]
-            
-            if right_zones:
-                # Get the rightmost zone
-                target_zone = max(right_zones, key=lambda z: z.x_range[1])
-                return target_zone.preset_token
-        
-        # For vertical movement, could implement similar logic
-        elif direction == Direction.TOP_TO_BOTTOM:
-            # Move down
-            pass
-        
-        elif direction == Direction.BOTTOM_TO_TOP:
-            # Move up
-            pass
-        
-        return None
+        # Precomputed in _compile_zones
+        return self._preset_for.get(current_zone.name, {}).get(direction)
     
     def _record_tracking_event(
         self,
@@ -1016,7 +1711,8 @@ class TrackingEngine:
         class_name: str,
         direction: Direction,
         zone: str,
-        preset: str
+        preset: str,
+        timestamp: Optional[float] = None
     ) -> None:
         """
         Record tracking event for analytics
@@ -1027,15 +1723,22 @@ class TrackingEngine:
             direction: Movement direction
             zone: Current zone
             preset: PTZ preset activated
+            timestamp: Wall-clock time of the frame (default: now)
         """
-        current_time = time.time()
+        current_time = time.time() if timestamp is None else timestamp
         
-        # Check if event already exists
-        if object_id in self.active_events:
-            event = self.active_events[object_id]
+        # Check if event already exists (single lookup)
+        event = self.active_events.get(object_id)
+        if event is not None:
             event.frame_count += 1
-            event.zone_transitions.append(zone)
-            event.ptz_actions.append(preset)
+            event.last_update_time = current_time
+            
+            # Record changes only, so a long track doesn't grow a list entry
+            # per frame
+            if event.zone_transitions[-1] != zone:
+                event.zone_transitions.append(zone)
+            if event.ptz_actions[-1] != preset:
+                event.ptz_actions.append(preset)
         else:
             # Create new event
             self.event_counter += 1
@@ -1047,12 +1750,46 @@ class TrackingEngine:
                 start_time=current_time,
                 zone_transitions=[zone],
                 ptz_actions=[preset],
-                frame_count=1
+                frame_count=1,
+                last_update_time=current_time
             )
             
-            self.active_events[object_id] = event
+            with self._state_lock:
+                self.active_events[object_id] = event
+                self._events_version += 1
+            
+            self._info("Started tracking event: %s", event.event_id)
+    
+    def _sweep_stale_events(self, now: float) -> None:
+        """
+        Close active events not updated for more than max_tracking_age
+        
+        Every tracked frame of the subject refreshes its event, so this
+        measures how long the subject has been unseen. A closed event ends
+        at its last update and moves to the completed history, so subjects
+        that left the scene don't linger until stop().
+        
+        Args:
+            now: Current time.time() reading (events use wall-clock time)
+        """
+        cutoff = now - self.config.max_tracking_age
+        stale = [
+            object_id for object_id, event in self.active_events.items()
+            if event.last_update_time < cutoff
+        ]
+        
+        if not stale:
+            return
+        
+        with self._state_lock:
+            for object_id in stale:
+                event = self.active_events.pop(object_id)
+                event.end_time = event.last_update_time
+                self.completed_events.append(event)
             
-            logger.info(f"Started tracking event: {event.event_id}")
+            self._events_version += 1
+        
+        self._debug("Closed %d stale tracking events", len(stale))
     
     def get_statistics(self) -> Dict:
         """
@@ -1061,26 +1798,54 @@ class TrackingEngine:
         Returns:
             Dictionary with tracking stats
         """
+        # Counters have a single writer each, so unlocked reads are safe;
+        # the event counts are read together under the state lock
+        with self._state_lock:
+            active_count = len(self.active_events)
+            completed_count = len(self.completed_events)
+        
         return {
             'frames_processed': self.frame_count,
             'detections': self.detection_count,
+            'motion_skipped_frames': self.motion_skip_count,
             'tracks': self.tracking_count,
             'ptz_movements': self.ptz_movement_count,
-            'active_events': len(self.active_events),
-            'completed_events': len(self.completed_events),
+            'ptz_coalesced': self.ptz_coalesced_count,
+            'ptz_suppressed': self.ptz_suppressed_count,
+            'active_events': active_count,
+            'completed_events': completed_count,
             'current_preset': self.current_preset,
             'is_running': self.running,
             'is_paused': self.paused,
             'mode': self.mode.value
         }
     
-    def get_active_events(self) -> List[TrackingEvent]:
-        """Get currently active tracking events"""
-        return list(self.active_events.values())
+    def get_active_events(self) -> Tuple[TrackingEvent, ...]:
+        """
+        Get currently active tracking events
+        
+        Returns a shared read-only snapshot, rebuilt only after an event
+        has been added or closed, so polling is cheap.
+        """
+        with self._state_lock:
+            version, events = self._active_snapshot
+            if version != self._events_version:
+                events = tuple(self.active_events.values())
+                self._active_snapshot = (self._events_version, events)
+            return events
     
-    def get_completed_events(self) -> List[TrackingEvent]:
-        """Get completed tracking events"""
-        return self.completed_events.copy()
+    def get_completed_events(self) -> Tuple[TrackingEvent, ...]:
+        """
+        Get completed tracking events (most recent completed_event_history)
+        
+        Returns a shared read-only snapshot like get_active_events().
+        """
+        with self._state_lock:
+            version, events = self._completed_snapshot
+            if version != self._events_version:
+                events = tuple(self.completed_events)
+                self._completed_snapshot = (self._events_version, events)
+            return events
     
     # ⭐ QUADRANT TRACKING METHODS
     def _get_quadrant_for_position(
@@ -1132,7 +1897,7 @@ class TrackingEngine:
         
         # ✅ Step 1: Check if quadrant changed
         if quadrant != self.current_quadrant:
-            logger.info(f"Quadrant changed: {self.current_quadrant} → {quadrant}")
+            logger.info("Quadrant changed: %s → %s", self.current_quadrant, quadrant)
             
             # Calculate pan/tilt offsets for the quadrant (relative to master view)
             # Each quadrant is 25% of the master view, zoomed in
@@ -1146,7 +1911,7 @@ class TrackingEngine:
             offset = quadrant_offsets.get(quadrant)
             
             if offset:
-                logger.info(f"Moving to {quadrant} (pan={offset['pan']}, tilt={offset['tilt']})")
+                logger.info("Moving to %s (pan=%s, tilt=%s)", quadrant, offset['pan'], offset['tilt'])
                 try:
                     # Execute relative move to quadrant position
                     self.ptz.relative_move(
@@ -1169,15 +1934,15 @@ class TrackingEngine:
                             zoom_velocity=zoom_level,
                             duration=0.8
                         )
-                        logger.info(f"Quadrant zoom on entry: {zoom_level}")
+                        logger.info("Quadrant zoom on entry: %s", zoom_level)
                     
                     self.current_quadrant = quadrant
                     self.quadrant_zoom_counter = 0
                     
                 except Exception as e:
-                    logger.error(f"Failed to move to quadrant: {e}")
+                    logger.error("Failed to move to quadrant: %s", e)
             else:
-                logger.warning(f"Unknown quadrant: {quadrant}")
+                logger.warning("Unknown quadrant: %s", quadrant)
         
         # ✅ Step 2: Fine-tune pan/tilt within quadrant (similar to center tracking)
         behavior = self.quadrant_config.get('behavior', {})
@@ -1213,7 +1978,7 @@ class TrackingEngine:
                         duration=0.1
                     )
                 except Exception as e:
-                    logger.error(f"Failed to fine-tune pan/tilt: {e}")
+                    logger.error("Failed to fine-tune pan/tilt: %s", e)
     
     def toggle_quadrant_mode(self, enabled: Optional[bool] = None) -> bool:
         """
@@ -1247,7 +2012,18 @@ class TrackingEngine:
     def set_mode(self, mode: TrackingMode) -> None:
         """Change tracking mode"""
         self.mode = mode
-        logger.info(f"Tracking mode changed to: {mode.value}")
+        logger.info("Tracking mode changed to: %s", mode.value)
+    
+    def set_zones(self, zones: List[TrackingZone]) -> None:
+        """
+        Replace the tracking zones and rebuild the zone lookup tables
+        
+        Args:
+            zones: New zone list
+        """
+        self.config.zones = list(zones)
+        self._compile_zones()
+        logger.info("Tracking zones updated: %d zones", len(self.config.zones))
     
     def __repr__(self) -> str:
         """String representation"""
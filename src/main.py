@@ -18,6 +18,7 @@ sys.path.insert(0, str(project_root))
 
 from src.camera.ptz_controller import PTZController
 from src.ai.object_detector import ObjectDetector
+from src.ai.process_detector import ProcessDetector
 from src.ai.motion_tracker import MotionTracker, MultiObjectTracker, Direction
 from src.video.stream_handler import VideoStreamHandler
 from src.automation.tracking_engine import TrackingEngine, TrackingConfig, TrackingZone, TrackingMode
@@ -132,11 +133,19 @@ def initialize_components(config_loader: ConfigLoader, logger: logging.Logger) -
     device = ai_config.get_device()
     confidence = ai_config.get_confidence_threshold()
     
-    detector = ObjectDetector(
-        model_path=model_path,
-        device=device,
-        confidence_threshold=confidence
-    )
+    if ai_config.use_detector_process():
+        # Inference runs in a child process, off the tracking threads' GIL
+        detector = ProcessDetector(
+            model_path=model_path,
+            device=device,
+            confidence_threshold=confidence
+        )
+    else:
+        detector = ObjectDetector(
+            model_path=model_path,
+            device=device,
+            confidence_threshold=confidence
+        )
     
     logger.info(f"Object detector loaded: {model_path}")
     logger.info(f"  Device: {device}")
@@ -181,6 +190,14 @@ def initialize_components(config_loader: ConfigLoader, logger: logging.Logger) -
         zones=tracking_zones,
         target_classes=tracking_config.target_classes,
         min_confidence=tracking_config.detection.get('min_confidence', 0.6),
+        inference_interval=tracking_config.detection.get('inference_interval', 3),
+        detector_batch_size=tracking_config.detection.get('detector_batch_size', 4),
+        detector_max_latency=tracking_config.detection.get('detector_max_latency', 0.1),
+        motion_gate_pixels=tracking_config.detection.get('motion_gate_pixels', 50),
+        motion_gate_method=tracking_config.detection.get('motion_gate_method', 'diff'),
+        detection_max_width=tracking_config.detection.get('detection_max_width', 1280),
+        completed_event_history=tracking_config.events.get('completed_event_history', 10000),
+        event_sweep_interval=tracking_config.events.get('event_sweep_interval', 30),
         movement_threshold=movement_threshold,
         cooldown_time=tracking_config.ptz.get('cooldown_time', 3.0),
         direction_triggers=direction_triggers
@@ -329,6 +346,9 @@ def run_tracking_system(
         
         tracking_engine.stop()
         
+        if isinstance(tracking_engine.detector, ProcessDetector):
+            tracking_engine.detector.close()
+        
         if display_video:
             cv2.destroyAllWindows()
         
@@ -98,6 +98,11 @@ class AIConfig:
         """Get global confidence threshold"""
         inference = self.object_detection.get('inference', {})
         return inference.get('confidence_threshold', 0.6)
+    
+    def use_detector_process(self) -> bool:
+        """Whether to run the detector in a separate process"""
+        inference = self.object_detection.get('inference', {})
+        return inference.get('separate_process', False)
 
 
 class ConfigLoader:
@@ -301,6 +306,9 @@ class ConfigLoader:
         detection_cfg = tracking_raw.detection or {}
         min_confidence = detection_cfg.get('min_confidence', 0.5)
         
+        # Get event settings
+        events_cfg = tracking_raw.events or {}
+        
         # Get PTZ settings
         ptz_cfg = tracking_raw.ptz or {}
         cooldown_time = ptz_cfg.get('cooldown_time', 3.0)
@@ -313,6 +321,14 @@ class ConfigLoader:
             target_classes=tracking_raw.target_classes,
             direction_triggers=direction_triggers if direction_triggers else [Direction.LEFT_TO_RIGHT, Direction.RIGHT_TO_LEFT],
             min_confidence=min_confidence,
+            inference_interval=detection_cfg.get('inference_interval', 3),
+            detector_batch_size=detection_cfg.get('detector_batch_size', 4),
+            detector_max_latency=detection_cfg.get('detector_max_latency', 0.1),
+            motion_gate_pixels=detection_cfg.get('motion_gate_pixels', 50),
+            motion_gate_method=detection_cfg.get('motion_gate_method', 'diff'),
+            detection_max_width=detection_cfg.get('detection_max_width', 1280),
+            completed_event_history=events_cfg.get('completed_event_history', 10000),
+            event_sweep_interval=events_cfg.get('event_sweep_interval', 30),
             movement_threshold=movement_threshold,
             cooldown_time=cooldown_time,
             max_tracking_age=3.0,
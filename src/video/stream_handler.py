@@ -24,7 +24,7 @@ import cv2
 import logging
 import time
 import threading
-from queue import Queue, Empty
+from collections import deque
 from typing import Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -97,14 +97,21 @@ class VideoStreamHandler:
         self.name = name
         
         # Stream capture
+        # Single-producer ring: the capture thread appends, consumers pop.
+        # deque(maxlen) drops the oldest frame by itself when full, and the
+        # event wakes a waiting consumer without a lock around the buffer
         self.capture: Optional[cv2.VideoCapture] = None
-        self.frame_queue: Queue = Queue(maxsize=buffer_size)
+        self.frame_ring: deque = deque(maxlen=max(1, buffer_size))
+        self._frame_ready = threading.Event()
         
-        # ⭐ Direct frame buffer for web streaming (no queue contention)
-        # Avoids blocking when tracking engine reads from queue
+        # ⭐ Direct frame buffer for web streaming (no ring contention)
+        # Avoids blocking when tracking engine reads from the ring
         self.latest_frame: Optional[cv2.Mat] = None
         self.latest_frame_lock = threading.Lock()
         
+        # Frame taken by grab() and handed out by retrieve()
+        self._grabbed_frame: Optional[cv2.Mat] = None
+        
         # Thread control
         self.stopped = False
         self.thread: Optional[threading.Thread] = None
@@ -282,21 +289,14 @@ class VideoStreamHandler:
                     fps_counter = 0
                     fps_start_time = current_time
                 
-                # Add frame to queue
-                if not self.frame_queue.full():
-                    self.frame_queue.put(frame)
-                else:
-                    # Drop oldest frame and add new one
-                    try:
-                        self.frame_queue.get_nowait()
-                        
-                        with self.lock:
-                            self.stats.frames_dropped += 1
-                        
-                    except Empty:
-                        pass
-                    
-                    self.frame_queue.put(frame)
+                # Add frame to ring (a full ring drops its oldest frame)
+                ring = self.frame_ring
+                if len(ring) == ring.maxlen:
+                    with self.lock:
+                        self.stats.frames_dropped += 1
+                
+                ring.append(frame)
+                self._frame_ready.set()
                 
                 # ⭐ Also store in direct buffer for web streaming (non-blocking)
                 # This ensures web server always gets latest frame without blocking
@@ -329,11 +329,55 @@ class VideoStreamHandler:
         Returns:
             OpenCV BGR image or None if no frame available
         """
-        try:
-            frame = self.frame_queue.get(timeout=timeout)
-            return frame
-        except Empty:
+        if not self._wait_for_frame(timeout):
             return None
+        
+        try:
+            return self.frame_ring.popleft()
+        except IndexError:
+            return None  # Taken by another consumer meanwhile
+    
+    def grab(self, timeout: float = 1.0, latest: bool = False) -> bool:
+        """
+        Take the next buffered frame without handing it out
+        
+        Mirrors cv2.VideoCapture.grab(): consumers that skip frames call
+        grab() for every frame and retrieve() only for the ones they
+        process, so skipped frames cost a ring pop and nothing else.
+        
+        Args:
+            timeout: Maximum seconds to wait for frame
+            latest: Discard any older buffered frames and take the newest,
+                    so a slow consumer never works on a stale frame
+            
+        Returns:
+            True if a frame was grabbed
+        """
+        self._grabbed_frame = None
+        
+        if not self._wait_for_frame(timeout):
+            return False
+        
+        if latest:
+            self._grabbed_frame = self._drain_ring()
+        else:
+            try:
+                self._grabbed_frame = self.frame_ring.popleft()
+            except IndexError:
+                pass
+        
+        return self._grabbed_frame is not None
+    
+    def retrieve(self) -> Optional[cv2.Mat]:
+        """
+        Return the frame taken by the last grab()
+        
+        Returns:
+            OpenCV BGR image or None if nothing was grabbed
+        """
+        frame = self._grabbed_frame
+        self._grabbed_frame = None
+        return frame
     
     def read_latest(self) -> Optional[cv2.Mat]:
         """
@@ -342,14 +386,56 @@ class VideoStreamHandler:
         Returns:
             Most recent frame or None
         """
+        return self._drain_ring()
+    
+    def _wait_for_frame(self, timeout: float) -> bool:
+        """
+        Wait until the ring holds a frame
+        
+        The event is cleared before the second emptiness check, so a frame
+        appended in between still sets it and the wait returns at once.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if a frame is available
+        """
+        if self.frame_ring:
+            return True
+        
+        self._frame_ready.clear()
+        
+        if self.frame_ring:
+            return True
+        
+        return self._frame_ready.wait(timeout) and bool(self.frame_ring)
+    
+    def _drain_ring(self) -> Optional[cv2.Mat]:
+        """
+        Empty the frame ring without blocking
+        
+        Every frame but the newest counts as dropped in the stream stats.
+        
+        Returns:
+            Most recent buffered frame or None if the ring was empty
+        """
+        ring = self.frame_ring
         frame = None
+        discarded = -1
         
-        # Clear queue and get most recent frame
-        while not self.frame_queue.empty():
+        # popleft until empty rather than clear(), so a frame the capture
+        # thread appends meanwhile is returned instead of silently lost
+        while True:
             try:
-                frame = self.frame_queue.get_nowait()
-            except Empty:
+                frame = ring.popleft()
+            except IndexError:
                 break
+            discarded += 1
+        
+        if discarded > 0:
+            with self.lock:
+                self.stats.frames_dropped += discarded
         
         return frame
     
@@ -357,7 +443,7 @@ class VideoStreamHandler:
         """
         ⭐ Read latest frame directly from buffer (NON-BLOCKING)
         
-        Used by web streaming to avoid blocking when tracking engine reads from queue.
+        Used by web streaming to avoid blocking when tracking engine reads from the ring.
         Returns immediately with latest available frame or None.
         
         Returns:
@@ -433,12 +519,8 @@ class VideoStreamHandler:
             self.capture.release()
             self.capture = None
         
-        # Clear queue
-        while not self.frame_queue.empty():
-            try:
-                self.frame_queue.get_nowait()
-            except Empty:
-                break
+        # Clear buffered frames
+        self.frame_ring.clear()
         
         with self.lock:
             self.stats.is_connected = False
@@ -139,7 +139,7 @@ async def startup_event():
         
         logger.info(f"✓ Tracking config loaded:")
         logger.info(f"  - Target classes: {tracking_cfg.target_classes}")
-        logger.info(f"  - Direction triggers: {[d.value for d in tracking_cfg.direction_triggers]}")
+        logger.info(f"  - Direction triggers: {[d.name.lower() for d in tracking_cfg.direction_triggers]}")
         logger.info(f"  - Zones: {len(tracking_cfg.zones)}")
         logger.info(f"  - Confidence threshold: {tracking_cfg.min_confidence}")
         logger.info(f"  - Movement threshold: {tracking_cfg.movement_threshold}")
@@ -337,7 +337,7 @@ async def move_to_preset(preset_token: str, speed: float = 0.5) -> Dict[str, str
         # NOTE: Manual continuous pan/tilt/zoom holds are NOT locked out
         if tracking_engine:
             tracking_engine.preset_lock_active = True
-            tracking_engine.preset_lock_time = time.time()
+            tracking_engine.preset_lock_time = time.monotonic()
             logger.info(f"🔒 Preset lock activated - Auto-tracking locked for {tracking_engine.preset_lock_cooldown}s")
         
         return {
@@ -755,7 +755,7 @@ async def get_events(limit: int = 50) -> List[Dict[str, Any]]:
             "timestamp": event.start_time,  # Use start_time, not timestamp
             "object_id": event.object_id,
             "class_name": event.class_name,
-            "direction": event.direction.value if event.direction else None,
+            "direction": event.direction.name.lower() if event.direction else None,
             "zones": event.zone_transitions,  # List of zone transitions
             "ptz_actions": event.ptz_actions,  # List of PTZ presets triggered
             "frame_count": event.frame_count,
@@ -4,10 +4,12 @@ Unit tests for Motion Tracker
 Tests direction detection, velocity calculation, and multi-object tracking.
 """
 
+import time
 import pytest
+import numpy as np
 from enum import Enum
 from unittest.mock import Mock, MagicMock
-from src.ai.motion_tracker import MotionTracker, Direction, MultiObjectTracker
+from src.ai.motion_tracker import MotionTracker, Direction, MultiObjectTracker, TrackTable
 
 
 @pytest.fixture
@@ -117,6 +119,16 @@ class TestMovementThreshold:
         
         # Should detect direction (total movement > 50)
         assert direction != Direction.STATIONARY
+    
+    def test_update_with_info_returns_track(self, motion_tracker):
+        """Test that update_with_info returns the same direction and the live TrackInfo"""
+        for i in range(10):
+            direction, track = motion_tracker.update_with_info("obj_1", (100 + i * 10, 240), timestamp=i * 0.1)
+        
+        assert direction == Direction.LEFT_TO_RIGHT
+        assert track is motion_tracker.get_track_info("obj_1")
+        assert track.current_position == (190, 240)
+        assert track.current_direction == direction
 
 
 class TestPositionHistory:
@@ -218,6 +230,106 @@ class TestMultiObjectTracker:
         # IDs should match (same object)
         if id1 is not None and id2 is not None:
             assert id1 == id2
+    
+    def test_nearest_detection_keeps_track_id(self, multi_tracker):
+        """Test that moved detections are matched back to their tracks"""
+        first = multi_tracker.update([(100, 100), (300, 300)], timestamp=0.0)
+        second = multi_tracker.update([(305, 300), (104, 100)], timestamp=0.1)
+        
+        assert set(first) == set(second)
+        assert second['track_1'][0] == (104, 100)
+        assert second['track_2'][0] == (305, 300)
+    
+    def test_distant_detection_starts_new_track(self, multi_tracker):
+        """Test that detections beyond max_distance create new tracks"""
+        multi_tracker.update([(100, 100)], timestamp=0.0)
+        tracks = multi_tracker.update([(400, 400)], timestamp=0.1)
+        
+        assert list(tracks) == ['track_2']
+    
+    def test_position_rows_stay_dense(self):
+        """Test that removing tracks keeps the position array compact"""
+        tracker = MultiObjectTracker(max_distance=20.0, max_age=1)
+        tracker.update([(0, 0), (100, 0), (200, 0)], timestamp=0.0)
+        tracker.update([(200, 0)], timestamp=0.1)
+        tracker.update([(200, 0)], timestamp=0.2)
+        
+        assert tracker._ids_by_row == ['track_3']
+        assert list(tracker.last_positions) == ['track_3']
+        assert tuple(tracker._track_xy[0]) == (200, 0)
+    
+    def test_fast_track_matched_at_predicted_position(self):
+        """Test that matching follows a track's velocity between frames"""
+        tracker = MultiObjectTracker(max_distance=50.0)
+        tracker.update([(0, 0)], timestamp=0.0)
+        tracker.update([(40, 0)], timestamp=0.1)
+        
+        # 60px from the last position, but 20px from where it should be
+        tracks = tracker.update([(100, 0)], timestamp=0.2)
+        
+        assert list(tracks) == ['track_1']
+    
+    def test_update_arrays_matches_update(self):
+        """Test that the array API reports the same tracks as update()"""
+        tuples = MultiObjectTracker()
+        arrays = MultiObjectTracker()
+        
+        for i in range(6):
+            detections = [(100 + i * 20, 100), (400, 300 - i * 20)]
+            expected = tuples.update(detections, timestamp=i * 0.1)
+            ids, xy, dirs = arrays.update_arrays(detections, timestamp=i * 0.1)
+            
+            assert xy.dtype == np.int32 and xy.shape == (2, 2)
+            assert dirs.dtype == np.int8
+            assert {
+                track_id: (tuple(int(v) for v in xy[k]), Direction(int(dirs[k])))
+                for k, track_id in enumerate(ids)
+            } == expected
+        
+        assert Direction(int(dirs[0])) == Direction.LEFT_TO_RIGHT
+    
+    def test_tracks_expire_after_max_age(self):
+        """Test that a track survives max_age missed frames, then is dropped"""
+        tracker = MultiObjectTracker(max_age=3)
+        tracker.update([(100, 100)], timestamp=0.0)
+        tracker.update([(102, 100)], timestamp=0.1)
+        
+        for i in range(2):
+            tracker.update([], timestamp=0.2 + i * 0.1)
+        
+        assert tracker.track_ages == {'track_1': 3}
+        
+        tracker.update([], timestamp=0.4)
+        
+        assert tracker.track_ages == {}
+        assert tracker.motion_tracker.get_track_count() == 0
+    
+    def test_optimal_assignment_matches_all_tracks(self):
+        """Test that assignment minimizes total distance, not per-track"""
+        pytest.importorskip('scipy')
+        tracker = MultiObjectTracker(max_distance=60.0)
+        tracker.update([(50, 0), (0, 0)], timestamp=0.0)
+        
+        # Greedy would give track_1 the (40, 0) detection and orphan track_2
+        tracks = tracker.update([(40, 0), (95, 0)], timestamp=0.1)
+        
+        assert set(tracks) == {'track_1', 'track_2'}
+        assert tracks['track_1'][0] == (95, 0)
+        assert tracks['track_2'][0] == (40, 0)
+    
+    def test_assignment_ignores_pairs_beyond_max_distance(self):
+        """Test that gated pairs can't win the assignment and orphan a valid match"""
+        pytest.importorskip('scipy')
+        tracker = MultiObjectTracker(max_distance=50.0)
+        tracker.update([(0, 0), (8, 0)], timestamp=0.0)
+        
+        # Raw squared distances favor (0→52, 8→60), both just past the gate;
+        # only 8→52 is within max_distance
+        tracks = tracker.update([(52, 0), (60, 0)], timestamp=0.1)
+        
+        assert set(tracks) == {'track_2', 'track_3'}
+        assert tracks['track_2'][0] == (52, 0)
+        assert tracks['track_3'][0] == (60, 0)
 
 
 class TestEdgeCases:
@@ -305,5 +417,185 @@ class TestVelocityCalculation:
         assert direction != Direction.STATIONARY
 
 
+class TestActiveTracks:
+    """Test active track queries"""
+    
+    def test_inactive_tracks_leave_active_set(self):
+        """Test that stale tracks are excluded from active queries"""
+        tracker = MotionTracker(inactive_timeout=2.0)
+        now = time.monotonic()
+        tracker.update("old", (100, 100), timestamp=now - 10.0)
+        tracker.update("new", (200, 200), timestamp=now)
+        
+        assert list(tracker.get_active_tracks()) == ["new"]
+        assert [t.object_id for t in tracker.iter_active()] == ["new"]
+        assert tracker.get_active_track_count() == 1
+        assert tracker.get_track_count() == 2
+        assert tracker.get_track_info("old").is_active is False
+    
+    def test_clear_inactive_tracks(self):
+        """Test that only timed-out tracks are cleared, and updates revive tracks"""
+        tracker = MotionTracker(inactive_timeout=2.0)
+        now = time.monotonic()
+        tracker.update("old", (100, 100), timestamp=now - 10.0)
+        tracker.update("stale", (150, 150), timestamp=now - 10.0)
+        tracker.update("new", (200, 200), timestamp=now)
+        
+        assert tracker.get_active_track_count() == 1
+        
+        tracker.update("stale", (160, 150))
+        
+        assert tracker.clear_inactive_tracks() == 1
+        assert tracker.get_track_info("old") is None
+        assert sorted(tracker.get_active_tracks()) == ["new", "stale"]
+    
+    def test_timestamps_stored_as_integer_ns(self, motion_tracker):
+        """Test that update times are kept as monotonic nanoseconds"""
+        motion_tracker.update("obj_1", (100, 100), timestamp=12.5)
+        
+        assert motion_tracker.get_track_info("obj_1").last_update_time == 12_500_000_000
+    
+    def test_clear_track_removes_from_active(self, motion_tracker):
+        """Test that cleared tracks are no longer active"""
+        motion_tracker.update("obj_1", (100, 100))
+        motion_tracker.clear_track("obj_1")
+        
+        assert motion_tracker.get_active_track_count() == 0
+        assert motion_tracker.get_fastest_object() is None
+    
+    def test_fastest_object_follows_slowdown(self, motion_tracker):
+        """Test that the fastest object changes when the leader slows down"""
+        motion_tracker.inactive_timeout = float('inf')
+        
+        for i in range(3):
+            motion_tracker.update("fast", (100 + i * 50, 100), timestamp=1000.0 + i)
+            motion_tracker.update("slow", (100 + i * 10, 300), timestamp=1000.0 + i)
+        
+        assert motion_tracker.get_fastest_object().object_id == "fast"
+        
+        # Leader stops moving; "slow" should take over
+        for i in range(3, 15):
+            motion_tracker.update("fast", (200, 100), timestamp=1000.0 + i)
+            motion_tracker.update("slow", (100 + i * 10, 300), timestamp=1000.0 + i)
+        
+        assert motion_tracker.get_fastest_object().object_id == "slow"
+    
+    def test_fastest_object_with_only_stationary_tracks(self, motion_tracker):
+        """Test that a stationary track is still returned when it is the only one"""
+        for _ in range(6):
+            motion_tracker.update("a", (100, 100))
+        
+        fastest = motion_tracker.get_fastest_object()
+        
+        assert fastest is not None
+        assert fastest.object_id == "a"
+
+
+class TestBatchUpdate:
+    """Test batched per-frame updates"""
+    
+    def test_batch_matches_single_updates(self):
+        """Test that update_batch gives the same result as update()"""
+        single = MotionTracker(history_length=30, movement_threshold=50)
+        batch = MotionTracker(history_length=30, movement_threshold=50)
+        ids = ["a", "b", "c"]
+        
+        for frame in range(20):
+            centers = [(100 + frame * 8, 240), (320, 400 - frame * 6), (50, 50)]
+            timestamp = frame * 0.1
+            
+            expected = [
+                single.update(obj_id, center, timestamp)
+                for obj_id, center in zip(ids, centers)
+            ]
+            assert batch.update_batch(ids, centers, timestamp) == expected
+        
+        for obj_id in ids:
+            a = single.get_track_info(obj_id)
+            b = batch.get_track_info(obj_id)
+            assert b.velocity == pytest.approx(a.velocity)
+            assert b.total_displacement == pytest.approx(a.total_displacement)
+        
+        assert batch.get_track_info("a").current_direction == Direction.LEFT_TO_RIGHT
+        assert batch.get_track_info("b").current_direction == Direction.BOTTOM_TO_TOP
+
+
+class TestTrackTable:
+    """Test row-indexed position history"""
+    
+    def test_row_wraps_at_capacity(self):
+        """Test that oldest positions are overwritten when full"""
+        table = TrackTable(history_length=4)
+        row = table.add("obj_1")
+        
+        for i in range(6):
+            table.append(row, i, i * 2, i)
+        
+        assert table.counts[row] == 4
+        assert table.xs[row, table.index(row, 0)] == 2
+        assert table.xs[row, table.index(row, -1)] == 5
+        assert table.ys[row, table.index(row, -1)] == 10
+        assert table.history(row).tolist() == [[2, 4], [3, 6], [4, 8], [5, 10]]
+    
+    def test_history_bounded_by_history_length(self, motion_tracker):
+        """Test that tracker history is bounded by history_length"""
+        for i in range(40):
+            motion_tracker.update("obj_1", (100 + i, 200), timestamp=float(i))
+        
+        history = motion_tracker.get_position_history("obj_1")
+        assert len(history) == 30
+        assert tuple(history[0]) == (110, 200)
+        
+        motion_tracker.history_length = 10
+        history = motion_tracker.get_position_history("obj_1")
+        assert len(history) == 10
+        assert tuple(history[0]) == (130, 200)
+    
+    def test_path_length_tracks_window(self):
+        """Test incremental path length matches a full recompute"""
+        table = TrackTable(history_length=5)
+        row = table.add("obj_1")
+        points = [(0, 0), (3, 4), (3, 10), (10, 10), (10, 0), (0, 0), (6, 8)]
+        
+        for i, (x, y) in enumerate(points):
+            table.append(row, x, y, i)
+        
+        window = points[-5:]
+        expected = sum(
+            ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+            for (x1, y1), (x2, y2) in zip(window, window[1:])
+        )
+        assert table.path_length[row] == pytest.approx(expected)
+    
+    def test_table_grows_past_initial_capacity(self):
+        """Test that rows keep their data when the columns grow"""
+        table = TrackTable(history_length=3, capacity=2)
+        
+        for k in range(5):
+            row = table.add(f"obj_{k}")
+            table.append(row, k, k, 0)
+        
+        assert len(table) == 5
+        assert [int(table.xs[table.row_of[f"obj_{k}"], 0]) for k in range(5)] == list(range(5))
+    
+    def test_cleared_track_storage_is_reused(self, motion_tracker):
+        """Test that a new track starts fresh on a recycled row"""
+        for i in range(6):
+            motion_tracker.update("old", (100 + i * 20, 100), timestamp=float(i))
+        
+        row = motion_tracker._table.row_of["old"]
+        motion_tracker.clear_track("old")
+        motion_tracker.update("new", (500, 500), timestamp=10.0)
+        
+        assert motion_tracker._table.row_of["new"] == row
+        assert motion_tracker.get_position_history("new").tolist() == [[500, 500]]
+        assert motion_tracker._table.path_length[row] == 0.0
+        
+        track = motion_tracker.get_track_info("new")
+        assert track.object_id == "new"
+        assert track.frames_tracked == 1
+        assert track.current_direction == Direction.UNKNOWN
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,12 +4,30 @@ Unit tests for Object Detector
 Tests YOLO detection, filtering, and visualization.
 """
 
+import cv2
 import pytest
 import numpy as np
 from unittest.mock import Mock, MagicMock, patch
 from src.ai.object_detector import ObjectDetector, DetectionResult
 
 
+COCO_NAMES = {0: 'person', 1: 'bicycle', 2: 'car'}
+
+
+def make_boxes(cls, conf, xyxy, ids=None):
+    """Build a mock Results.boxes holding one row per detection"""
+    columns = [np.array(xyxy, dtype=np.float32).reshape(-1, 4)]
+    if ids is not None:
+        columns.append(np.array(ids, dtype=np.float32)[:, None])
+    columns.append(np.array(conf, dtype=np.float32)[:, None])
+    columns.append(np.array(cls, dtype=np.float32)[:, None])
+    
+    boxes = MagicMock()
+    boxes.data = np.hstack(columns)
+    boxes.__len__.return_value = len(cls)
+    return boxes
+
+
 @pytest.fixture
 def sample_frame():
     """Create a sample video frame (640x480 BGR)"""
@@ -19,7 +37,8 @@ def sample_frame():
 @pytest.fixture
 def detector():
     """Create object detector with mocked YOLO model"""
-    with patch('src.ai.object_detector.YOLO'):
+    with patch('src.ai.object_detector.YOLO') as mock_yolo:
+        mock_yolo.return_value.names = COCO_NAMES
         detector = ObjectDetector(
             model_path='yolov8n.pt',
             confidence_threshold=0.5
@@ -43,6 +62,16 @@ class TestDetectorInit:
                 confidence_threshold=0.7
             )
             assert detector.confidence_threshold == 0.7
+    
+    def test_warmup_runs_on_gpu_devices_only(self):
+        """Test that dummy inferences run at startup off the CPU"""
+        with patch('src.ai.object_detector.YOLO') as mock_yolo:
+            mock_yolo.return_value.names = COCO_NAMES
+            ObjectDetector(device='cpu')
+            assert mock_yolo.return_value.call_count == 0
+            
+            ObjectDetector(device='cuda', warmup_iterations=2)
+            assert mock_yolo.return_value.call_count == 2
 
 
 class TestDetection:
@@ -65,13 +94,10 @@ class TestDetection:
     def test_detect_person(self, detector, sample_frame):
         """Test detection of person"""
         # Create mock detection result
-        mock_box = MagicMock()
-        mock_box.cls = [0]  # Class 0 = person in COCO
-        mock_box.conf = [0.9]  # Confidence 0.9
-        mock_box.xyxy = [[100, 100, 200, 300]]  # Bounding box
+        mock_box = make_boxes([0], [0.9], [[100, 100, 200, 300]])  # Class 0 = person in COCO
         
         mock_results = MagicMock()
-        mock_results.boxes = [mock_box]
+        mock_results.boxes = mock_box
         mock_results.names = {0: 'person', 1: 'bicycle'}
         
         detector.model.return_value = [mock_results]
@@ -83,18 +109,12 @@ class TestDetection:
     def test_detect_multiple_objects(self, detector, sample_frame):
         """Test detection of multiple objects"""
         # Create multiple mock detections
-        mock_box1 = MagicMock()
-        mock_box1.cls = [0]  # Person
-        mock_box1.conf = [0.9]
-        mock_box1.xyxy = [[100, 100, 200, 300]]
-        
-        mock_box2 = MagicMock()
-        mock_box2.cls = [0]  # Person
-        mock_box2.conf = [0.8]
-        mock_box2.xyxy = [[300, 150, 450, 400]]
-        
         mock_results = MagicMock()
-        mock_results.boxes = [mock_box1, mock_box2]
+        mock_results.boxes = make_boxes(
+            [0, 0],  # Two persons
+            [0.9, 0.8],
+            [[100, 100, 200, 300], [300, 150, 450, 400]]
+        )
         mock_results.names = {0: 'person'}
         
         detector.model.return_value = [mock_results]
@@ -102,6 +122,116 @@ class TestDetection:
         detections = detector.detect(sample_frame)
         
         assert len(detections) == 2
+    
+    def test_detect_filters_and_decodes_boxes(self, detector, sample_frame):
+        """Test that kept boxes are decoded and track IDs ignored outside tracking"""
+        mock_results = MagicMock()
+        mock_results.boxes = make_boxes(
+            [2, 0],  # Car is filtered, person is kept
+            [0.9, 0.8],
+            [[0, 0, 10, 10], [100, 100, 200, 300]],
+            ids=[3, 5]
+        )
+        detector.target_classes = ['person']
+        detector.model.return_value = [mock_results]
+        
+        detections = detector.detect(sample_frame)
+        
+        assert len(detections) == 1
+        assert detections[0].track_id is None
+        assert detections[0].class_id == 0
+        assert detections[0].bbox == (100, 100, 200, 300)
+        assert detections[0].center == (150, 200)
+    
+    def test_detect_uses_capture_timestamp(self, detector, sample_frame):
+        """Test that a caller-supplied capture time is kept on detections"""
+        mock_results = MagicMock()
+        mock_results.boxes = make_boxes([0], [0.9], [[100, 100, 200, 300]])
+        detector.model.return_value = [mock_results]
+        
+        detections = detector.detect(sample_frame, frame_number=3, timestamp=123.5)
+        
+        assert detections[0].timestamp == 123.5
+        assert detections[0].frame_number == 3
+    
+    def test_detect_and_track_uses_shared_decoder(self, detector, sample_frame):
+        """Test that tracking results are filtered and carry track IDs"""
+        mock_results = MagicMock()
+        mock_results.boxes = make_boxes(
+            [0, 0], [0.9, 0.2], [[100, 100, 200, 300], [0, 0, 10, 10]], ids=[4, 9]
+        )
+        detector.model.track.return_value = [mock_results]
+        
+        detections = detector.detect_and_track(sample_frame, frame_number=2)
+        
+        assert [d.track_id for d in detections] == [4]
+        assert detections[0].frame_number == 2
+
+
+class TestBatchDetection:
+    """Test batched detection"""
+    
+    def test_detect_batch_returns_one_list_per_frame(self, detector, sample_frame):
+        """Test that batched frames come back in input order"""
+        mock_box = make_boxes([0], [0.9], [[100, 100, 200, 300]])
+        
+        with_person = MagicMock()
+        with_person.boxes = mock_box
+        empty = MagicMock()
+        empty.boxes = []
+        
+        detector.model.side_effect = [[with_person, empty], [empty]]
+        
+        results = detector.detect_batch(
+            [sample_frame] * 3,
+            frame_numbers=[7, 8, 9],
+            batch_size=2
+        )
+        
+        assert detector.model.call_count == 2
+        assert [len(dets) for dets in results] == [1, 0, 0]
+        assert results[0][0].frame_number == 7
+    
+    def test_detect_batch_failure_keeps_frame_count(self, detector, sample_frame):
+        """Test that a failed batch yields empty lists, not missing frames"""
+        detector.model.side_effect = RuntimeError("boom")
+        
+        results = detector.detect_batch([sample_frame] * 3)
+        
+        assert results == [[], [], []]
+    
+    def test_detect_stream_yields_every_frame_in_order(self, detector, sample_frame):
+        """Test that streamed frames come back numbered, stamped and in order"""
+        person = MagicMock()
+        person.boxes = make_boxes([0], [0.9], [[100, 100, 200, 300]])
+        empty = MagicMock()
+        empty.boxes = []
+        detector.model.side_effect = [[person, empty], [person]]
+        
+        results = list(detector.detect_stream(iter([sample_frame] * 3), batch_size=2))
+        
+        assert [frame_number for frame_number, _, _ in results] == [0, 1, 2]
+        assert [len(dets) for _, _, dets in results] == [1, 0, 1]
+        assert results[2][2][0].timestamp == results[2][1]
+    
+    def test_from_video_reads_every_frame(self, tmp_path):
+        """Test that from_video decodes a file and detects on each frame"""
+        video_path = str(tmp_path / 'clip.avi')
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (64, 48))
+        for _ in range(4):
+            writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        writer.release()
+        
+        empty = MagicMock()
+        empty.boxes = []
+        
+        with patch('src.ai.object_detector.DECORD_AVAILABLE', False), \
+             patch('src.ai.object_detector.YOLO') as mock_yolo:
+            mock_yolo.return_value.names = COCO_NAMES
+            mock_yolo.return_value.return_value = [empty]
+            results = list(ObjectDetector.from_video(video_path))
+        
+        assert [frame_number for frame_number, _, _ in results] == [0, 1, 2, 3]
 
 
 class TestConfidenceFiltering:
@@ -110,13 +240,10 @@ class TestConfidenceFiltering:
     def test_filter_low_confidence(self, detector, sample_frame):
         """Test filtering of low confidence detections"""
         # Create detection below threshold
-        mock_box = MagicMock()
-        mock_box.cls = [0]
-        mock_box.conf = [0.3]  # Below 0.5 threshold
-        mock_box.xyxy = [[100, 100, 200, 300]]
+        mock_box = make_boxes([0], [0.3], [[100, 100, 200, 300]])  # Below 0.5 threshold
         
         mock_results = MagicMock()
-        mock_results.boxes = [mock_box]
+        mock_results.boxes = mock_box
         mock_results.names = {0: 'person'}
         
         detector.model.return_value = [mock_results]
@@ -129,13 +256,10 @@ class TestConfidenceFiltering:
     
     def test_filter_high_confidence(self, detector, sample_frame):
         """Test keeping high confidence detections"""
-        mock_box = MagicMock()
-        mock_box.cls = [0]
-        mock_box.conf = [0.9]  # Above 0.5 threshold
-        mock_box.xyxy = [[100, 100, 200, 300]]
+        mock_box = make_boxes([0], [0.9], [[100, 100, 200, 300]])  # Above 0.5 threshold
         
         mock_results = MagicMock()
-        mock_results.boxes = [mock_box]
+        mock_results.boxes = mock_box
         mock_results.names = {0: 'person'}
         
         detector.model.return_value = [mock_results]
@@ -166,6 +290,17 @@ class TestDetectionResult:
         assert result.bbox == (100, 100, 200, 300)
         assert result.center == (150, 200)
     
+    def test_detection_result_is_slotted(self):
+        """Test that results have no instance dict and reject unknown attributes"""
+        result = DetectionResult('person', 0.95, (100, 100, 200, 300), (150, 200), 0, 0.0)
+        
+        with pytest.raises(AttributeError):
+            result.label = 'person'
+        
+        result.track_id = 3
+        assert result.track_id == 3
+        assert not hasattr(result, '__dict__')
+    
     def test_detection_result_center_calculation(self):
         """Test that center is calculated correctly from bbox"""
         bbox = (100, 100, 200, 300)
@@ -184,13 +319,10 @@ class TestClassFiltering:
         detector.target_classes = ['person']
         
         # Create car detection (not in target classes)
-        mock_box = MagicMock()
-        mock_box.cls = [2]  # Car class
-        mock_box.conf = [0.9]
-        mock_box.xyxy = [[100, 100, 200, 300]]
+        mock_box = make_boxes([2], [0.9], [[100, 100, 200, 300]])  # Car class
         
         mock_results = MagicMock()
-        mock_results.boxes = [mock_box]
+        mock_results.boxes = mock_box
         mock_results.names = {0: 'person', 2: 'car'}
         
         detector.model.return_value = [mock_results]
@@ -199,6 +331,73 @@ class TestClassFiltering:
         
         # Should be filtered out (car not in target_classes)
         assert len(detections) == 0
+    
+    def test_detect_applies_per_call_filters(self, detector, sample_frame):
+        """Test that class_ids and min_confidence narrow the results in the detector"""
+        mock_results = MagicMock()
+        mock_results.boxes = make_boxes(
+            [0, 2, 0], [0.9, 0.9, 0.55], [[0, 0, 10, 10], [20, 20, 40, 40], [50, 50, 60, 60]]
+        )
+        detector.model.return_value = [mock_results]
+        
+        detections = detector.detect(
+            sample_frame, class_ids=detector.class_ids_for({'person'}), min_confidence=0.6
+        )
+        
+        assert [(d.class_name, d.bbox) for d in detections] == [('person', (0, 0, 10, 10))]
+        
+        # The same filters are handed to YOLO so NMS drops rows on device
+        kwargs = detector.model.call_args.kwargs
+        assert kwargs['classes'] == [0]
+        assert kwargs['conf'] == 0.6
+    
+    def test_no_wanted_classes_skips_inference(self, detector, sample_frame):
+        """Test that an empty class filter returns empty results without a model call"""
+        detections = detector.detect_batch(
+            [sample_frame, sample_frame], class_ids=detector.class_ids_for({'unknown'})
+        )
+        
+        assert detections == [[], []]
+        detector.model.assert_not_called()
+    
+    def test_filter_by_class(self, detector):
+        """Test list and array class filters agree"""
+        person = DetectionResult('person', 0.9, (0, 0, 10, 10), (5, 5), 0, 0.0)
+        car = DetectionResult('car', 0.9, (0, 0, 10, 10), (5, 5), 0, 0.0)
+        
+        assert detector.filter_by_class([person, car, person], ['person']) == [person, person]
+        
+        mask = detector.class_id_mask(np.array([0, 2, 0, 1]), ['person', 'unknown'])
+        assert mask.tolist() == [True, False, True, False]
+
+
+class TestSelection:
+    """Test picking a primary detection"""
+    
+    @staticmethod
+    def make_detection(bbox):
+        center = ((bbox[0] + bbox[2]) // 2, (bbox[1] + bbox[3]) // 2)
+        return DetectionResult('person', 0.9, bbox, center, 0, 0.0)
+    
+    def test_largest_and_closest(self, detector):
+        """Test single-frame selection by area and by distance to center"""
+        small = self.make_detection((0, 0, 10, 10))
+        large = self.make_detection((100, 100, 300, 300))
+        central = self.make_detection((300, 220, 340, 260))
+        
+        assert detector.get_largest_detection([small, large, central]) is large
+        assert detector.get_closest_to_center([small, large, central], (480, 640)) is central
+        assert detector.get_largest_detection([]) is None
+    
+    def test_batch_selection_handles_empty_frames(self, detector):
+        """Test per-frame selection over a batch with empty frames"""
+        small = self.make_detection((0, 0, 10, 10))
+        large = self.make_detection((100, 100, 300, 300))
+        
+        largest = detector.get_largest_detections([[small, large], [], [small]])
+        
+        assert largest == [large, None, small]
+        assert detector.get_closest_to_center_batch([[], []], (480, 640)) == [None, None]
 
 
 class TestVisualization:
@@ -238,6 +437,29 @@ class TestVisualization:
         
         assert frame_with_detections is not None
         assert frame_with_detections.shape == sample_frame.shape
+    
+    def test_draw_inplace_skips_copy(self, detector, sample_frame):
+        """Test that inplace=True draws on the caller's frame"""
+        detection = DetectionResult('person', 0.95, (100, 100, 200, 300), (150, 200), 0, 0.0)
+        original = sample_frame.copy()
+        
+        copied = detector.draw_detections(sample_frame, [detection])
+        assert copied is not sample_frame
+        assert np.array_equal(sample_frame, original)
+        
+        drawn = detector.draw_detections(sample_frame, [detection], inplace=True)
+        assert drawn is sample_frame
+        assert not np.array_equal(sample_frame, original)
+    
+    def test_label_sizes_are_cached(self, detector, sample_frame):
+        """Test that each label is measured once across frames"""
+        detection = DetectionResult('person', 0.95, (100, 100, 200, 300), (150, 200), 0, 0.0)
+        
+        with patch('src.ai.object_detector.cv2.getTextSize', wraps=cv2.getTextSize) as measure:
+            detector.draw_detections(sample_frame, [detection])
+            detector.draw_detections(sample_frame, [detection])
+        
+        assert measure.call_count == 1
 
 
 class TestEdgeCases:
@@ -271,13 +493,10 @@ class TestEdgeCases:
         """Test with confidence threshold of 0 (should accept all)"""
         detector.confidence_threshold = 0.0
         
-        mock_box = MagicMock()
-        mock_box.cls = [0]
-        mock_box.conf = [0.01]  # Very low confidence
-        mock_box.xyxy = [[100, 100, 200, 300]]
+        mock_box = make_boxes([0], [0.01], [[100, 100, 200, 300]])  # Very low confidence
         
         mock_results = MagicMock()
-        mock_results.boxes = [mock_box]
+        mock_results.boxes = mock_box
         mock_results.names = {0: 'person'}
         
         detector.model.return_value = [mock_results]
@@ -0,0 +1,65 @@
+"""
+Unit tests for Pipelined Detector
+
+Tests the threaded capture -> detect -> draw pipeline with a mocked detector.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from src.ai.object_detector import DetectionResult
+from src.ai.pipelined_detector import PipelinedDetector
+
+
+@pytest.fixture
+def frames():
+    """Create a short sequence of distinguishable frames"""
+    return [np.full((48, 64, 3), i, dtype=np.uint8) for i in range(10)]
+
+
+@pytest.fixture
+def detector():
+    """Create a mock detector that reports one detection per frame"""
+    detector = Mock()
+    detector.detect.side_effect = lambda frame, frame_number, timestamp: [
+        DetectionResult('person', 0.9, (0, 0, 10, 10), (5, 5), frame_number, timestamp)
+    ]
+    detector.draw_detections.side_effect = lambda frame, detections, **kwargs: frame
+    return detector
+
+
+class TestPipelinedDetector:
+    """Test pipelined detection"""
+    
+    def test_frames_arrive_in_order(self, detector, frames):
+        """Test that every frame reaches the sink in order with its detections"""
+        received = []
+        pipeline = PipelinedDetector(detector, prefetch=2)
+        
+        count = pipeline.run(frames, sink=lambda idx, frame, dets: received.append((idx, frame, dets)))
+        
+        assert count == len(frames)
+        assert [idx for idx, _, _ in received] == list(range(len(frames)))
+        assert all(int(frame[0, 0, 0]) == idx for idx, frame, _ in received)
+        assert all(dets[0].frame_number == idx for idx, _, dets in received)
+        assert detector.draw_detections.call_count == len(frames)
+        assert detector.draw_detections.call_args.kwargs['inplace'] is True
+    
+    def test_draw_can_be_disabled(self, detector, frames):
+        """Test that drawing is skipped when draw=False"""
+        pipeline = PipelinedDetector(detector, draw=False)
+        
+        assert pipeline.run(frames) == len(frames)
+        detector.draw_detections.assert_not_called()
+    
+    def test_detector_error_stops_pipeline(self, detector, frames):
+        """Test that an inference failure ends the run instead of hanging"""
+        detector.detect.side_effect = RuntimeError("model crashed")
+        pipeline = PipelinedDetector(detector, prefetch=1)
+        
+        assert pipeline.run(frames) == 0
+        assert not pipeline.is_running()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,89 @@
+"""
+Unit tests for Process Detector
+
+Runs a lightweight stand-in detector in the child process, so no model is
+loaded.
+"""
+
+import pytest
+import numpy as np
+from src.ai.object_detector import DetectionResult
+from src.ai.process_detector import ProcessDetector
+
+
+class FakeDetector:
+    """Reports each frame's first pixel value back as its confidence"""
+    
+    def __init__(self, fail=False):
+        if fail:
+            raise RuntimeError("no model")
+        self.class_names = {0: 'person', 1: 'bicycle', 2: 'car'}
+    
+    def detect_batch(self, frames, frame_numbers=None, timestamps=None, class_ids=None, min_confidence=None):
+        results = []
+        for frame, frame_number in zip(frames, frame_numbers):
+            height, width = frame.shape[:2]
+            results.append([DetectionResult(
+                'person', float(frame[0, 0, 0]), (0, 0, width, height),
+                (width // 2, height // 2), frame_number, 0.0
+            )])
+        return results
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Start one detector process for the whole module"""
+    with ProcessDetector(max_frame_shape=(64, 64, 3), slots=2, detector_factory=FakeDetector) as detector:
+        yield detector
+
+
+class TestProcessDetector:
+    """Test round trips through the detector process"""
+    
+    def test_class_names_come_from_child(self, detector):
+        """Test that class names are reported back at startup"""
+        assert detector.class_names == {0: 'person', 1: 'bicycle', 2: 'car'}
+        assert detector.class_ids_for(['car', 'person', 'dog']).tolist() == [0, 2]
+    
+    def test_detect_single_frame(self, detector):
+        """Test that frame pixels reach the child through shared memory"""
+        frame = np.full((48, 32, 3), 7, dtype=np.uint8)
+        
+        detections = detector.detect(frame, frame_number=5)
+        
+        assert len(detections) == 1
+        assert detections[0].confidence == 7.0
+        assert detections[0].bbox == (0, 0, 32, 48)
+        assert detections[0].frame_number == 5
+    
+    def test_batch_larger_than_slots(self, detector):
+        """Test that batches are split across round trips and keep their order"""
+        frames = [np.full((16, 16, 3), i, dtype=np.uint8) for i in range(5)]
+        
+        results = detector.detect_batch(frames, frame_numbers=[10, 11, 12, 13, 14])
+        
+        assert [dets[0].confidence for dets in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert [dets[0].frame_number for dets in results] == [10, 11, 12, 13, 14]
+    
+    def test_oversized_frame_rejected(self, detector):
+        """Test that frames larger than max_frame_shape raise ValueError"""
+        with pytest.raises(ValueError):
+            detector.detect(np.zeros((128, 128, 3), dtype=np.uint8))
+    
+    def test_startup_failure_raises(self):
+        """Test that a detector that fails to load is reported to the parent"""
+        with pytest.raises(RuntimeError, match="no model"):
+            ProcessDetector(max_frame_shape=(8, 8, 3), detector_factory=FakeDetector, fail=True)
+    
+    def test_close_stops_process(self):
+        """Test that close() shuts the child down"""
+        detector = ProcessDetector(max_frame_shape=(8, 8, 3), detector_factory=FakeDetector)
+        assert detector.is_alive()
+        
+        detector.close()
+        
+        assert not detector.is_alive()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+"""
+Unit tests for Video Stream Handler
+
+Exercises the frame ring without opening a real stream.
+"""
+
+import threading
+import pytest
+import numpy as np
+from src.video.stream_handler import VideoStreamHandler
+
+
+def make_frame(value):
+    """Create a tiny frame tagged with value"""
+    return np.full((2, 2, 3), value, dtype=np.uint8)
+
+
+def push(stream, value):
+    """Append a frame the way the capture thread does"""
+    stream.frame_ring.append(make_frame(value))
+    stream._frame_ready.set()
+
+
+@pytest.fixture
+def stream():
+    """Create stream handler without starting capture"""
+    return VideoStreamHandler("unused.mp4", buffer_size=3)
+
+
+class TestFrameRing:
+    """Test frame hand-off between the capture thread and consumers"""
+    
+    def test_read_returns_frames_in_order(self, stream):
+        """Test that read() pops the oldest buffered frame"""
+        for value in (1, 2):
+            push(stream, value)
+        
+        assert stream.read(timeout=0.01)[0, 0, 0] == 1
+        assert stream.read(timeout=0.01)[0, 0, 0] == 2
+        assert stream.read(timeout=0.01) is None
+    
+    def test_grab_latest_skips_backlog(self, stream):
+        """Test that grab(latest=True) takes the newest frame and counts the rest as dropped"""
+        for value in (1, 2, 3):
+            push(stream, value)
+        
+        assert stream.grab(timeout=0.01, latest=True)
+        assert stream.retrieve()[0, 0, 0] == 3
+        assert stream.stats.frames_dropped == 2
+        assert not stream.grab(timeout=0.01)
+        assert stream.retrieve() is None
+    
+    def test_ring_keeps_newest_frames(self, stream):
+        """Test that a full ring drops its oldest frame"""
+        for value in range(5):
+            push(stream, value)
+        
+        assert [stream.read(timeout=0.01)[0, 0, 0] for _ in range(3)] == [2, 3, 4]
+    
+    def test_waiting_consumer_wakes_on_new_frame(self, stream):
+        """Test that a blocked grab() returns as soon as a frame arrives"""
+        timer = threading.Timer(0.05, push, args=(stream, 9))
+        timer.start()
+        
+        try:
+            assert stream.grab(timeout=2.0)
+        finally:
+            timer.join()
+        
+        assert stream.retrieve()[0, 0, 0] == 9
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
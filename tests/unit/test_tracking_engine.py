@@ -0,0 +1,728 @@
+"""
+Unit tests for Tracking Engine
+
+Tests object ID assignment and frame handling with mocked camera components.
+"""
+
+import pytest
+import threading
+import numpy as np
+from unittest.mock import Mock
+from src.ai.motion_tracker import MotionTracker, Direction
+from src.ai.object_detector import DetectionResult
+from src.automation.tracking_engine import TrackingEngine, TrackingConfig, TrackingZone, _greedy_associate
+
+
+def make_detection(center, class_name='person', confidence=0.9, class_id=-1):
+    """Create a detection with a small box around center"""
+    x, y = center
+    return DetectionResult(
+        class_name, confidence, (x - 5, y - 5, x + 5, y + 5), center, 0, 0.0, class_id=class_id
+    )
+
+
+@pytest.fixture
+def engine():
+    """Create tracking engine with mocked detector, camera and stream (motion gate off)"""
+    return TrackingEngine(
+        detector=Mock(),
+        motion_tracker=MotionTracker(),
+        ptz_controller=Mock(),
+        stream_handler=Mock(),
+        config=TrackingConfig(motion_gate_pixels=0)
+    )
+
+
+class TestObjectIdAssignment:
+    """Test centroid-based object ID assignment"""
+    
+    def test_new_detections_get_new_ids(self, engine):
+        """Test that unmatched detections start new tracks"""
+        assigned = engine._assign_object_ids([make_detection((100, 100)), make_detection((400, 300))])
+        
+        assert [object_id for object_id, _ in assigned] == [0, 1]
+        assert engine.object_centroids == {0: (100, 100), 1: (400, 300)}
+    
+    def test_moved_detections_keep_ids(self, engine):
+        """Test that nearby detections are matched back to their tracks"""
+        engine._assign_object_ids([make_detection((100, 100)), make_detection((400, 300))])
+        
+        # Reversed order, both moved a little
+        assigned = engine._assign_object_ids([make_detection((410, 305)), make_detection((110, 95))])
+        
+        assert [object_id for object_id, _ in assigned] == [1, 0]
+        assert engine.next_object_id == 2
+    
+    def test_closest_pair_wins(self, engine):
+        """Test that a track goes to its closest detection, not the first one"""
+        engine._assign_object_ids([make_detection((100, 100))])
+        
+        assigned = engine._assign_object_ids([make_detection((130, 100)), make_detection((105, 100))])
+        
+        assert [object_id for object_id, _ in assigned] == [1, 0]
+    
+    def test_ids_only_match_same_class(self, engine):
+        """Test that a detection never takes over a nearby track of another class"""
+        engine._assign_object_ids([make_detection((100, 100)), make_detection((140, 100), 'bicycle')])
+        
+        # The bicycle moved onto the person's old spot and vice versa
+        assigned = engine._assign_object_ids([
+            make_detection((102, 100), 'bicycle'),
+            make_detection((138, 100))
+        ])
+        
+        assert [object_id for object_id, _ in assigned] == [1, 0]
+    
+    def test_ids_match_on_model_class_id(self, engine):
+        """Test that detector class IDs separate classes without comparing names"""
+        engine._assign_object_ids([
+            make_detection((100, 100), class_id=0),
+            make_detection((140, 100), 'bicycle', class_id=1)
+        ])
+        
+        assigned = engine._assign_object_ids([
+            make_detection((102, 100), 'bicycle', class_id=1),
+            make_detection((138, 100), class_id=0)
+        ])
+        
+        assert [object_id for object_id, _ in assigned] == [1, 0]
+    
+    def test_distance_threshold_is_exclusive(self, engine):
+        """Test that a detection exactly max_centroid_distance away starts a new track"""
+        engine.max_centroid_distance = 30
+        engine._assign_object_ids([make_detection((100, 100))])
+        
+        assigned = engine._assign_object_ids([make_detection((130, 100)), make_detection((100, 129))])
+        
+        assert [object_id for object_id, _ in assigned] == [1, 0]
+    
+    def test_many_tracks_grow_storage(self, engine):
+        """Test that more tracks than the initial capacity keep their IDs"""
+        centers = [(x * 100, y * 100) for x in range(6) for y in range(5)]
+        engine._assign_object_ids([make_detection(c) for c in centers])
+        
+        assigned = engine._assign_object_ids([make_detection((x + 3, y)) for x, y in reversed(centers)])
+        
+        assert [object_id for object_id, _ in assigned] == list(range(len(centers)))[::-1]
+    
+    def test_stale_tracks_are_dropped(self, engine):
+        """Test that tracks unmatched for longer than centroid_max_age are removed"""
+        engine.centroid_max_age = 2
+        engine._assign_object_ids([make_detection((100, 100))])
+        
+        for _ in range(3):
+            engine._assign_object_ids([])
+        
+        assert engine.object_centroids == {}
+        assert engine._id_strs == {}
+        assert engine._assign_object_ids([make_detection((100, 100))])[0][0] == 1
+        assert engine._id_strs == {1: '1'}
+    
+    def test_kernel_matches_repeated_argmin(self):
+        """Test that the association kernel agrees with greedy argmin over the distance matrix"""
+        rng = np.random.default_rng(0)
+        kernel = getattr(_greedy_associate, 'py_func', _greedy_associate)
+        
+        for _ in range(50):
+            det_xy = rng.integers(0, 40, (6, 2)).astype(np.float32)
+            track_xy = rng.integers(0, 40, (5, 2)).astype(np.float32)
+            det_cls = rng.integers(0, 2, 6).astype(np.int32)
+            track_cls = rng.integers(0, 2, 5).astype(np.int32)
+            
+            dist_sq = ((det_xy[:, None, :] - track_xy[None, :, :]) ** 2).sum(axis=2).astype(np.float64)
+            dist_sq[(dist_sq >= 200) | (det_cls[:, None] != track_cls[None, :])] = np.inf
+            expected = np.full(6, -1)
+            while np.isfinite(dist_sq).any():
+                i, j = divmod(int(dist_sq.argmin()), 5)
+                expected[i] = j
+                dist_sq[i, :] = np.inf
+                dist_sq[:, j] = np.inf
+            
+            for associate in (_greedy_associate, kernel):
+                assert associate(det_xy, det_cls, track_xy, track_cls, 200.0).tolist() == expected.tolist()
+
+
+
+class TestFrameSkipping:
+    """Test inference_interval frame skipping in the tracking loop"""
+    
+    def test_only_every_nth_frame_is_processed(self, engine):
+        """Test that skipped frames are grabbed but never retrieved"""
+        engine.config.inference_interval = 3
+        grabs = iter([True] * 7)
+        latest_flags = []
+        
+        def grab(timeout, latest):
+            try:
+                result = next(grabs)
+            except StopIteration:
+                engine.running = False
+                return False
+            latest_flags.append(latest)
+            return result
+        
+        engine.stream.grab.side_effect = grab
+        engine._submit_frame = Mock()
+        engine.running = True
+        
+        engine._tracking_loop()
+        
+        assert engine.frame_count == 7
+        assert engine.stream.retrieve.call_count == 3
+        assert engine._submit_frame.call_count == 3
+        
+        # Processed frames skip past anything that queued up behind them
+        assert latest_flags == [True, False, False, True, False, False, True]
+    
+    def test_repeated_errors_are_rate_limited(self, engine, monkeypatch):
+        """Test that a failing loop reports once per cooldown with a suppressed count"""
+        clock = iter([0.0, 1.0, 2.0, 6.0])
+        monkeypatch.setattr(engine, '_monotonic', lambda: next(clock))
+        monkeypatch.setattr('src.automation.tracking_engine.time.sleep', lambda _: None)
+        errors = Mock()
+        monkeypatch.setattr('src.automation.tracking_engine.logger.exception', errors)
+        engine.config.inference_interval = 1
+        calls = iter(range(4))
+        
+        def grab(timeout, latest):
+            if next(calls, None) is None:
+                engine.running = False
+                return False
+            return True
+        
+        engine.stream.grab.side_effect = grab
+        engine._submit_frame = Mock(side_effect=RuntimeError("bad frame"))
+        engine.running = True
+        
+        engine._tracking_loop()
+        
+        assert [c.args[2] for c in errors.call_args_list] == [0, 2]
+    
+    def test_error_backoff_grows_and_resets(self, engine, monkeypatch):
+        """Test that consecutive errors back off exponentially until a frame succeeds"""
+        sleeps = []
+        monkeypatch.setattr('src.automation.tracking_engine.time.sleep', sleeps.append)
+        monkeypatch.setattr('src.automation.tracking_engine.logger.exception', Mock())
+        engine.config.inference_interval = 1
+        outcomes = iter([RuntimeError("bad frame")] * 5 + [None, RuntimeError("bad frame")])
+        
+        def submit(frame):
+            outcome = next(outcomes, None)
+            if outcome is not None:
+                raise outcome
+        
+        def grab(timeout, latest):
+            if len(sleeps) == 6:
+                engine.running = False
+                return False
+            return True
+        
+        engine.stream.grab.side_effect = grab
+        engine._submit_frame = submit
+        engine.running = True
+        
+        engine._tracking_loop()
+        
+        assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 0.1])
+
+
+class TestPipeline:
+    """Test hand-off between the capture, detect and act stages"""
+    
+    def test_submit_keeps_only_newest_frames(self, engine):
+        """Test that a full raw queue drops its oldest frame instead of blocking"""
+        frames = [np.full((48, 64, 3), i, dtype=np.uint8) for i in range(6)]
+        
+        for frame in frames:
+            engine._submit_frame(frame)
+        
+        queued = [engine.raw_queue.get_nowait()[0] for _ in range(engine.raw_queue.qsize())]
+        assert [int(frame[0, 0, 0]) for frame in queued] == [2, 3, 4, 5]
+    
+    def test_submit_downsamples_wide_frames(self, engine):
+        """Test that frames wider than 1280px are resized for detection only"""
+        frame = np.zeros((1440, 2560, 3), dtype=np.uint8)
+        
+        engine._submit_frame(frame)
+        
+        queued_frame, detection_frame, _, _, _ = engine.raw_queue.get_nowait()
+        assert queued_frame is frame
+        assert detection_frame.shape[:2] == (720, 1280)
+    
+    def test_batch_reaches_action_stage(self, engine):
+        """Test that a full window is detected in one call and only its last frame may move the camera"""
+        engine.config.detector_batch_size = 2
+        detection = make_detection((100, 100))
+        engine.detector.detect_batch.return_value = [[], [detection]]
+        processed = threading.Event()
+        calls = []
+        
+        def process(frame, detections, control_ptz, capture_time):
+            calls.append((frame, detections, control_ptz))
+            if len(calls) == 2:
+                processed.set()
+        
+        engine._process_detections = process
+        
+        workers = [
+            threading.Thread(target=engine._detection_worker, daemon=True),
+            threading.Thread(target=engine._action_worker, daemon=True)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        frames = [np.zeros((48, 64, 3), dtype=np.uint8) for _ in range(2)]
+        for frame in frames:
+            engine._submit_frame(frame)
+        
+        try:
+            assert processed.wait(timeout=2.0)
+        finally:
+            engine.detection_stop = True
+            for worker in workers:
+                worker.join(timeout=2.0)
+        
+        engine.detector.detect_batch.assert_called_once()
+        assert len(engine.detector.detect_batch.call_args.args[0]) == 2
+        assert calls == [(frames[0], [], False), (frames[1], [detection], True)]
+    
+    def test_partial_batch_flushes_after_max_latency(self, engine):
+        """Test that a window that doesn't fill is still detected after detector_max_latency"""
+        engine.config.detector_batch_size = 4
+        engine.config.detector_max_latency = 0.05
+        engine.detector.detect_batch.return_value = [[]]
+        processed = threading.Event()
+        engine._process_detections = lambda frame, detections, control_ptz, capture_time: processed.set()
+        
+        workers = [
+            threading.Thread(target=engine._detection_worker, daemon=True),
+            threading.Thread(target=engine._action_worker, daemon=True)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        engine._submit_frame(np.zeros((48, 64, 3), dtype=np.uint8))
+        
+        try:
+            assert processed.wait(timeout=2.0)
+        finally:
+            engine.detection_stop = True
+            for worker in workers:
+                worker.join(timeout=2.0)
+        
+        assert len(engine.detector.detect_batch.call_args.args[0]) == 1
+    
+    def test_boxes_are_scaled_back_to_full_frame(self, engine):
+        """Test that detections on a downsampled frame reach tracking in full-frame pixels"""
+        engine.config.detector_batch_size = 1
+        engine.config.detection_max_width = 640
+        engine.detector.detect_batch.return_value = [[make_detection((100, 50))]]
+        received = []
+        processed = threading.Event()
+        
+        def process(frame, detections, control_ptz, capture_time):
+            received.extend(detections)
+            processed.set()
+        
+        engine._process_detections = process
+        
+        workers = [
+            threading.Thread(target=engine._detection_worker, daemon=True),
+            threading.Thread(target=engine._action_worker, daemon=True)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        engine._submit_frame(np.zeros((720, 1280, 3), dtype=np.uint8))
+        
+        try:
+            assert processed.wait(timeout=2.0)
+        finally:
+            engine.detection_stop = True
+            for worker in workers:
+                worker.join(timeout=2.0)
+        
+        assert received[0].center == (200, 100)
+        assert received[0].bbox == (190, 90, 210, 110)
+    
+    def test_only_last_frame_moves_camera(self, engine):
+        """Test that control_ptz=False updates tracks without a PTZ command"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        engine._should_trigger_tracking = Mock(return_value=True)
+        engine._handle_tracking_action = Mock()
+        engine._check_inactivity_and_return_home = Mock()
+        
+        engine._process_detections(frame, [make_detection((100, 100))], control_ptz=False)
+        assert engine.object_centroids == {0: (100, 100)}
+        engine._handle_tracking_action.assert_not_called()
+        
+        engine._process_detections(frame, [make_detection((105, 100))])
+        engine._handle_tracking_action.assert_called_once()
+    
+    def test_batch_velocity_uses_capture_times(self, engine):
+        """Test that a window replayed back to back measures velocity between capture times"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        engine._should_trigger_tracking = Mock(return_value=False)
+        engine._check_inactivity_and_return_home = Mock()
+        tracks = []
+        processed = threading.Event()
+        
+        def on_tracking(track_info):
+            tracks.append(track_info)
+            if len(tracks) == 4:
+                processed.set()
+        
+        engine.on_tracking = on_tracking
+        
+        # 30 fps capture, 10 px per frame to the right: 300 px/s
+        frames = (frame,) * 4
+        results = tuple([make_detection((100 + 10 * i, 100))] for i in range(4))
+        capture_times = tuple(50.0 + i / 30 for i in range(4))
+        engine.detected_queue.put((frames, results, capture_times))
+        
+        worker = threading.Thread(target=engine._action_worker, daemon=True)
+        worker.start()
+        try:
+            assert processed.wait(timeout=2.0)
+        finally:
+            engine.detection_stop = True
+            worker.join(timeout=2.0)
+        
+        vx, vy = tracks[-1].velocity
+        assert vx == pytest.approx(300.0, rel=0.05)
+        assert vy == pytest.approx(0.0, abs=1.0)
+    
+    def test_cooldown_skips_trigger_checks(self, engine):
+        """Test that a frame inside the PTZ cooldown never evaluates the trigger"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        engine._should_trigger_tracking = Mock(return_value=True)
+        engine._handle_tracking_action = Mock()
+        engine._check_inactivity_and_return_home = Mock()
+        engine._monotonic = lambda: 100.0
+        engine.last_ptz_time = 99.99
+        
+        engine._process_detections(frame, [make_detection((100, 100)), make_detection((300, 300))])
+        
+        engine._should_trigger_tracking.assert_not_called()
+    
+    def test_ptz_worker_sends_latest_move(self, engine):
+        """Test that moves posted while the camera is busy collapse into the newest one"""
+        busy = threading.Event()
+        release = threading.Event()
+        sent = []
+        
+        def continuous_move(**move):
+            sent.append(move['pan_velocity'])
+            busy.set()
+            release.wait(timeout=2.0)
+        
+        engine.ptz.continuous_move = continuous_move
+        engine.running = True
+        engine.ptz_thread = threading.Thread(target=engine._ptz_worker, daemon=True)
+        engine.ptz_thread.start()
+        
+        try:
+            engine._send_ptz_move(pan_velocity=0.1)
+            assert busy.wait(timeout=2.0)
+            engine._send_ptz_move(pan_velocity=0.2)
+            engine._send_ptz_move(pan_velocity=0.3)
+            release.set()
+        finally:
+            engine.stop()
+        
+        assert sent == [0.1, 0.3]
+        assert engine.ptz_coalesced_count == 1
+
+class TestMotionGate:
+    """Test the frame-difference gate in front of the detector"""
+    
+    def test_static_frames_are_not_submitted(self, engine):
+        """Test that only the first of several identical frames reaches the detector"""
+        engine.config.motion_gate_pixels = 50
+        frame = np.full((360, 640, 3), 80, dtype=np.uint8)
+        
+        for _ in range(3):
+            engine._submit_frame(frame.copy())
+        
+        assert engine.raw_queue.qsize() == 1
+        assert engine.motion_skip_count == 2
+    
+    def test_moving_subject_is_submitted(self, engine):
+        """Test that a frame with a moved subject passes the gate"""
+        engine.config.motion_gate_pixels = 50
+        frame = np.full((360, 640, 3), 80, dtype=np.uint8)
+        moved = frame.copy()
+        moved[100:200, 200:300] = 255
+        
+        engine._submit_frame(frame)
+        engine._submit_frame(moved)
+        
+        assert engine.raw_queue.qsize() == 2
+        assert engine.motion_skip_count == 0
+    
+    def test_gate_reuses_buffers(self, engine):
+        """Test that the gate writes into its preallocated buffers"""
+        engine.config.motion_gate_pixels = 50
+        buffers = [engine._resize_buf, engine._diff_buf] + engine._gray_ring
+        addresses = [buf.ctypes.data for buf in buffers]
+        
+        for value in (0, 255, 0):
+            engine._submit_frame(np.full((360, 640, 3), value, dtype=np.uint8))
+        
+        assert [buf.ctypes.data for buf in buffers] == addresses
+        assert engine.raw_queue.qsize() == 3
+    
+    def test_live_tracks_bypass_gate(self, engine):
+        """Test that static frames still reach the detector while a track is live"""
+        engine.config.motion_gate_pixels = 50
+        engine._assign_object_ids([make_detection((100, 100))])
+        frame = np.full((360, 640, 3), 80, dtype=np.uint8)
+        
+        for _ in range(3):
+            engine._submit_frame(frame.copy())
+        
+        assert engine.motion_skip_count == 0
+    
+    def test_gate_closes_after_empty_frames(self, engine):
+        """Test that empty detection frames age the last track out and re-enable the gate"""
+        engine.config.motion_gate_pixels = 50
+        engine.centroid_max_age = 2
+        engine._check_inactivity_and_return_home = Mock()
+        frame = np.full((360, 640, 3), 80, dtype=np.uint8)
+        
+        engine._process_detections(frame, [make_detection((100, 100))], control_ptz=False)
+        for _ in range(3):
+            engine._process_detections(frame, [])
+        
+        assert engine.object_centroids == {}
+        for _ in range(3):
+            engine._submit_frame(frame.copy())
+        
+        assert engine.motion_skip_count == 2
+    
+    def test_mog2_gate_skips_static_background(self, engine):
+        """Test that the background-model gate learns a static scene and flags a new object"""
+        engine.config.motion_gate_pixels = 50
+        engine.config.motion_gate_method = 'mog2'
+        frame = np.full((360, 640, 3), 80, dtype=np.uint8)
+        
+        for _ in range(20):
+            engine._has_motion(frame)
+        assert not engine._has_motion(frame)
+        
+        moved = frame.copy()
+        moved[100:200, 200:300] = 255
+        assert engine._has_motion(moved)
+
+
+class TestZoneLookup:
+    """Test vectorized zone lookup"""
+    
+    @pytest.fixture
+    def zoned_engine(self, engine):
+        """Engine with two half-frame zones and a higher-priority overlap"""
+        engine.set_zones([
+            TrackingZone('left', (0.0, 0.5), (0.0, 1.0), 'Preset001', priority=0),
+            TrackingZone('right', (0.5, 1.0), (0.0, 1.0), 'Preset002', priority=0),
+            TrackingZone('door', (0.4, 0.6), (0.0, 0.5), 'Preset003', priority=5)
+        ])
+        return engine
+    
+    def test_positions_map_to_zones(self, zoned_engine):
+        """Test that each position gets its zone, preferring higher priority and earlier zones"""
+        zones = zoned_engine._get_zones_for_positions(
+            [(100, 400), (600, 400), (320, 100), (320, 400)],
+            (480, 640, 3)
+        )
+        
+        assert [zone.name for zone in zones] == ['left', 'right', 'door', 'left']
+    
+    def test_pixel_bounds_match_normalized_ranges(self, engine):
+        """Test that integer pixel bounds agree with the fractional zone edges"""
+        engine.set_zones([TrackingZone('band', (0.3, 0.7), (0.1, 0.9), 'Preset001')])
+        xs = np.arange(0, 641)
+        
+        zones = engine._get_zones_for_positions(np.stack([xs, np.full_like(xs, 240)], axis=1), (480, 640, 3))
+        
+        expected = (xs / 640 >= 0.3) & (xs / 640 <= 0.7)
+        assert [zone is not None for zone in zones] == expected.tolist()
+    
+    def test_outside_all_zones(self, zoned_engine):
+        """Test that positions outside every zone map to None"""
+        assert zoned_engine._get_zone_for_position((700, 100), (480, 640, 3)) is None
+        assert zoned_engine._get_zone_for_position((320, 100), (480, 640, 3)).name == 'door'
+    
+    def test_target_preset_by_direction(self, zoned_engine):
+        """Test that movement anticipates with the outermost zone in that direction"""
+        left, right, door = zoned_engine.config.zones
+        
+        assert zoned_engine._determine_target_preset(Direction.RIGHT_TO_LEFT, right) == 'Preset001'
+        assert zoned_engine._determine_target_preset(Direction.LEFT_TO_RIGHT, left) == 'Preset002'
+        assert zoned_engine._determine_target_preset(Direction.LEFT_TO_RIGHT, right) is None
+        assert zoned_engine._determine_target_preset(Direction.RIGHT_TO_LEFT, left) is None
+        assert zoned_engine._determine_target_preset(Direction.TOP_TO_BOTTOM, door) == 'Preset001'
+        assert zoned_engine._determine_target_preset(Direction.BOTTOM_TO_TOP, door) is None
+        assert zoned_engine._determine_target_preset(Direction.STATIONARY, door) is None
+    
+    def test_set_zones_rebuilds_lookup(self, zoned_engine):
+        """Test that replacing the zones takes effect immediately"""
+        zoned_engine.set_zones([TrackingZone('all', (0.0, 1.0), (0.0, 1.0), 'Preset009')])
+        
+        assert zoned_engine._get_zone_for_position((320, 100), (480, 640, 3)).name == 'all'
+        assert zoned_engine._determine_target_preset(Direction.RIGHT_TO_LEFT, zoned_engine.config.zones[0]) is None
+    
+    def test_no_zones_configured(self, engine):
+        """Test that lookups without zones return None for every position"""
+        assert engine._get_zones_for_positions([(1, 1), (2, 2)], (480, 640, 3)) == [None, None]
+
+
+class TestEventRecording:
+    """Test analytics event bookkeeping"""
+    
+    def test_only_changes_are_recorded(self, engine):
+        """Test that repeated zones/presets on a track are not appended every frame"""
+        for zone, preset in [('a', 'P1'), ('a', 'P1'), ('b', 'P1'), ('b', 'P2'), ('a', 'P2')]:
+            engine._record_tracking_event('7', 'person', Direction.LEFT_TO_RIGHT, zone, preset)
+        
+        event = engine.active_events['7']
+        assert event.frame_count == 5
+        assert event.zone_transitions == ['a', 'b', 'a']
+        assert event.ptz_actions == ['P1', 'P2']
+    
+    def test_completed_history_is_bounded(self):
+        """Test that only the newest completed events are kept"""
+        engine = TrackingEngine(
+            detector=Mock(),
+            motion_tracker=MotionTracker(),
+            ptz_controller=Mock(),
+            stream_handler=Mock(),
+            config=TrackingConfig(completed_event_history=2)
+        )
+        for object_id in ('1', '2', '3'):
+            engine._record_tracking_event(object_id, 'person', Direction.LEFT_TO_RIGHT, 'a', 'P1')
+        
+        engine.running = True
+        engine.stop()
+        
+        assert [e.object_id for e in engine.get_completed_events()] == ['2', '3']
+    
+    def test_event_snapshots_rebuild_only_on_change(self, engine):
+        """Test that repeated polls share one snapshot until an event is added"""
+        engine._record_tracking_event('1', 'person', Direction.LEFT_TO_RIGHT, 'a', 'P1')
+        first = engine.get_active_events()
+        
+        engine._record_tracking_event('1', 'person', Direction.LEFT_TO_RIGHT, 'b', 'P1')
+        assert engine.get_active_events() is first
+        
+        engine._record_tracking_event('2', 'person', Direction.LEFT_TO_RIGHT, 'a', 'P1')
+        assert [e.object_id for e in engine.get_active_events()] == ['1', '2']
+    
+    def test_stale_events_are_closed(self, engine):
+        """Test that the sweep retires events idle for longer than max_tracking_age"""
+        for object_id in ('1', '2'):
+            engine._record_tracking_event(object_id, 'person', Direction.LEFT_TO_RIGHT, 'a', 'P1')
+        engine.active_events['1'].last_update_time -= engine.config.max_tracking_age + 1
+        last_seen = engine.active_events['1'].last_update_time
+        
+        engine._sweep_stale_events(engine.active_events['2'].last_update_time)
+        
+        assert [e.object_id for e in engine.get_active_events()] == ['2']
+        closed = engine.get_completed_events()
+        assert [e.object_id for e in closed] == ['1']
+        assert closed[0].end_time == last_seen
+    
+    def test_tracked_frames_keep_event_open(self, engine):
+        """Test that a subject tracked without PTZ moves keeps its event past max_tracking_age"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        engine._check_inactivity_and_return_home = Mock()
+        engine._record_tracking_event('0', 'person', Direction.LEFT_TO_RIGHT, 'tracking', 'P1', timestamp=100.0)
+        
+        seen = DetectionResult('person', 0.9, (95, 95, 105, 105), (100, 100), 0, 110.0)
+        engine._process_detections(frame, [seen], control_ptz=False)
+        engine._sweep_stale_events(111.0)
+        
+        assert [e.object_id for e in engine.get_active_events()] == ['0']
+        assert engine.active_events['0'].last_update_time == 110.0
+
+
+class TestCenterTracking:
+    """Test center-of-frame pan/tilt commands"""
+    
+    def test_pan_scales_with_offset_squared(self, engine):
+        """Test that pan speed follows the squared normalized offset"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        track_info = Mock(velocity=(0.0, 0.0), object_id='0')
+        
+        engine._handle_tracking_action(make_detection((600, 240)), Direction.LEFT_TO_RIGHT, track_info, frame)
+        
+        kwargs = engine.ptz.continuous_move.call_args.kwargs
+        assert kwargs['pan_velocity'] == pytest.approx((280 / 320) ** 2)
+        assert kwargs['tilt_velocity'] == 0.0
+    
+    def test_dead_zone_skips_ptz_command(self, engine):
+        """Test that subjects near the center send no PTZ command at all"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        track_info = Mock(velocity=(0.0, 0.0), object_id='0')
+        
+        engine._handle_tracking_action(make_detection((330, 250)), Direction.LEFT_TO_RIGHT, track_info, frame)
+        
+        engine.ptz.continuous_move.assert_not_called()
+        assert engine.ptz_movement_count == 0
+    
+    def test_dead_zone_still_zooms_and_records(self, engine):
+        """Test that a centered subject keeps its event and can still drive auto-zoom"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        track_info = Mock(velocity=(0.0, 0.0), object_id='0')
+        
+        engine._handle_tracking_action(make_detection((330, 250)), Direction.LEFT_TO_RIGHT, track_info, frame)
+        assert engine.last_bbox_area == 100
+        assert engine.active_events['0'].frame_count == 1
+        
+        # Same spot, larger box: the subject is approaching, so zoom moves the camera
+        approaching = DetectionResult('person', 0.9, (310, 235, 350, 265), (330, 250), 0, 0.0)
+        engine._handle_tracking_action(approaching, Direction.LEFT_TO_RIGHT, track_info, frame)
+        
+        kwargs = engine.ptz.continuous_move.call_args.kwargs
+        assert (kwargs['pan_velocity'], kwargs['tilt_velocity']) == (0.0, 0.0)
+        assert kwargs['zoom_velocity'] > 0
+        assert engine.active_events['0'].frame_count == 2
+    
+    def test_single_axis_outside_dead_zone_moves(self, engine):
+        """Test that an offset on one axis still moves the camera"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        track_info = Mock(velocity=(0.0, 0.0), object_id='0')
+        
+        engine._handle_tracking_action(make_detection((330, 400)), Direction.LEFT_TO_RIGHT, track_info, frame)
+        
+        kwargs = engine.ptz.continuous_move.call_args.kwargs
+        assert kwargs['pan_velocity'] == 0.0
+        assert kwargs['tilt_velocity'] != 0.0
+    
+    def test_repeated_move_is_suppressed(self, engine):
+        """Test that a near-identical move right after the last one is not sent"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        track_info = Mock(velocity=(0.0, 0.0), object_id='0')
+        
+        engine._handle_tracking_action(make_detection((600, 240)), Direction.LEFT_TO_RIGHT, track_info, frame, 10.0)
+        engine._handle_tracking_action(make_detection((601, 240)), Direction.LEFT_TO_RIGHT, track_info, frame, 10.05)
+        assert engine.ptz.continuous_move.call_count == 1
+        assert engine.ptz_suppressed_count == 1
+        assert engine.active_events['0'].frame_count == 2
+        
+        # Resent once the interval has passed
+        engine._handle_tracking_action(make_detection((601, 240)), Direction.LEFT_TO_RIGHT, track_info, frame, 10.2)
+        assert engine.ptz.continuous_move.call_count == 2
+    
+    def test_tilt_sign_and_cap(self, engine):
+        """Test that tilt is negated for the camera and capped at 0.75"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        track_info = Mock(velocity=(0.0, 0.0), object_id='0')
+        
+        engine._handle_tracking_action(make_detection((320, 420)), Direction.LEFT_TO_RIGHT, track_info, frame)
+        assert engine.ptz.continuous_move.call_args.kwargs['tilt_velocity'] == pytest.approx((180 / 240) ** 2)
+        
+        engine._handle_tracking_action(make_detection((320, 0)), Direction.LEFT_TO_RIGHT, track_info, frame)
+        assert engine.ptz.continuous_move.call_args.kwargs['tilt_velocity'] == -0.75
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])